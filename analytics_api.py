@@ -0,0 +1,272 @@
+"""
+분석 결과 JSON API
+대시보드와 별도로 실행하는 경량 HTTP 서버 - 다른 내부 도구가 멤버사별 인당 평균, 변화율, 변화군 인원을 조회
+
+- 공유 저장소(modules/analytics_store.py)의 최신 게시본만 응답 (요청 시 분석 재계산 없음, Streamlit/pandas 미사용)
+- 게시: python report_cli.py <디렉토리> --publish 또는 대시보드 관리자 게시 버튼
+  (파일 로드 후 자동 게시는 analytics_api.publish_after_upload 를 켠 경우만)
+- ETag / Last-Modified 응답, If-None-Match / If-Modified-Since 조건부 요청은 304 (본문 없음)
+- 직렬화된 응답을 메모리에 캐시하고 게시본이 바뀌면 비움 (reload_seconds 주기로 게시본 수정 시각만 확인)
+
+엔드포인트:
+    GET /health                  상태, 데이터셋 버전, 게시 시각, 요청 통계
+    GET /companies               전체 + 멤버사별 요약 (인당 평균, 변화율, 변화군 인원)
+    GET /companies/<멤버사명>     멤버사 상세 (개인/조직/직책/변화군 통계 포함, '전체' 는 그룹 전체)
+
+실행:
+    python analytics_api.py                     # config.yaml 의 analytics_api 설정
+    python analytics_api.py --port 8766 --verbose
+"""
+
+import sys
+import json
+import time
+import hashlib
+import argparse
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import unquote
+
+from modules.analytics_store import (
+    load_analytics_config, load_published_analytics, get_published_mtime
+)
+
+# /companies 목록에 포함하는 요약 항목 (상세 통계 표는 멤버사별 응답에만)
+HEADLINE_FIELDS = ['company', 'learners', 'average_hours', 'current_hours', 'change_rate', 'change_groups']
+
+def _isoformat(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat(timespec='seconds')
+
+def build_payload(snapshot, path):
+    """
+    게시본 → 경로별 응답 본문
+
+    Returns:
+        응답 딕셔너리 (없는 경로/멤버사면 None)
+    """
+    meta = {
+        'dataset_version': snapshot['dataset_version'],
+        'published_at': _isoformat(snapshot['published_at'])
+    }
+    companies = snapshot['companies']
+    if path == '/companies':
+        return {
+            **meta,
+            'companies': [{field: summary.get(field) for field in HEADLINE_FIELDS} for summary in companies.values()]
+        }
+    if path.startswith('/companies/'):
+        summary = companies.get(path[len('/companies/'):])
+        return {**meta, **summary} if summary is not None else None
+    return None
+
+class AnalyticsResponseCache:
+    """최신 게시본 + 경로별 직렬화 응답 캐시 (게시본 파일 수정 시각이 바뀌면 다시 읽고 응답 캐시 비움)"""
+
+    def __init__(self, reload_seconds=5, max_items=256):
+        self.reload_seconds = float(reload_seconds)
+        self.max_items = int(max_items)
+        self.stats = {'requests': 0, 'not_modified': 0, 'cache_hits': 0, 'cache_misses': 0, 'reloads': 0}
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self._mtime = None
+        self._checked_at = None
+        self._responses = OrderedDict()
+
+    def count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def get_stats(self):
+        with self._lock:
+            return dict(self.stats)
+
+    def get_snapshot(self):
+        """최신 게시본 (reload_seconds 가 지났을 때만 수정 시각 확인, 없으면 None)"""
+        with self._lock:
+            now = time.monotonic()
+            if self._checked_at is None or now - self._checked_at >= self.reload_seconds:
+                self._checked_at = now
+                mtime = get_published_mtime()
+                if mtime != self._mtime:
+                    self._snapshot = load_published_analytics() if mtime is not None else None
+                    self._mtime = mtime if self._snapshot is not None else None
+                    self._responses.clear()
+                    self.stats['reloads'] += 1
+            return self._snapshot
+
+    def get_response(self, path):
+        """
+        경로별 응답 (캐시 우선)
+
+        Returns:
+            (본문 bytes, ETag, 게시 시각 epoch 초) - 게시본이 없으면 None, 없는 경로면 (None, None, None)
+        """
+        snapshot = self.get_snapshot()
+        if snapshot is None:
+            return None
+        with self._lock:
+            cached = self._responses.get(path)
+            if cached is not None:
+                self._responses.move_to_end(path)
+                self.stats['cache_hits'] += 1
+                return cached
+
+        payload = build_payload(snapshot, path)
+        if payload is None:
+            return None, None, None
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        etag = f'"{snapshot["dataset_version"]}-{hashlib.sha256(body).hexdigest()[:16]}"'
+        response = (body, etag, snapshot['published_at'])
+        with self._lock:
+            self.stats['cache_misses'] += 1
+            # 대기 중 게시본이 바뀌었으면 이전 게시본 응답은 저장하지 않음
+            if snapshot is self._snapshot:
+                self._responses[path] = response
+                while len(self._responses) > self.max_items:
+                    self._responses.popitem(last=False)
+        return response
+
+class AnalyticsHandler(BaseHTTPRequestHandler):
+    """분석 API 요청 처리 (응답 캐시는 server.cache, 설정은 server.settings)"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send_json(self, status, payload, headers=None, send_body=True):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self._send_body(status, body, headers or {'Cache-Control': 'no-store'}, send_body)
+
+    def _send_body(self, status, body, headers, send_body=True):
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def _is_not_modified(self, etag, published_at):
+        """조건부 요청 판단 (If-None-Match 가 있으면 If-Modified-Since 는 무시 - RFC 9110)"""
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match is not None:
+            tags = [tag.strip() for tag in if_none_match.split(',')]
+            return '*' in tags or etag in tags or f"W/{etag}" in tags
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=timezone.utc)
+            # Last-Modified 는 초 단위이므로 게시 시각도 초 단위로 비교
+            return int(published_at) <= since.timestamp()
+        return False
+
+    def _handle(self, send_body):
+        cache = self.server.cache
+        cache.count('requests')
+        path = unquote(self.path.split('?', 1)[0]).rstrip('/') or '/'
+        if path == '/':
+            path = '/health'
+
+        if path == '/health':
+            snapshot = cache.get_snapshot()
+            self._send_json(200, {
+                'status': 'ok' if snapshot is not None else 'no_data',
+                'dataset_version': snapshot['dataset_version'] if snapshot else None,
+                'published_at': _isoformat(snapshot['published_at']) if snapshot else None,
+                'source': snapshot.get('source') if snapshot else None,
+                'published_by': snapshot.get('published_by') if snapshot else None,
+                'companies': len(snapshot['companies']) if snapshot else 0,
+                'stats': cache.get_stats()
+            }, send_body=send_body)
+            return
+
+        if path != '/companies' and not path.startswith('/companies/'):
+            self._send_json(404, {'error': f"알 수 없는 경로: {path}"}, send_body=send_body)
+            return
+        response = cache.get_response(path)
+        if response is None:
+            self._send_json(503, {
+                'error': "게시된 분석 결과가 없습니다. 대시보드에서 파일을 로드하거나 report_cli.py --publish 를 실행하세요."
+            }, send_body=send_body)
+            return
+        body, etag, published_at = response
+        if body is None:
+            self._send_json(404, {'error': f"멤버사를 찾을 수 없습니다: {path[len('/companies/'):]}"}, send_body=send_body)
+            return
+
+        headers = {
+            'ETag': etag,
+            'Last-Modified': formatdate(published_at, usegmt=True),
+            'Cache-Control': f"max-age={int(self.server.settings['max_age_seconds'])}"
+        }
+        if self._is_not_modified(etag, published_at):
+            cache.count('not_modified')
+            self.send_response(304)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            return
+        self._send_body(200, body, headers, send_body)
+
+    def do_GET(self):
+        self._handle(send_body=True)
+
+    def do_HEAD(self):
+        self._handle(send_body=False)
+
+def create_analytics_server(settings=None, verbose=False):
+    """분석 API 서버 생성 (serve_forever 는 호출하지 않음)"""
+    settings = {**load_analytics_config(), **(settings or {})}
+    server = ThreadingHTTPServer((settings['host'], int(settings['port'])), AnalyticsHandler)
+    server.daemon_threads = True
+    server.settings = settings
+    server.cache = AnalyticsResponseCache(settings['reload_seconds'], settings['response_cache_items'])
+    server.verbose = verbose
+    return server
+
+def start_analytics_server(settings=None):
+    """백그라운드 스레드로 분석 API 서버 시작 → (server, base_url)"""
+    server = create_analytics_server(settings)
+    threading.Thread(target=server.serve_forever, name='analytics-api', daemon=True).start()
+    host, port = server.server_address[:2]
+    return server, f"http://{host}:{port}"
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="분석 결과 JSON API (공유 저장소의 최신 게시본 제공)")
+    parser.add_argument('--host', help="바인드 주소")
+    parser.add_argument('--port', type=int, help="포트")
+    parser.add_argument('--max-age-seconds', type=int, help="응답 Cache-Control max-age (초)")
+    parser.add_argument('--reload-seconds', type=float, help="게시본 변경 확인 주기 (초)")
+    parser.add_argument('--verbose', action='store_true', help="요청 로그 출력")
+    args = parser.parse_args(argv)
+
+    overrides = {name: value for name, value in vars(args).items() if value is not None and name != 'verbose'}
+    server = create_analytics_server(overrides, verbose=args.verbose)
+    host, port = server.server_address[:2]
+    snapshot = server.cache.get_snapshot()
+    print(f"분석 API 실행 중: http://{host}:{port}", flush=True)
+    if snapshot is None:
+        print("게시된 분석 결과가 없습니다 (게시되면 자동으로 읽음).", flush=True)
+    else:
+        print(f"게시본: 버전 {snapshot['dataset_version']}, 멤버사 {len(snapshot['companies'])}개", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == '__main__':
+    # Windows 인코딩 문제 해결
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(encoding='utf-8')
+    sys.exit(main())
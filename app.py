@@ -14,8 +14,20 @@ from modules.file_uploader import render_file_upload_section, save_to_session
 from modules.data_loader import *
 from modules.charts import *
 from modules.eda_analyzer import *
-from modules.change_group_analyzer import classify_change_groups, get_change_group_statistics
-from modules.gemini_insights import get_gemini_client, generate_chart_insight, generate_eda_insight
+from modules.change_group_analyzer import classify_change_groups, get_change_group_statistics, get_person_change_data
+from modules.transition_analyzer import get_tier_transitions
+from modules.cohort_analyzer import get_cohort_tables, select_company_tables
+from modules.analysis_results import (
+    get_analysis_results, get_analysis_table, get_company_options, get_upload_summary, MATRIX_BASE_YEAR, MATRIX_TARGET_YEAR
+)
+from modules.gemini_insights import (
+    get_gemini_client, generate_chart_insight, generate_eda_insight, generate_eda_insight_job, get_eda_stats_text,
+    generate_all_insights_job, stream_eda_insight, load_insight_config, get_rule_insight, get_prompt_draft
+)
+from modules.prompt_compactor import format_prompt_metrics
+from modules.job_queue import submit_session_job, render_job_status, render_jobs_panel, STATUS_DONE
+from modules.insight_metrics import is_metrics_admin, render_metrics_page, get_current_username
+from modules.analytics_store import load_published_analytics, publish_analytics_job
 
 # 공통 필터 헬퍼: 멤버사 선택 적용
 def apply_company_filter(df):
@@ -29,6 +41,571 @@ def apply_company_filter(df):
     except Exception:
         return df
 
+# EDA AI 인사이트 버튼: 스트리밍 설정 시 생성되는 대로 화면에 출력, 아니면 백그라운드 작업으로 실행
+def render_rule_insight(analysis_type, data_version, company):
+    """규칙 기반 요약 (AI 결과가 없거나 생성 중/실패 시 표시)"""
+    rule_text = get_rule_insight(analysis_type, data_version, company)
+    if rule_text:
+        st.markdown("#### 📋 자동 요약")
+        st.markdown(rule_text)
+        st.caption("통계에서 바로 계산한 규칙 기반 요약입니다. AI 분석 버튼으로 상세 해석을 생성할 수 있습니다.")
+
+def render_eda_insight_button(analysis_type, key, data_version, company):
+    if st.button(f"🤖 {analysis_type} 특징 분석 (AI)", key=key):
+        stats_text, prompt_metrics = get_eda_stats_text(analysis_type, data_version, company, return_metrics=True)
+        draft = get_prompt_draft(analysis_type, data_version, company)
+        if load_insight_config().get('streaming', True):
+            st.session_state.pop(f'{key}_job', None)
+            st.markdown("#### 💡 AI 분석 인사이트")
+            try:
+                st.session_state[f'{key}_text'] = st.write_stream(
+                    stream_eda_insight(get_gemini_client(), analysis_type, stats_text, draft)
+                )
+                st.caption(format_prompt_metrics(prompt_metrics))
+            except Exception as e:
+                st.session_state.pop(f'{key}_text', None)
+                st.warning(f"{analysis_type} AI 분석 실패: {str(e)}")
+                if load_insight_config().get('rule_fallback', True):
+                    render_rule_insight(analysis_type, data_version, company)
+            return
+        st.session_state.pop(f'{key}_text', None)
+        st.session_state[f'{key}_job'] = submit_session_job(
+            'insight', generate_eda_insight_job, analysis_type, stats_text,
+            prompt_metrics=prompt_metrics, draft=draft,
+            fallback_text=get_rule_insight(analysis_type, data_version, company),
+            label=f"{analysis_type} AI 분석"
+        )
+    if st.session_state.get(f'{key}_text'):
+        st.markdown("#### 💡 AI 분석 인사이트")
+        st.write(st.session_state[f'{key}_text'])
+        return
+    if st.session_state.get(f'{key}_job'):
+        job = render_job_status(st.session_state[f'{key}_job'], key_prefix=key)
+        if job is not None and job['status'] == STATUS_DONE:
+            return
+    # AI 결과 전(생성 중, 실패 포함)에는 규칙 기반 요약을 바로 표시 (API 키가 없거나 응답이 느려도 즉시 확인)
+    if load_insight_config().get('rule_fallback', True):
+        render_rule_insight(analysis_type, data_version, company)
+
+# 대시보드 탭: 탭별 fragment 로 분리 (탭 안의 버튼/위젯 조작 시 해당 탭만 다시 실행)
+# 인자(data_version, selected_company)는 전체 재실행 시점 값 - 멤버사 적용/업로드는 전체 재실행
+@st.fragment
+def render_overview_tab(data_version, selected_company):
+    """개요 탭 (전체 학습 현황 요약)"""
+    st.header("전체 학습 현황 요약")
+    
+    annual_df = get_annual_learning_data()
+    individual_df = get_individual_data()
+    
+    if annual_df is not None:
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            if '학습시간' in annual_df.columns:
+                total_time = annual_df['학습시간'].sum()
+                st.metric("총 학습시간", f"{total_time:,.0f}시간")
+        
+        with col2:
+            if '멤버사명' in annual_df.columns:
+                num_companies = annual_df['멤버사명'].nunique()
+                st.metric("멤버사 수", f"{num_companies}개")
+        
+        with col3:
+            if individual_df is not None and '학습시간' in individual_df.columns:
+                avg_time = individual_df['학습시간'].mean()
+                st.metric("평균 학습시간", f"{avg_time:.1f}시간")
+        
+        with col4:
+            if individual_df is not None:
+                num_learners = len(individual_df)
+                st.metric("학습자 수", f"{num_learners:,}명")
+    
+    # 최근 3개년 추이는 개요에서 제거됨
+
+@st.fragment
+def render_learning_time_tab(data_version, selected_company):
+    """학습시간 현황 탭"""
+    st.header("학습시간 현황 분석")
+    
+    annual_df = get_annual_learning_data()
+    
+    if annual_df is not None:
+        annual_df = preprocess_annual_data(annual_df)
+        
+        # 최근 3개년 인당 평균 학습시간 (세로 막대)
+        st.subheader("최근 3개년 인당 평균 학습시간")
+        individual_full = apply_company_filter(get_individual_full_raw_data())
+        if individual_full is None:
+            individual_full = apply_company_filter(get_individual_data())
+        avg_year = None
+        if individual_full is not None and '연도' in individual_full.columns and '학습시간' in individual_full.columns:
+            if selected_company and '멤버사명' in individual_full.columns:
+                individual_full = individual_full[individual_full['멤버사명'] == selected_company]
+            avg_year = (
+                individual_full.groupby('연도')['학습시간']
+                .mean()
+                .reset_index()
+                .sort_values('연도')
+            )
+            import plotly.express as px
+            fig_bar = get_cached_figure(
+                px.bar, avg_year.tail(3), x='연도', y='학습시간', title='최근 3개년 인당 평균 학습시간', labels={'학습시간':'시간'},
+                dataset_version=data_version,
+                company=selected_company,
+                cache_name='annual_avg_bar'
+            )
+            st.plotly_chart(fig_bar, use_container_width=True)
+        
+        st.subheader("멤버사별 인당 평균 학습시간")
+        company_avg = get_analysis_table(data_version, 'company_averages')  # 전체 멤버사 유지 요구사항
+        if company_avg is not None:
+            st.dataframe(company_avg, use_container_width=True)
+
+@st.fragment
+def render_matrix_tab(data_version, selected_company):
+    """Matrix 분석 탭"""
+    st.header("그룹/각 사별 인당 평균 학습시간 Matrix (X: 전년 대비 변화, Y: 인당 평균 학습시간)")
+    
+    annual_df = get_annual_learning_data()
+    
+    if annual_df is not None:
+        import plotly.express as px
+        # 개인 전체 raw가 있으면 2024/2025 기준 회사별 인당 평균 및 변화율 (없으면 최신 연도 평균, 변화는 0)
+        scatter_df = get_analysis_table(data_version, 'matrix')
+        base_year = MATRIX_BASE_YEAR
+        target_year = MATRIX_TARGET_YEAR
+
+        def build_matrix_scatter(scatter_df, base_year, target_year):
+            fig = px.scatter(scatter_df, x='변화(%)', y='올해(시간)', text='멤버사명',
+                             labels={'올해(시간)':'인당 평균(시간)'},
+                             title=f"{target_year} 인당 평균 vs {base_year} 대비 변화")
+            fig.update_traces(textposition='top center')
+            return fig
+        
+        fig = None
+        if scatter_df is not None and not scatter_df.empty:
+            fig = get_cached_figure(build_matrix_scatter, scatter_df, base_year, target_year, dataset_version=data_version, cache_name='matrix_scatter')
+        if fig:
+            st.plotly_chart(fig, use_container_width=True)
+
+@st.fragment
+def render_popular_content_tab(data_version, selected_company):
+    """인기 콘텐츠 탭"""
+    st.header("구성원 관심 콘텐츠")
+    
+    popular_df = get_popular_cards_data()
+    search_df = get_search_keywords_data()
+    
+    if popular_df is not None:
+        st.subheader("인기 학습카드 Top 10")
+        fig = get_cached_figure(create_popular_cards_chart, popular_df, top_n=10, dataset_version=data_version)
+        if fig:
+            st.plotly_chart(fig, use_container_width=True)
+    
+    if search_df is not None:
+        st.subheader("인기 검색어 (연도별)")
+        if '연도' in search_df.columns and '검색어' in search_df.columns and '검색횟수' in search_df.columns:
+            for year in [2025, 2024]:
+                year_df = search_df[search_df['연도'] == year]
+                if not year_df.empty:
+                    st.markdown(f"#### {year}년")
+                    st.dataframe(year_df.nlargest(20, '검색횟수')[['검색어','검색횟수']], use_container_width=True)
+
+@st.fragment
+def render_organization_tab(data_version, selected_company):
+    """조직별 분석 탭"""
+    st.header("조직별 학습 특징 분석")
+    
+    individual_df = apply_company_filter(get_individual_data())
+    
+    if individual_df is not None:
+        individual_df = preprocess_individual_data(individual_df)
+        if selected_company and '멤버사명' in individual_df.columns:
+            individual_df = individual_df[individual_df['멤버사명'] == selected_company]
+        
+        st.subheader("조직별 평균 학습시간")
+        fig = get_cached_figure(create_org_learning_chart, individual_df, dataset_version=data_version, company=selected_company)
+        if fig:
+            st.plotly_chart(fig, use_container_width=True)
+        
+        st.subheader("조직별 통계 분석")
+        org_stats = get_analysis_table(data_version, 'org_stats', selected_company)
+        if org_stats is not None:
+            st.dataframe(org_stats, use_container_width=True)
+
+@st.fragment
+def render_position_tab(data_version, selected_company):
+    """직책별 분석 탭"""
+    st.header("직책별 학습 특징 분석")
+    
+    individual_df = apply_company_filter(get_individual_data())
+    
+    if individual_df is not None:
+        individual_df = preprocess_individual_data(individual_df)
+        if selected_company and '멤버사명' in individual_df.columns:
+            individual_df = individual_df[individual_df['멤버사명'] == selected_company]
+        
+        st.subheader("직책별 평균 학습시간")
+        fig = get_cached_figure(create_position_learning_chart, individual_df, dataset_version=data_version, company=selected_company)
+        if fig:
+            st.plotly_chart(fig, use_container_width=True)
+        
+        st.subheader("직책별 통계 분석")
+        position_stats = get_analysis_table(data_version, 'position_stats', selected_company)
+        if position_stats is not None:
+            st.dataframe(position_stats, use_container_width=True)
+            
+            # Gemini 인사이트 (스트리밍 또는 백그라운드 작업)
+            render_eda_insight_button('직책별', "position_insight", data_version, selected_company)
+
+@st.fragment
+def render_individual_tab(data_version, selected_company):
+    """개인별 분석 탭"""
+    st.header("개인별 학습 특징 분석")
+    
+    individual_df = apply_company_filter(get_individual_data())
+    
+    if individual_df is not None:
+        individual_df = preprocess_individual_data(individual_df)
+        if selected_company and '멤버사명' in individual_df.columns:
+            individual_df = individual_df[individual_df['멤버사명'] == selected_company]
+        
+        st.subheader("개인별 학습시간 분포")
+        fig = get_cached_figure(create_individual_distribution_chart, individual_df, dataset_version=data_version, company=selected_company)
+        if fig:
+            st.plotly_chart(fig, use_container_width=True)
+        
+        st.subheader("통계 분석")
+        # 개인별 통계는 분석 결과 캐시 사용 (탭 재실행 시 재계산 없음)
+        stats = get_analysis_table(data_version, 'individual_stats', selected_company) or {}
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("#### 전체 통계")
+            for key, value in stats.items():
+                if isinstance(value, (int, float)) and '수' not in key and '평균' not in key and '중위' not in key:
+                    st.metric(key, f"{value:.2f}")
+                elif isinstance(value, (int, float)):
+                    st.metric(key, f"{value:,.0f}")
+        
+        with col2:
+            st.markdown("#### 저학습자/고학습자 구분")
+            st.metric("저학습자 수", f"{stats.get('저학습자수', 0):,}명")
+            st.metric("고학습자 수", f"{stats.get('고학습자수', 0):,}명")
+            if stats.get('저학습자평균'):
+                st.metric("저학습자 평균", f"{stats['저학습자평균']:.1f}시간")
+            if stats.get('고학습자평균'):
+                st.metric("고학습자 평균", f"{stats['고학습자평균']:.1f}시간")
+        
+        # Gemini 인사이트 (스트리밍 또는 백그라운드 작업)
+        render_eda_insight_button('개인별', "individual_insight", data_version, selected_company)
+
+@st.fragment
+def render_change_group_tab(data_version, selected_company):
+    """변화군 분석 탭 (변화군 통계 + 구간 이동)"""
+    st.header("학습시간 변화군 분석")
+    
+    # 22-25년도 데이터가 필요
+    individual_full_df = apply_company_filter(get_individual_full_raw_data())
+    
+    if individual_full_df is None:
+        individual_df = get_individual_data()
+        st.info("22-25년도 학습시간 데이터가 필요합니다. 개인별 학습 전체 raw data를 업로드하거나, 개인별 학습시간 데이터에 연도 컬럼이 포함되어야 합니다.")
+    else:
+        if selected_company and '멤버사명' in individual_full_df.columns:
+            individual_full_df = individual_full_df[individual_full_df['멤버사명'] == selected_company]
+        analysis_results = get_analysis_results(
+            data_version, selected_company,
+            tables=('change_groups', 'change_group_summary', 'change_group_stats', 'person_changes')
+        )
+        change_groups = analysis_results['change_groups']
+        
+        if change_groups:
+            st.subheader("변화군별 인원 수")
+            
+            st.dataframe(analysis_results['change_group_summary'], use_container_width=True)
+            
+            # 변화군별 통계
+            stats_df = analysis_results['change_group_stats']
+            if stats_df is not None and not stats_df.empty:
+                st.subheader("변화군별 통계")
+                st.dataframe(stats_df, use_container_width=True)
+                
+                # 차트
+                fig = get_cached_figure(create_change_group_chart, individual_full_df, change_groups, dataset_version=data_version, company=selected_company)
+                if fig:
+                    st.plotly_chart(fig, use_container_width=True)
+            
+            # 개인별 산점도 (WebGL, 대규모 인원은 샘플 + 밀도 표시)
+            st.subheader("개인별 학습시간 변화 (24년 vs 25년)")
+            fig = get_cached_figure(
+                create_learner_scatter_chart,
+                analysis_results['person_changes'],
+                dataset_version=data_version,
+                company=selected_company
+            )
+            if fig:
+                st.plotly_chart(fig, use_container_width=True)
+            
+            # Gemini 인사이트 (스트리밍 또는 백그라운드 작업)
+            render_eda_insight_button('변화군별', "change_group_insight", data_version, selected_company)
+        
+        # 연도 간 학습시간 구간 이동 (전체 데이터 기준 분위 → 멤버사별 행렬 선택)
+        st.markdown("---")
+        st.subheader("연도 간 학습시간 구간 이동 (Transition Matrix)")
+        transitions = get_tier_transitions(get_individual_full_raw_data(), get_dataset_version())
+        
+        if transitions:
+            scope = transitions['overall']
+            if selected_company:
+                scope = transitions['by_company'].get(selected_company, {})
+            st.caption("그룹 전체 기준 학습시간 5분위 구간으로 구분한 뒤, 기준 연도 구간별로 비교 연도 구간에 속한 인원 비율을 표시합니다.")
+            
+            view_type = st.radio("표시 방식", ["히트맵", "Sankey"], horizontal=True, key="transition_view")
+            if view_type == "히트맵":
+                year_pairs = list(scope.keys())
+                if year_pairs:
+                    default_pair = year_pairs.index((2024, 2025)) if (2024, 2025) in year_pairs else len(year_pairs) - 1
+                    pair = st.selectbox(
+                        "비교 연도",
+                        year_pairs,
+                        index=default_pair,
+                        format_func=lambda p: f"{p[0]}년 → {p[1]}년",
+                        key="transition_pair"
+                    )
+                    fig = get_cached_figure(create_transition_heatmap, scope[pair], pair[0], pair[1], dataset_version=data_version, company=selected_company)
+                    if fig:
+                        st.plotly_chart(fig, use_container_width=True)
+                    with st.expander("이동 인원 상세"):
+                        st.dataframe(scope[pair], use_container_width=True)
+            else:
+                fig = get_cached_figure(create_transition_sankey, scope, transitions['years'], transitions['labels'], dataset_version=data_version, company=selected_company)
+                if fig:
+                    st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("구간 이동 분석에는 2개 연도 이상의 개인별 학습 전체 raw 데이터가 필요합니다.")
+
+@st.fragment
+def render_cohort_tab(data_version, selected_company):
+    """코호트 분석 탭"""
+    st.header("최초 학습 연도 코호트 분석")
+    
+    individual_full_df = get_individual_full_raw_data()
+    
+    if individual_full_df is None:
+        st.info("코호트 분석에는 개인별 학습 전체 raw data(연도 포함)가 필요합니다.")
+    else:
+        cohort_tables = select_company_tables(
+            get_cohort_tables(individual_full_df, get_dataset_version()),
+            selected_company
+        )
+        
+        if cohort_tables:
+            threshold = cohort_tables['active_threshold']
+            st.caption(f"최초로 학습 이력이 있는 연도를 코호트로 정의하고, 이후 각 연도에 {threshold:g}시간 이상 학습한 인원 비율을 지속률로 표시합니다.")
+            
+            st.subheader("코호트별 학습 지속률")
+            fig = get_cached_figure(create_cohort_retention_chart, cohort_tables['retention_rate'], threshold, dataset_version=data_version, company=selected_company)
+            if fig:
+                st.plotly_chart(fig, use_container_width=True)
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                st.markdown("#### 코호트별 지속 인원 (명)")
+                retention_view = cohort_tables['retention_count'].copy()
+                retention_view.insert(0, '코호트 인원', cohort_tables['cohort_size'])
+                st.dataframe(retention_view, use_container_width=True)
+            with col2:
+                st.markdown("#### 코호트별 인당 평균 학습시간 (시간)")
+                st.dataframe(cohort_tables['mean_hours'], use_container_width=True)
+        else:
+            st.info("선택한 범위에 코호트 분석 가능한 데이터가 없습니다.")
+
+@st.fragment
+def render_area_status_tab(data_version, selected_company):
+    """주요 영역별 탭"""
+    st.header("주요 영역별 학습 현황")
+    
+    area_df = get_area_status_data()
+    
+    if area_df is not None:
+        fig = get_cached_figure(create_area_status_chart, area_df, dataset_version=data_version)
+        if fig:
+            st.plotly_chart(fig, use_container_width=True)
+        
+        st.subheader("영역별 상세 현황")
+        st.dataframe(area_df, use_container_width=True)
+
+TAB_RENDERERS = {
+    "🏠 개요": render_overview_tab,
+    "📈 학습시간 현황": render_learning_time_tab,
+    "📊 Matrix 분석": render_matrix_tab,
+    "🔥 인기 콘텐츠": render_popular_content_tab,
+    "🏢 조직별 분석": render_organization_tab,
+    "👔 직책별 분석": render_position_tab,
+    "👤 개인별 분석": render_individual_tab,
+    "📉 변화군 분석": render_change_group_tab,
+    "👥 코호트 분석": render_cohort_tab,
+    "🎯 주요 영역별": render_area_status_tab
+}
+
+# 사이드바 패널: 패널별 fragment (패널 안 위젯 조작 시 해당 패널만 다시 실행, 화면 이동/멤버사 적용은 st.rerun() 으로 전체 재실행)
+# fragment 안에서는 st.sidebar 를 직접 쓸 수 없으므로 `with st.sidebar:` 안에서 호출
+@st.fragment
+def render_upload_summary_panel(data_version, selected_company):
+    """업로드 결과 (파일 수, 총 학습시간, 학습자 수 - 데이터셋 버전 + 멤버사별 캐시)"""
+    with st.expander("📊 업로드 결과", expanded=False):
+        if data_version:
+            st.success("✓ 데이터 로드 완료")
+            summary = get_upload_summary(data_version, selected_company)
+            st.metric("업로드된 파일 수", f"{summary['file_count']}개")
+            if summary['total_time'] is not None:
+                st.metric("총 학습시간", f"{summary['total_time']:,.0f}시간")
+            if summary['num_learners'] is not None:
+                st.metric("학습자 수", f"{summary['num_learners']:,}명")
+        else:
+            st.info("데이터를 업로드하세요")
+            st.caption("파일 업로드 섹션에서 데이터를 업로드하고 '파일 데이터 로드' 버튼을 클릭하세요")
+
+@st.fragment
+def render_company_filter_panel(data_version):
+    """멤버사 선택 (선택 변경은 이 패널만, 적용/초기화는 전체 재실행)"""
+    with st.expander("📋 멤버사 선택", expanded=False):
+        company_list = get_company_options(data_version) if data_version else []
+        selected_company = st.session_state.get('selected_company', None)
+        if company_list:
+            temp_selection = st.selectbox(
+                "멤버사 선택",
+                ["전체"] + company_list,
+                index=(0 if not selected_company else (["전체"] + company_list).index(selected_company) if selected_company in company_list else 0)
+            )
+            col_a, col_b = st.columns([1,1])
+            with col_a:
+                if st.button("적용", use_container_width=True, key="apply_company_filter"):
+                    if temp_selection == "전체":
+                        st.session_state['selected_company'] = None
+                    else:
+                        st.session_state['selected_company'] = temp_selection
+                    st.rerun()
+            with col_b:
+                if st.button("초기화", use_container_width=True, key="reset_company_filter"):
+                    st.session_state['selected_company'] = None
+                    st.rerun()
+            # 현재 적용 상태 표시
+            current = st.session_state.get('selected_company', None)
+            st.caption(f"현재 적용: {'전체' if not current else current}")
+
+@st.fragment
+def render_report_view_panel(data_version):
+    """리포트 조회 (조회 버튼은 전체 재실행으로 리포트 화면 이동)"""
+    with st.expander("📈 리포트 조회", expanded=False):
+        st.caption("업로드된 데이터를 기반으로 리포트를 조회합니다")
+        
+        if data_version:
+            if st.button("📊 리포트 조회하기", use_container_width=True, type="primary", key="report_view_btn"):
+                st.session_state['current_page'] = 'report'
+                st.session_state['show_upload'] = False  # 업로드 화면 끄기
+                st.rerun()
+        else:
+            st.info("데이터를 먼저 업로드하세요")
+            st.caption("파일 업로드를 통해 데이터를 업로드한 후 리포트를 조회할 수 있습니다")
+
+@st.fragment
+def render_report_download_panel(data_version):
+    """리포트 다운로드 (PDF/Excel 작업 등록 - 옵션 변경 시 이 패널만 다시 실행)"""
+    company_list = get_company_options(data_version) if data_version else []
+    with st.expander("📄 리포트 다운로드", expanded=False):
+        st.caption("PDF 리포트와 Excel 분석표를 생성하고 다운로드합니다")
+        
+        if data_version:
+            # PDF 리포트 다운로드 선택
+            pdf_option = st.selectbox(
+                "PDF 리포트 다운로드",
+                ["선택하세요", "전체 리포트 다운로드", "멤버사별 리포트 다운로드"],
+                key="pdf_option"
+            )
+            
+            if pdf_option != "선택하세요":
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    if pdf_option == "멤버사별 리포트 다운로드" and company_list:
+                        company_name = st.selectbox("멤버사명", company_list, key="pdf_company")
+                    else:
+                        company_name = st.text_input("멤버사명", value="전체", key="pdf_company_all", disabled=True)
+                
+                with col2:
+                    period = st.selectbox(
+                        "분석 기간",
+                        ["2025년 상반기", "2025년 하반기", "2024년 상반기", "2024년 하반기"],
+                        key="pdf_period"
+                    )
+                
+                include_insights = st.checkbox("AI 인사이트 포함", value=True, key="pdf_insights")
+                
+                # 리포트 전체 섹션 AI 인사이트 동시 생성 (완료 후 PDF 에 자동 포함)
+                if include_insights:
+                    if st.button("🤖 전체 AI 인사이트 생성", use_container_width=True, key="all_insights_btn"):
+                        st.session_state['all_insights_job_id'] = submit_session_job(
+                            'insight', generate_all_insights_job, None if company_name == "전체" else company_name,
+                            label=f"전체 AI 인사이트 ({company_name})"
+                        )
+                    if st.session_state.get('all_insights_job_id'):
+                        render_job_status(st.session_state['all_insights_job_id'], key_prefix='all_insights')
+                
+                # 차트 삽입 형식 (벡터 형식은 파일 크기가 작고 확대해도 선명함)
+                from modules.report_config import CHART_FORMATS, load_report_config
+                chart_format_labels = {'png': "이미지 (PNG)", 'native': "벡터 (기본 차트)", 'svg': "벡터 (SVG 변환)"}
+                default_chart_format = load_report_config().get('chart_format', 'png')
+                chart_format = st.selectbox(
+                    "차트 형식",
+                    CHART_FORMATS,
+                    index=CHART_FORMATS.index(default_chart_format) if default_chart_format in CHART_FORMATS else 0,
+                    format_func=lambda fmt: chart_format_labels.get(fmt, fmt),
+                    key="pdf_chart_format"
+                )
+                
+                # PDF 생성은 백그라운드 작업으로 실행 (탭 이동 시에도 유지, 완료 후 다운로드)
+                if st.button("📥 PDF 리포트 다운로드", type="primary", use_container_width=True, key="pdf_generate_btn"):
+                    from modules.pdf_generator import build_pdf_report_job
+                    
+                    st.session_state['pdf_job_id'] = submit_session_job(
+                        'pdf', build_pdf_report_job, company_name, period,
+                        include_insights=include_insights, chart_format=chart_format,
+                        label=f"PDF 리포트 ({company_name}, {period})"
+                    )
+                if st.session_state.get('pdf_job_id'):
+                    render_job_status(st.session_state['pdf_job_id'], key_prefix='pdf')
+                
+                # 전체 멤버사 일괄 생성 (병렬 생성 후 ZIP 다운로드)
+                if pdf_option == "멤버사별 리포트 다운로드" and company_list:
+                    if st.button("📦 전체 멤버사 일괄 생성 (ZIP)", use_container_width=True, key="pdf_batch_btn"):
+                        from modules.pdf_generator import build_company_reports_zip_job
+                        
+                        st.session_state['pdf_batch_job_id'] = submit_session_job(
+                            'pdf', build_company_reports_zip_job, company_list, period,
+                            include_insights=include_insights, chart_format=chart_format,
+                            label=f"멤버사 {len(company_list)}개 리포트 ZIP ({period})"
+                        )
+                    if st.session_state.get('pdf_batch_job_id'):
+                        render_job_status(st.session_state['pdf_batch_job_id'], key_prefix='pdf_batch')
+            
+            # Excel 분석표 (조직/직책/변화군 통계, 멤버사 평균, Matrix 데이터 - 멤버사 선택 기준)
+            st.markdown("---")
+            excel_company = st.session_state.get('selected_company', None)
+            if st.button("📊 Excel 분석표 다운로드", use_container_width=True, key="excel_export_btn"):
+                from modules.excel_exporter import build_excel_report_job
+                
+                st.session_state['excel_job_id'] = submit_session_job(
+                    'excel', build_excel_report_job, excel_company,
+                    label=f"Excel 분석표 ({excel_company or '전체'})"
+                )
+            if st.session_state.get('excel_job_id'):
+                render_job_status(st.session_state['excel_job_id'], key_prefix='excel')
+        else:
+            st.warning("먼저 데이터를 업로드하세요")
+
 # 페이지 설정
 st.set_page_config(
     page_title="mySUNI Learning Report",
@@ -66,142 +643,49 @@ if st.sidebar.button("🏠 HOME", use_container_width=True, type="primary", key=
 # 파일 업로드 버튼 (HOME 아래)
 render_file_upload_section()
 
-# 업로드 결과 섹션 (리포트 결과 → 업로드 결과로 이름 변경, 멤버사 선택보다 위로)
-# 멤버사 선택값 세션에서 복원
+# 업로드 결과 / 멤버사 선택 / 리포트 조회 / 리포트 다운로드 (패널별 fragment, 입력은 데이터셋 버전 기준 캐시)
+data_version = get_dataset_version()
 selected_company = st.session_state.get('selected_company', None)
-with st.sidebar.expander("📊 업로드 결과", expanded=False):
-    has_data = 'uploaded_data' in st.session_state and st.session_state.uploaded_data
-    
-    if has_data:
-        st.success("✓ 데이터 로드 완료")
-        
-        # 업로드된 파일 목록 표시
-        uploaded_count = len([k for k in st.session_state.uploaded_data.keys() if not k.endswith('_info')])
-        st.metric("업로드된 파일 수", f"{uploaded_count}개")
-        
-        # 데이터 요약
-        from modules.data_loader import get_annual_learning_data, get_individual_data
-        annual_df = apply_company_filter(get_annual_learning_data())
-        individual_df = apply_company_filter(get_individual_data())
-        
-        if annual_df is not None:
-            if '학습시간' in annual_df.columns:
-                total_time = annual_df['학습시간'].sum()
-                st.metric("총 학습시간", f"{total_time:,.0f}시간")
-        
-        if individual_df is not None:
-            num_learners = len(individual_df)
-            st.metric("학습자 수", f"{num_learners:,}명")
-    else:
-        st.info("데이터를 업로드하세요")
-        st.caption("파일 업로드 섹션에서 데이터를 업로드하고 '파일 데이터 로드' 버튼을 클릭하세요")
-
-# 멤버사 선택 (업로드 결과 아래로 이동)
-with st.sidebar.expander("📋 멤버사 선택", expanded=False):
-    company_list = get_company_list()
-    selected_company = st.session_state.get('selected_company', None)
-    if company_list:
-        temp_selection = st.selectbox(
-            "멤버사 선택",
-            ["전체"] + company_list,
-            index=(0 if not selected_company else (["전체"] + company_list).index(selected_company) if selected_company in company_list else 0)
-        )
-        col_a, col_b = st.columns([1,1])
-        with col_a:
-            if st.button("적용", use_container_width=True, key="apply_company_filter"):
-                if temp_selection == "전체":
-                    st.session_state['selected_company'] = None
-                else:
-                    st.session_state['selected_company'] = temp_selection
-                st.rerun()
-        with col_b:
-            if st.button("초기화", use_container_width=True, key="reset_company_filter"):
-                st.session_state['selected_company'] = None
-                st.rerun()
-        # 현재 적용 상태 표시
-        current = st.session_state.get('selected_company', None)
-        st.caption(f"현재 적용: {'전체' if not current else current}")
-
-# 리포트 조회 섹션 (새로 추가)
-with st.sidebar.expander("📈 리포트 조회", expanded=False):
-    st.caption("업로드된 데이터를 기반으로 리포트를 조회합니다")
-    
-    has_data_for_report = 'uploaded_data' in st.session_state and st.session_state.uploaded_data
-    
-    if has_data_for_report:
-        if st.button("📊 리포트 조회하기", use_container_width=True, type="primary", key="report_view_btn"):
-            st.session_state['current_page'] = 'report'
-            st.session_state['show_upload'] = False  # 업로드 화면 끄기
+with st.sidebar:
+    render_upload_summary_panel(data_version, selected_company)
+    render_company_filter_panel(data_version)
+    render_report_view_panel(data_version)
+    render_report_download_panel(data_version)
+
+# 작업 현황 (PDF 생성, AI 분석, 파일 로드 등 백그라운드 작업)
+with st.sidebar.expander("⏱️ 작업 현황", expanded=False):
+    render_jobs_panel()
+
+# AI 인사이트 사용 현황 (관리자만)
+if is_metrics_admin():
+    with st.sidebar.expander("📊 AI 사용 현황", expanded=False):
+        st.caption("AI 인사이트 호출 수, 토큰, 지연 시간, 캐시 적중률을 확인합니다.")
+        if st.button("사용 현황 보기", use_container_width=True, key="ai_metrics_btn"):
+            st.session_state['current_page'] = 'ai_metrics'
+            st.session_state['show_upload'] = False
             st.rerun()
-    else:
-        st.info("데이터를 먼저 업로드하세요")
-        st.caption("파일 업로드를 통해 데이터를 업로드한 후 리포트를 조회할 수 있습니다")
 
-# 리포트 다운로드 섹션 (PDF 생성 → 리포트 다운로드로 변경)
-with st.sidebar.expander("📄 리포트 다운로드", expanded=False):
-    st.caption("PDF 리포트를 생성하고 다운로드합니다")
-    
-    has_data_for_pdf = 'uploaded_data' in st.session_state and st.session_state.uploaded_data
-    
-    if has_data_for_pdf:
-        # PDF 리포트 다운로드 선택
-        pdf_option = st.selectbox(
-            "PDF 리포트 다운로드",
-            ["선택하세요", "전체 리포트 다운로드", "멤버사별 리포트 다운로드"],
-            key="pdf_option"
-        )
-        
-        if pdf_option != "선택하세요":
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                company_name = st.text_input("멤버사명", value="전체", key="pdf_company")
-            
-            with col2:
-                period = st.selectbox(
-                    "분석 기간",
-                    ["2025년 상반기", "2025년 하반기", "2024년 상반기", "2024년 하반기"],
-                    key="pdf_period"
-                )
-            
-            include_insights = st.checkbox("AI 인사이트 포함", value=True, key="pdf_insights")
-            
-            if st.button("📥 PDF 리포트 다운로드", type="primary", use_container_width=True, key="pdf_generate_btn"):
-                from modules.pdf_generator import collect_report_data, create_pdf_report
-                
-                try:
-                    with st.spinner("PDF 리포트 생성 중..."):
-                        # 리포트 데이터 수집
-                        report_data = collect_report_data()
-                        report_data['company_name'] = company_name
-                        report_data['period'] = period
-                        
-                        # 인사이트 포함 여부
-                        if not include_insights and 'insights' in report_data:
-                            report_data['insights'] = {}
-                        
-                        # PDF 생성
-                        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                        filename = f"Learning_Report_{company_name}_{timestamp}.pdf"
-                        output_path = create_pdf_report(report_data, filename)
-                        
-                        # 파일 읽기
-                        with open(output_path, "rb") as pdf_file:
-                            pdf_bytes = pdf_file.read()
-                        
-                        # 다운로드 버튼
-                        st.success("PDF 생성 완료!")
-                        st.download_button(
-                            label="📥 PDF 다운로드",
-                            data=pdf_bytes,
-                            file_name=filename,
-                            mime="application/pdf",
-                            use_container_width=True
-                        )
-                except Exception as e:
-                    st.error(f"PDF 생성 중 오류: {str(e)}")
-    else:
-        st.warning("먼저 데이터를 업로드하세요")
+# 분석 API 게시 (관리자만 - 다른 내부 도구가 조회하는 공유 게시본을 교체하므로 명시적으로 실행)
+if is_metrics_admin():
+    with st.sidebar.expander("🌐 분석 API 게시", expanded=False):
+        published = load_published_analytics()
+        if published:
+            published_at = datetime.fromtimestamp(published['published_at']).strftime('%Y-%m-%d %H:%M')
+            st.caption(
+                f"현재 게시본: {published.get('dataset_version')} ({published_at}, "
+                f"{published.get('published_by') or published.get('source')})"
+            )
+        else:
+            st.caption("게시된 분석 요약이 없습니다.")
+        if not st.session_state.get('uploaded_data'):
+            st.caption("데이터를 로드한 후 게시할 수 있습니다.")
+        elif st.button("현재 데이터 게시", use_container_width=True, key="analytics_publish_btn"):
+            st.session_state['analytics_publish_job_id'] = submit_session_job(
+                'analytics', publish_analytics_job, source='admin', published_by=get_current_username(),
+                label="분석 요약 게시"
+            )
+        if st.session_state.get('analytics_publish_job_id'):
+            render_job_status(st.session_state['analytics_publish_job_id'], key_prefix='analytics_publish')
 
 # 샘플 데이터 생성 버튼 (이름 변경: 샘플 데이터 로드 → 샘플 데이터 생성)
 with st.sidebar.expander("🧪 샘플 데이터", expanded=False):
@@ -282,6 +766,8 @@ with st.sidebar.expander("🧪 샘플 데이터", expanded=False):
                     
                     # 결과 메시지
                     if loaded_count > 0:
+                        # 데이터셋 버전 갱신 (분석 캐시 무효화 기준)
+                        st.session_state['data_version'] = compute_dataset_version(st.session_state.uploaded_data)
                         # 샘플 데이터 생성 완료 후 자동으로 리포트 화면으로 이동
                         st.success("✅ 샘플 데이터가 생성되었습니다. 샘플 리포트를 확인하세요.")
                         st.session_state['current_page'] = 'report'  # 리포트 페이지로 이동
@@ -304,6 +790,11 @@ if show_upload:
     render_file_upload_main()
     st.stop()
 
+# AI 사용 현황 페이지 (관리자)
+if current_page == 'ai_metrics':
+    render_metrics_page()
+    st.stop()
+
 # 리포트 조회 페이지 처리 (파일 업로드 이후, HOME보다 먼저)
 if current_page == 'report':
     # 리포트 조회 페이지에서는 탭 메뉴와 리포트 화면 표시
@@ -407,13 +898,14 @@ tabs = [
     "🏢 조직별 분석",
     "👔 직책별 분석",
     "👤 개인별 분석",
-    "📉 변화군 분석"
+    "📉 변화군 분석",
+    "👥 코호트 분석"
 ]
 
 selected_tab = option_menu(
     menu_title=None,
     options=tabs,
-    icons=['house', 'graph-up', 'grid', 'fire', 'building', 'briefcase', 'person', 'arrow-down-up'],
+    icons=['house', 'graph-up', 'grid', 'fire', 'building', 'briefcase', 'person', 'arrow-down-up', 'people'],
     menu_icon="cast",
     default_index=0,
     orientation="horizontal"
@@ -438,372 +930,8 @@ if not has_data:
     4. **리포트 다운로드**: 사이드바의 "📄 리포트 다운로드" 메뉴에서 최종 리포트를 PDF로 다운로드할 수 있습니다
     """)
 else:
-    # 개요 탭
-    if selected_tab == "🏠 개요":
-        st.header("전체 학습 현황 요약")
-        
-        annual_df = get_annual_learning_data()
-        individual_df = get_individual_data()
-        
-        if annual_df is not None:
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                if '학습시간' in annual_df.columns:
-                    total_time = annual_df['학습시간'].sum()
-                    st.metric("총 학습시간", f"{total_time:,.0f}시간")
-            
-            with col2:
-                if '멤버사명' in annual_df.columns:
-                    num_companies = annual_df['멤버사명'].nunique()
-                    st.metric("멤버사 수", f"{num_companies}개")
-            
-            with col3:
-                if individual_df is not None and '학습시간' in individual_df.columns:
-                    avg_time = individual_df['학습시간'].mean()
-                    st.metric("평균 학습시간", f"{avg_time:.1f}시간")
-            
-            with col4:
-                if individual_df is not None:
-                    num_learners = len(individual_df)
-                    st.metric("학습자 수", f"{num_learners:,}명")
-        
-        # 최근 3개년 추이는 개요에서 제거됨
-
-    # 학습시간 현황 탭
-    elif selected_tab == "📈 학습시간 현황":
-        st.header("학습시간 현황 분석")
-        
-        annual_df = get_annual_learning_data()
-        
-        if annual_df is not None:
-            annual_df = preprocess_annual_data(annual_df)
-            
-            # 최근 3개년 인당 평균 학습시간 (세로 막대)
-            st.subheader("최근 3개년 인당 평균 학습시간")
-            individual_full = apply_company_filter(get_individual_full_raw_data())
-            if individual_full is None:
-                individual_full = apply_company_filter(get_individual_data())
-            avg_year = None
-            if individual_full is not None and '연도' in individual_full.columns and '학습시간' in individual_full.columns:
-                if selected_company and '멤버사명' in individual_full.columns:
-                    individual_full = individual_full[individual_full['멤버사명'] == selected_company]
-                avg_year = (
-                    individual_full.groupby('연도')['학습시간']
-                    .mean()
-                    .reset_index()
-                    .sort_values('연도')
-                )
-                import plotly.express as px
-                fig_bar = px.bar(avg_year.tail(3), x='연도', y='학습시간', title='최근 3개년 인당 평균 학습시간', labels={'학습시간':'시간'})
-                st.plotly_chart(fig_bar, use_container_width=True)
-            
-            st.subheader("멤버사별 인당 평균 학습시간")
-            individual_df2 = get_individual_data()  # 전체 멤버사 유지 요구사항
-            if individual_df2 is not None:
-                individual_df2 = preprocess_individual_data(individual_df2)
-                if '멤버사명' in individual_df2.columns and '학습시간' in individual_df2.columns:
-                    company_avg = (
-                        individual_df2.groupby('멤버사명')['학습시간']
-                        .mean()
-                        .sort_values(ascending=False)
-                    )
-                    st.dataframe(company_avg.reset_index().rename(columns={'학습시간':'인당 평균(시간)'}), use_container_width=True)
-
-    # Matrix 분석 탭
-    elif selected_tab == "📊 Matrix 분석":
-        st.header("그룹/각 사별 인당 평균 학습시간 Matrix (X: 전년 대비 변화, Y: 인당 평균 학습시간)")
-        
-        annual_df = get_annual_learning_data()
-        
-        if annual_df is not None:
-            import pandas as pd
-            import plotly.express as px
-            # 개인 전체 raw가 있으면 2024/2025 기준으로 회사별 인당 평균 및 변화율 계산
-            indiv_full = get_individual_full_raw_data()
-            scatter_df = None
-            base_year = 2024
-            target_year = 2025
-            if indiv_full is not None and all(c in indiv_full.columns for c in ['멤버사명','연도','학습시간']):
-                df_f = indiv_full.copy()
-                df_f = df_f[df_f['연도'].isin([base_year, target_year])]
-                avg_by = df_f.groupby(['멤버사명','연도'])['학습시간'].mean().reset_index()
-                pivot = avg_by.pivot(index='멤버사명', columns='연도', values='학습시간').reset_index()
-                if base_year in pivot.columns and target_year in pivot.columns:
-                    pivot['변화(%)'] = ((pivot[target_year] - pivot[base_year]) / (pivot[base_year].replace(0, pd.NA)) * 100).fillna(0)
-                    scatter_df = pivot.rename(columns={target_year:'올해(시간)'})[['멤버사명','변화(%)','올해(시간)']]
-            # 폴백: 개인 raw만 있는 경우 최신 연도 평균으로 Y만 표시, 변화는 0
-            if scatter_df is None:
-                indiv = get_individual_data()
-                if indiv is not None and '멤버사명' in indiv.columns and '학습시간' in indiv.columns:
-                    indiv_proc = preprocess_individual_data(indiv)
-                    latest_avg = indiv_proc.groupby('멤버사명')['학습시간'].mean().reset_index().rename(columns={'학습시간':'올해(시간)'})
-                    latest_avg['변화(%)'] = 0
-                    scatter_df = latest_avg[['멤버사명','변화(%)','올해(시간)']]
-
-            fig = None
-            if scatter_df is not None and not scatter_df.empty:
-                fig = px.scatter(scatter_df, x='변화(%)', y='올해(시간)', text='멤버사명',
-                                 labels={'올해(시간)':'인당 평균(시간)'},
-                                 title=f"{target_year} 인당 평균 vs {base_year} 대비 변화")
-                fig.update_traces(textposition='top center')
-            if fig:
-                st.plotly_chart(fig, use_container_width=True)
-
-    # 인기 콘텐츠 탭
-    elif selected_tab == "🔥 인기 콘텐츠":
-        st.header("구성원 관심 콘텐츠")
-        
-        popular_df = get_popular_cards_data()
-        search_df = get_search_keywords_data()
-        
-        if popular_df is not None:
-            st.subheader("인기 학습카드 Top 10")
-            fig = create_popular_cards_chart(popular_df, top_n=10)
-            if fig:
-                st.plotly_chart(fig, use_container_width=True)
-        
-        if search_df is not None:
-            st.subheader("인기 검색어 (연도별)")
-            if '연도' in search_df.columns and '검색어' in search_df.columns and '검색횟수' in search_df.columns:
-                for year in [2025, 2024]:
-                    year_df = search_df[search_df['연도'] == year]
-                    if not year_df.empty:
-                        st.markdown(f"#### {year}년")
-                        st.dataframe(year_df.nlargest(20, '검색횟수')[['검색어','검색횟수']], use_container_width=True)
-
-    # 조직별 분석 탭
-    elif selected_tab == "🏢 조직별 분석":
-        st.header("조직별 학습 특징 분석")
-        
-        individual_df = apply_company_filter(get_individual_data())
-        
-        if individual_df is not None:
-            individual_df = preprocess_individual_data(individual_df)
-            if selected_company and '멤버사명' in individual_df.columns:
-                individual_df = individual_df[individual_df['멤버사명'] == selected_company]
-            
-            st.subheader("조직별 평균 학습시간")
-            fig = create_org_learning_chart(individual_df)
-            if fig:
-                st.plotly_chart(fig, use_container_width=True)
-            
-            st.subheader("조직별 통계 분석")
-            org_stats = analyze_organization_characteristics(individual_df)
-            if org_stats is not None:
-                st.dataframe(org_stats, use_container_width=True)
-
-    # 직책별 분석 탭
-    elif selected_tab == "👔 직책별 분석":
-        st.header("직책별 학습 특징 분석")
-        
-        individual_df = apply_company_filter(get_individual_data())
-        
-        if individual_df is not None:
-            individual_df = preprocess_individual_data(individual_df)
-            if selected_company and '멤버사명' in individual_df.columns:
-                individual_df = individual_df[individual_df['멤버사명'] == selected_company]
-            
-            st.subheader("직책별 평균 학습시간")
-            fig = create_position_learning_chart(individual_df)
-            if fig:
-                st.plotly_chart(fig, use_container_width=True)
-            
-            st.subheader("직책별 통계 분석")
-            position_stats = analyze_position_characteristics(individual_df)
-            if position_stats is not None:
-                st.dataframe(position_stats, use_container_width=True)
-                
-                # Gemini 인사이트
-                if st.button("🤖 직책별 특징 분석 (AI)", key="position_insight"):
-                    client = get_gemini_client()
-                    if client:
-                        from modules.eda_analyzer import get_enhanced_eda_summary
-                        stats_text = get_enhanced_eda_summary(position_stats, '직책별')
-                        insight = generate_eda_insight(client, '직책별', stats_text)
-                        if insight:
-                            st.markdown("#### 💡 AI 분석 인사이트")
-                            st.write(insight)
-                    else:
-                        st.error("Gemini API 키가 설정되지 않았습니다.")
-
-    # 개인별 분석 탭
-    elif selected_tab == "👤 개인별 분석":
-        st.header("개인별 학습 특징 분석")
-        
-        individual_df = apply_company_filter(get_individual_data())
-        
-        if individual_df is not None:
-            individual_df = preprocess_individual_data(individual_df)
-            if selected_company and '멤버사명' in individual_df.columns:
-                individual_df = individual_df[individual_df['멤버사명'] == selected_company]
-            
-            st.subheader("개인별 학습시간 분포")
-            fig = create_individual_distribution_chart(individual_df)
-            if fig:
-                st.plotly_chart(fig, use_container_width=True)
-            
-            st.subheader("통계 분석")
-            stats, low_learners, high_learners = analyze_individual_characteristics(individual_df)
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown("#### 전체 통계")
-                for key, value in stats.items():
-                    if isinstance(value, (int, float)) and '수' not in key and '평균' not in key and '중위' not in key:
-                        st.metric(key, f"{value:.2f}")
-                    elif isinstance(value, (int, float)):
-                        st.metric(key, f"{value:,.0f}")
-            
-            with col2:
-                st.markdown("#### 저학습자/고학습자 구분")
-                st.metric("저학습자 수", f"{stats.get('저학습자수', 0):,}명")
-                st.metric("고학습자 수", f"{stats.get('고학습자수', 0):,}명")
-                if stats.get('저학습자평균'):
-                    st.metric("저학습자 평균", f"{stats['저학습자평균']:.1f}시간")
-                if stats.get('고학습자평균'):
-                    st.metric("고학습자 평균", f"{stats['고학습자평균']:.1f}시간")
-            
-            # Gemini 인사이트
-            if st.button("🤖 개인별 특징 분석 (AI)", key="individual_insight"):
-                client = get_gemini_client()
-                if client:
-                    stats_text = "\n".join([f"{k}: {v}" for k, v in stats.items()])
-                    insight = generate_eda_insight(client, '개인별', stats_text)
-                    if insight:
-                        st.markdown("#### 💡 AI 분석 인사이트")
-                        st.write(insight)
-                else:
-                    st.error("Gemini API 키가 설정되지 않았습니다.")
-
-    # 변화군 분석 탭
-    elif selected_tab == "📉 변화군 분석":
-        st.header("학습시간 변화군 분석")
-        
-        # 22-25년도 데이터가 필요
-        individual_full_df = apply_company_filter(get_individual_full_raw_data())
-        
-        if individual_full_df is None:
-            individual_df = get_individual_data()
-            st.info("22-25년도 학습시간 데이터가 필요합니다. 개인별 학습 전체 raw data를 업로드하거나, 개인별 학습시간 데이터에 연도 컬럼이 포함되어야 합니다.")
-        else:
-            if selected_company and '멤버사명' in individual_full_df.columns:
-                individual_full_df = individual_full_df[individual_full_df['멤버사명'] == selected_company]
-            change_groups = classify_change_groups(individual_full_df)
-            
-            if change_groups:
-                st.subheader("변화군별 인원 수")
-                
-                group_summary = pd.DataFrame([
-                    {'변화군': group, '인원수': len(members)}
-                    for group, members in change_groups.items() if members
-                ])
-                
-                st.dataframe(group_summary, use_container_width=True)
-                
-                # 변화군별 통계
-                stats_df = get_change_group_statistics(individual_full_df, change_groups)
-                if stats_df is not None and not stats_df.empty:
-                    st.subheader("변화군별 통계")
-                    st.dataframe(stats_df, use_container_width=True)
-                    
-                    # 차트
-                    fig = create_change_group_chart(individual_full_df, change_groups)
-                    if fig:
-                        st.plotly_chart(fig, use_container_width=True)
-                
-                # Gemini 인사이트
-                if st.button("🤖 변화군별 특징 분석 (AI)", key="change_group_insight"):
-                    client = get_gemini_client()
-                    if client:
-                        stats_text = stats_df.to_string() if stats_df is not None else ""
-                        insight = generate_eda_insight(client, '변화군별', stats_text)
-                        if insight:
-                            st.markdown("#### 💡 AI 분석 인사이트")
-                            st.write(insight)
-                    else:
-                        st.error("Gemini API 키가 설정되지 않았습니다.")
-
-    # 주요 영역별 탭
-    elif selected_tab == "🎯 주요 영역별":
-        st.header("주요 영역별 학습 현황")
-        
-        area_df = get_area_status_data()
-        
-        if area_df is not None:
-            fig = create_area_status_chart(area_df)
-            if fig:
-                st.plotly_chart(fig, use_container_width=True)
-            
-            st.subheader("영역별 상세 현황")
-            st.dataframe(area_df, use_container_width=True)
-
-        # 리포트 다운로드 탭 제거 (사이드바로 이동)
-        # 해당 탭은 사이드바의 "리포트 다운로드" 섹션으로 이동됨
-        if False:  # 더 이상 사용하지 않음
-            pass
-        elif selected_tab == "📄 리포트 다운로드_DEPRECATED":
-            st.header("PDF 리포트 생성 및 다운로드")
-            
-            from modules.pdf_generator import collect_report_data, create_pdf_report
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                company_name = st.text_input("멤버사명", value="전체")
-                period = st.selectbox("분석 기간", ["2025년 상반기", "2025년 하반기", "2024년 상반기", "2024년 하반기"])
-            
-            with col2:
-                include_insights = st.checkbox("AI 인사이트 포함", value=True)
-                include_all_charts = st.checkbox("모든 차트 포함", value=True)
-            
-            if st.button("📄 PDF 리포트 생성", type="primary"):
-                if not has_data:
-                    st.error("먼저 데이터를 업로드하고 로드해주세요.")
-                else:
-                    try:
-                        with st.spinner("PDF 리포트 생성 중..."):
-                            # 리포트 데이터 수집
-                            report_data = collect_report_data()
-                            report_data['company_name'] = company_name
-                            report_data['period'] = period
-                            
-                            # 인사이트 포함 여부
-                            if not include_insights and 'insights' in report_data:
-                                report_data['insights'] = {}
-                            
-                            # PDF 생성
-                            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                            filename = f"Learning_Report_{company_name}_{timestamp}.pdf"
-                            output_path = create_pdf_report(report_data, filename)
-                            
-                            # 파일 읽기
-                            with open(output_path, "rb") as pdf_file:
-                                pdf_bytes = pdf_file.read()
-                            
-                            # 다운로드 버튼
-                            st.success("PDF 리포트가 생성되었습니다!")
-                            st.download_button(
-                                label="📥 PDF 다운로드",
-                                data=pdf_bytes,
-                                file_name=filename,
-                                mime="application/pdf"
-                            )
-                    except Exception as e:
-                        st.error(f"PDF 생성 중 오류 발생: {str(e)}")
-                        st.exception(e)
-            
-            st.markdown("---")
-            st.markdown("""
-            ### PDF 리포트 포함 내용:
-            - 전체 학습 현황 요약
-            - 학습시간 현황 및 추이
-            - Matrix 분석
-            - 인기 콘텐츠
-            - 조직별/직책별/개인별 분석
-            - 변화군 분석
-            - 주요 영역별 학습 현황
-            - AI 생성 인사이트 (선택)
-            """)
-
+    # 차트 Figure 캐시 키 (데이터셋 버전 + 멤버사 필터)
+    data_version = get_dataset_version()
+    
+    # 선택 탭만 렌더링 (탭 fragment)
+    TAB_RENDERERS[selected_tab](data_version, selected_company)
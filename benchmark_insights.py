@@ -0,0 +1,278 @@
+"""
+AI 인사이트 파이프라인 벤치마크
+로컬 대체 서버(gemini_stub_server.py)로 API 키/네트워크 없이 지연 시간과 처리량 측정
+
+- 순차 vs 동시 생성 (insights.max_concurrency)
+- 캐시 미스 vs 캐시 적중
+- 같은 요청 병합 (동시 요청 수 대비 실제 서버 요청 수)
+- 스트리밍 첫 청크 도착 시간
+- 오류 주입 시 재시도/백오프 (성공률, 서버 요청 수)
+- 속도 제한 (gemini.requests_per_minute / burst 를 넘는 요청 - 이 시나리오에서만 속도 제한 적용)
+
+실행:
+    python benchmark_insights.py                              # 대체 서버를 내장 실행
+    python benchmark_insights.py --base-url http://127.0.0.1:8765   # 이미 실행 중인 서버 사용
+    python benchmark_insights.py --requests 20 --concurrency 8 --error-rate 0.2
+"""
+
+import sys
+import os
+import time
+import json
+import asyncio
+import argparse
+import tempfile
+import threading
+import urllib.request
+
+def percentile(values, ratio):
+    """백분위수 (선형 보간)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * ratio
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+def summarize(name, latencies, failures, elapsed):
+    """시나리오 결과 (지연 시간 백분위수, 처리량)"""
+    return {
+        'scenario': name,
+        'requests': len(latencies) + failures,
+        'failures': failures,
+        'p50_ms': round(percentile(latencies, 0.5) * 1000, 1),
+        'p95_ms': round(percentile(latencies, 0.95) * 1000, 1),
+        'total_s': round(elapsed, 2),
+        'throughput_rps': round((len(latencies) + failures) / elapsed, 2) if elapsed > 0 else 0.0
+    }
+
+def build_requests(count, tag):
+    """서로 다른 벤치마크 요청 (시스템 지시문, 프롬프트, 생성 설정)"""
+    from modules.gemini_insights import EDA_GENERATION_CONFIG
+    return {
+        f"bench_{tag}_{index}": (
+            "당신은 기업 교육 데이터 분석 전문가입니다.",
+            f"[벤치마크 {tag} #{index}] 조직별 평균 학습시간 통계를 분석하여 핵심 인사이트를 작성해주세요.\n"
+            + "\n".join(f"조직{row}: 평균학습시간 {10 + (row * 7 + index) % 30:.1f}" for row in range(20)),
+            EDA_GENERATION_CONFIG
+        )
+        for index in range(count)
+    }
+
+def get_server_stats(base_url):
+    with urllib.request.urlopen(base_url, timeout=5) as response:
+        return json.loads(response.read().decode('utf-8'))['stats']
+
+def run_sequential(client, requests):
+    from modules.gemini_insights import generate_insight_text
+    latencies, failures = [], 0
+    started = time.perf_counter()
+    for system_instruction, prompt, generation_config in requests.values():
+        begin = time.perf_counter()
+        try:
+            generate_insight_text(client, system_instruction, prompt, generation_config)
+            latencies.append(time.perf_counter() - begin)
+        except Exception:
+            failures += 1
+    return latencies, failures, time.perf_counter() - started
+
+def run_concurrent(client, requests, concurrency):
+    from modules.gemini_insights import _generate_insight_text_async
+    from modules.gemini_pool import loop_client
+    latencies, failures = [], 0
+
+    async def run_all():
+        nonlocal failures
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(batch_client, request):
+            nonlocal failures
+            begin = time.perf_counter()
+            try:
+                await _generate_insight_text_async(batch_client, semaphore, *request)
+                latencies.append(time.perf_counter() - begin)
+            except Exception:
+                failures += 1
+
+        # 시나리오마다 asyncio.run 으로 새 이벤트 루프 → 루프 전용 클라이언트 사용
+        async with loop_client(client) as batch_client:
+            await asyncio.gather(*(run(batch_client, request) for request in requests.values()))
+
+    started = time.perf_counter()
+    asyncio.run(run_all())
+    return latencies, failures, time.perf_counter() - started
+
+def run_coalesced(client, request, callers):
+    """같은 요청을 여러 스레드에서 동시에 호출"""
+    from modules.gemini_insights import generate_insight_text
+    latencies, errors = [], []
+    lock = threading.Lock()
+
+    def call():
+        begin = time.perf_counter()
+        try:
+            generate_insight_text(client, *request)
+            with lock:
+                latencies.append(time.perf_counter() - begin)
+        except Exception as e:
+            with lock:
+                errors.append(e)
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=call) for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, len(errors), time.perf_counter() - started
+
+def run_streaming(client, requests):
+    """스트리밍 생성 (지연 시간 = 첫 청크 도착 시간)"""
+    from modules.gemini_insights import generate_insight_stream
+    first_chunk, failures = [], 0
+    started = time.perf_counter()
+    for request in requests.values():
+        begin = time.perf_counter()
+        try:
+            for index, _ in enumerate(generate_insight_stream(client, *request)):
+                if index == 0:
+                    first_chunk.append(time.perf_counter() - begin)
+        except Exception:
+            failures += 1
+    return first_chunk, failures, time.perf_counter() - started
+
+def unlimited_limiter():
+    """속도 제한 없음 (충전량이 매우 큰 토큰 버킷 - 다른 시나리오 측정에 대기 시간이 섞이지 않도록)"""
+    from modules.gemini_pool import TokenBucket
+    return TokenBucket(1e9, 1e9)
+
+def run_benchmark(client, base_url, server, count, concurrency, error_rate):
+    """
+    전체 시나리오 실행
+
+    속도 제한 시나리오 외에는 프로세스 공용 속도 제한을 끄고 측정
+    (앞 시나리오가 순간 허용량을 소진하면 뒤 시나리오가 대기 시간만 재게 되므로)
+
+    Args:
+        server: 내장 대체 서버 (None 이면 오류 주입 시나리오 생략 - 외부 서버는 설정 변경 불가)
+
+    Returns:
+        [시나리오 결과 딕셔너리]
+    """
+    from modules.gemini_pool import set_rate_limiter, get_rate_limiter, load_gemini_config
+
+    results = []
+    set_rate_limiter(unlimited_limiter())
+
+    def record(name, outcome, before):
+        summary = summarize(name, *outcome)
+        after = get_server_stats(base_url)
+        summary['server_requests'] = after.get('requests', 0) - before.get('requests', 0)
+        results.append(summary)
+        print(
+            f"- {name}: p50 {summary['p50_ms']}ms, p95 {summary['p95_ms']}ms, "
+            f"{summary['throughput_rps']} req/s, 실패 {summary['failures']}, 서버 요청 {summary['server_requests']}",
+            flush=True
+        )
+
+    requests = build_requests(count, 'seq')
+    before = get_server_stats(base_url)
+    record("순차 (캐시 미스)", run_sequential(client, requests), before)
+
+    requests = build_requests(count, 'async')
+    before = get_server_stats(base_url)
+    record(f"동시 {concurrency} (캐시 미스)", run_concurrent(client, requests, concurrency), before)
+
+    before = get_server_stats(base_url)
+    record(f"동시 {concurrency} (캐시 적중)", run_concurrent(client, requests, concurrency), before)
+
+    request = next(iter(build_requests(1, 'coalesce').values()))
+    before = get_server_stats(base_url)
+    record(f"같은 요청 {concurrency}개 병합", run_coalesced(client, request, concurrency), before)
+
+    before = get_server_stats(base_url)
+    record("스트리밍 (첫 청크)", run_streaming(client, build_requests(max(1, count // 2), 'stream')), before)
+
+    if server is not None and error_rate > 0:
+        previous = server.settings['error_rate']
+        server.settings['error_rate'] = error_rate
+        try:
+            requests = build_requests(count, 'errors')
+            before = get_server_stats(base_url)
+            record(f"오류 {error_rate:.0%} 주입 (재시도)", run_concurrent(client, requests, concurrency), before)
+        finally:
+            server.settings['error_rate'] = previous
+
+    # 설정된 속도 제한 (새 토큰 버킷, 순간 허용량을 넘는 요청 수)
+    gemini_config = load_gemini_config()
+    set_rate_limiter(None)
+    try:
+        limiter = get_rate_limiter()
+        requests = build_requests(int(limiter.capacity) + count, 'limited')
+        before = get_server_stats(base_url)
+        record(
+            f"속도 제한 (분당 {gemini_config['requests_per_minute']}회, 순간 {gemini_config['burst']}회)",
+            run_concurrent(client, requests, concurrency), before
+        )
+    finally:
+        set_rate_limiter(None)
+
+    return results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="AI 인사이트 파이프라인 벤치마크 (로컬 대체 서버)")
+    parser.add_argument('--base-url', help="실행 중인 대체 서버 주소 (없으면 내장 서버 실행)")
+    parser.add_argument('--requests', type=int, default=10, help="시나리오별 요청 수")
+    parser.add_argument('--concurrency', type=int, help="동시 요청 수 (기본값: config.yaml insights.max_concurrency)")
+    parser.add_argument('--latency-ms', type=float, help="내장 서버 첫 응답 지연 (ms)")
+    parser.add_argument('--tokens-per-second', type=float, help="내장 서버 초당 출력 토큰 수")
+    parser.add_argument('--output-tokens', type=int, help="내장 서버 응답 토큰 수")
+    parser.add_argument('--error-rate', type=float, default=0.2, help="오류 주입 시나리오 오류 비율 (0 이면 생략)")
+    parser.add_argument('--keep-cache', action='store_true', help="config 캐시 디렉토리 사용 (기본값: 임시 디렉토리)")
+    parser.add_argument('--output', help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    # 벤치마크 결과가 실제 인사이트 캐시에 섞이지 않도록 임시 캐시 사용
+    if not args.keep_cache:
+        os.environ['LEARNING_REPORT_CACHE_DIR'] = tempfile.mkdtemp(prefix='insight_bench_')
+
+    server = None
+    base_url = args.base_url
+    if not base_url:
+        from gemini_stub_server import start_stub_server
+        overrides = {'port': 0, 'error_rate': 0.0}
+        for name in ('latency_ms', 'tokens_per_second', 'output_tokens'):
+            if getattr(args, name) is not None:
+                overrides[name] = getattr(args, name)
+        server, base_url = start_stub_server(overrides)
+        print(f"내장 대체 서버: {base_url} (설정: {server.settings})", flush=True)
+
+    from google.genai import types
+    from modules.gemini_pool import get_pooled_client, load_gemini_config
+    from modules.gemini_insights import load_insight_config
+
+    concurrency = args.concurrency or int(load_insight_config()['max_concurrency'])
+    gemini_config = load_gemini_config()
+    print(
+        f"속도 제한: 분당 {gemini_config['requests_per_minute']}회 (순간 {gemini_config['burst']}회), "
+        f"재시도 최대 {gemini_config['max_retries']}회",
+        flush=True
+    )
+    client = get_pooled_client('local-stub', http_options=types.HttpOptions(base_url=base_url))
+
+    results = run_benchmark(client, base_url, server, args.requests, concurrency, args.error_rate)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.output}")
+    if server is not None:
+        server.shutdown()
+    return 0
+
+if __name__ == '__main__':
+    # Windows 인코딩 문제 해결
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(encoding='utf-8')
+    sys.exit(main())
@@ -0,0 +1,218 @@
+"""
+Gemini API 로컬 대체 서버
+API 키/네트워크 없이 AI 인사이트 파이프라인(동시 실행, 캐시, 재시도)의 지연 시간과 처리량을 측정하기 위한 서버
+
+- generateContent / streamGenerateContent(SSE) 엔드포인트 (google-genai SDK 와 호환되는 응답 형식)
+- 첫 응답 지연, 초당 출력 토큰 수, 출력 길이, 오류 응답(429/5xx) 비율 설정
+
+실행:
+    python gemini_stub_server.py                       # config.yaml 의 gemini_stub 설정
+    python gemini_stub_server.py --latency-ms 800 --tokens-per-second 50 --error-rate 0.1
+
+앱/벤치마크에서 사용: config.yaml 의 gemini.base_url 을 http://127.0.0.1:8765 로 설정
+(또는 환경변수 GEMINI_BASE_URL, API 키가 없으면 임의 키 사용)
+"""
+
+import sys
+import os
+import json
+import time
+import random
+import hashlib
+import argparse
+import threading
+import yaml
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# 응답 문장 (프롬프트 해시로 순서를 정해 같은 요청은 같은 응답)
+SENTENCES = [
+    "평균 학습시간은 그룹 전체 평균 대비 뚜렷한 차이를 보입니다.",
+    "상위 그룹은 학습카드 완료율이 높고 Badge 보유 비율도 높습니다.",
+    "하위 그룹은 학습 참여 인원이 적어 개인 간 편차가 큽니다.",
+    "전년 대비 학습시간이 증가한 그룹은 리더의 학습 참여가 활발합니다.",
+    "학습시간 분포는 오른쪽으로 긴 꼬리를 가지며 고학습자 비중이 일정합니다.",
+    "저학습자 비율이 높은 조직에는 짧은 형식의 콘텐츠 추천이 효과적입니다.",
+    "직책별로는 팀장의 학습시간이 구성원 평균을 웃도는 경향이 있습니다.",
+    "변화군 중 상승군은 신규 콘텐츠 이용이 많고 하락군은 특정 시기에 학습이 집중됩니다."
+]
+
+def load_stub_config():
+    """대체 서버 설정 로드 (config.yaml 의 gemini_stub 섹션)"""
+    defaults = {
+        'host': '127.0.0.1',
+        'port': 8765,
+        'latency_ms': 500,
+        'tokens_per_second': 80,
+        'output_tokens': 400,
+        'error_rate': 0.0,
+        'error_codes': [429, 503],
+        'stream_chunk_tokens': 10
+    }
+    config_path = 'config.yaml'
+    if os.path.exists(config_path):
+        with open(config_path, 'r', encoding='utf-8') as file:
+            config = yaml.safe_load(file) or {}
+            defaults.update(config.get('gemini_stub', {}) or {})
+    return defaults
+
+def estimate_prompt_tokens(request):
+    """요청 본문 텍스트 토큰 수 추정 (약 4바이트당 1토큰)"""
+    texts = [
+        part.get('text', '')
+        for content in request.get('contents', [])
+        for part in content.get('parts', [])
+    ]
+    return max(1, len(''.join(texts).encode('utf-8')) // 4)
+
+def build_response_tokens(request, settings):
+    """요청별 응답 토큰(어절) 목록 - 같은 요청은 같은 응답"""
+    seed = hashlib.sha256(json.dumps(request, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+    rng = random.Random(seed)
+    max_tokens = (request.get('generationConfig') or {}).get('maxOutputTokens') or settings['output_tokens']
+    target = min(int(settings['output_tokens']), int(max_tokens))
+    tokens = []
+    while len(tokens) < target:
+        tokens.extend(rng.choice(SENTENCES).split(' '))
+    return tokens[:target]
+
+def _response_payload(text, prompt_tokens, output_tokens, finished):
+    payload = {
+        'candidates': [{
+            'content': {'parts': [{'text': text}], 'role': 'model'},
+            'index': 0
+        }],
+        'usageMetadata': {
+            'promptTokenCount': prompt_tokens,
+            'candidatesTokenCount': output_tokens,
+            'totalTokenCount': prompt_tokens + output_tokens
+        },
+        'modelVersion': 'gemini-stub'
+    }
+    if finished:
+        payload['candidates'][0]['finishReason'] = 'STOP'
+    return payload
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Gemini REST 요청 처리 (설정은 server.settings, 통계는 server.stats)"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _count(self, name):
+        with self.server.stats_lock:
+            self.server.stats[name] = self.server.stats.get(name, 0) + 1
+
+    def do_GET(self):
+        # 상태/요청 통계 확인용
+        with self.server.stats_lock:
+            self._send_json(200, {'settings': self.server.settings, 'stats': dict(self.server.stats)})
+
+    def do_POST(self):
+        settings = self.server.settings
+        length = int(self.headers.get('Content-Length') or 0)
+        try:
+            request = json.loads(self.rfile.read(length) or b'{}')
+        except ValueError:
+            self._send_json(400, {'error': {'code': 400, 'message': 'invalid JSON', 'status': 'INVALID_ARGUMENT'}})
+            return
+
+        path = self.path.split('?', 1)[0]
+        if not (path.endswith(':generateContent') or path.endswith(':streamGenerateContent')):
+            self._send_json(404, {'error': {'code': 404, 'message': f'unknown endpoint {path}', 'status': 'NOT_FOUND'}})
+            return
+        self._count('requests')
+
+        time.sleep(float(settings['latency_ms']) / 1000)
+        if random.random() < float(settings['error_rate']):
+            code = int(random.choice(settings['error_codes']))
+            self._count(f'error_{code}')
+            status = 'RESOURCE_EXHAUSTED' if code == 429 else 'UNAVAILABLE'
+            self._send_json(code, {'error': {'code': code, 'message': 'injected error', 'status': status}})
+            return
+
+        prompt_tokens = estimate_prompt_tokens(request)
+        tokens = build_response_tokens(request, settings)
+        seconds_per_token = 1.0 / max(float(settings['tokens_per_second']), 1e-6)
+
+        if path.endswith(':streamGenerateContent'):
+            self._count('stream')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Connection', 'close')
+            self.end_headers()
+            chunk_size = max(int(settings['stream_chunk_tokens']), 1)
+            for start in range(0, len(tokens), chunk_size):
+                chunk = tokens[start:start + chunk_size]
+                time.sleep(len(chunk) * seconds_per_token)
+                text = ' '.join(chunk) + (' ' if start + chunk_size < len(tokens) else '')
+                payload = _response_payload(text, prompt_tokens, start + len(chunk), start + chunk_size >= len(tokens))
+                self.wfile.write(f"data: {json.dumps(payload, ensure_ascii=False)}\r\n\r\n".encode('utf-8'))
+                self.wfile.flush()
+            self.close_connection = True
+            return
+
+        time.sleep(len(tokens) * seconds_per_token)
+        self._send_json(200, _response_payload(' '.join(tokens), prompt_tokens, len(tokens), True))
+
+def create_stub_server(settings=None, verbose=False):
+    """대체 서버 생성 (serve_forever 는 호출하지 않음 - 벤치마크에서 스레드로 실행)"""
+    settings = {**load_stub_config(), **(settings or {})}
+    server = ThreadingHTTPServer((settings['host'], int(settings['port'])), StubHandler)
+    server.daemon_threads = True
+    server.settings = settings
+    server.stats = {}
+    server.stats_lock = threading.Lock()
+    server.verbose = verbose
+    return server
+
+def start_stub_server(settings=None):
+    """백그라운드 스레드로 대체 서버 시작 → (server, base_url)"""
+    server = create_stub_server(settings)
+    threading.Thread(target=server.serve_forever, name='gemini-stub', daemon=True).start()
+    host, port = server.server_address[:2]
+    return server, f"http://{host}:{port}"
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gemini API 로컬 대체 서버")
+    parser.add_argument('--host', help="바인드 주소")
+    parser.add_argument('--port', type=int, help="포트")
+    parser.add_argument('--latency-ms', type=float, help="첫 응답까지 지연 (ms)")
+    parser.add_argument('--tokens-per-second', type=float, help="초당 출력 토큰 수")
+    parser.add_argument('--output-tokens', type=int, help="응답 토큰 수")
+    parser.add_argument('--error-rate', type=float, help="오류 응답 비율 (0~1)")
+    parser.add_argument('--error-codes', help="오류 응답 코드 (쉼표 구분, 예: 429,503)")
+    parser.add_argument('--verbose', action='store_true', help="요청 로그 출력")
+    args = parser.parse_args(argv)
+
+    overrides = {
+        name: value for name, value in vars(args).items()
+        if value is not None and name not in ('verbose', 'error_codes')
+    }
+    if args.error_codes:
+        overrides['error_codes'] = [int(code) for code in args.error_codes.split(',')]
+
+    server = create_stub_server(overrides, verbose=args.verbose)
+    host, port = server.server_address[:2]
+    print(f"Gemini 대체 서버 실행 중: http://{host}:{port} (설정: {server.settings})", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == '__main__':
+    # Windows 인코딩 문제 해결
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(encoding='utf-8')
+    sys.exit(main())
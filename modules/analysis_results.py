@@ -0,0 +1,225 @@
+"""
+분석 결과 모듈
+대시보드 탭과 Excel 내보내기가 함께 사용하는 분석 표 계산 (데이터셋 버전 + 멤버사 단위 캐시)
+"""
+
+import streamlit as st
+import math
+import json
+import pandas as pd
+from modules.data_loader import (
+    get_annual_learning_data, get_individual_data, get_individual_full_raw_data, preprocess_individual_data,
+    get_company_list
+)
+from modules.eda_analyzer import (
+    analyze_organization_characteristics, analyze_position_characteristics, analyze_individual_characteristics
+)
+from modules.change_group_analyzer import classify_change_groups, get_change_group_statistics, get_person_change_data
+
+# Matrix 비교 연도 (기준 연도 → 대상 연도)
+MATRIX_BASE_YEAR = 2024
+MATRIX_TARGET_YEAR = 2025
+
+def _filter_company(df, company):
+    if df is None or not company or '멤버사명' not in df.columns:
+        return df
+    return df[df['멤버사명'] == company]
+
+def compute_company_averages(individual_df):
+    """멤버사별 인당 평균 학습시간 (내림차순)"""
+    if individual_df is None or '멤버사명' not in individual_df.columns or '학습시간' not in individual_df.columns:
+        return None
+    company_avg = (
+        individual_df.groupby('멤버사명')['학습시간']
+        .mean()
+        .sort_values(ascending=False)
+    )
+    return company_avg.reset_index().rename(columns={'학습시간': '인당 평균(시간)'})
+
+def compute_matrix_data(individual_full_df, individual_df, base_year=MATRIX_BASE_YEAR, target_year=MATRIX_TARGET_YEAR):
+    """
+    멤버사별 Matrix 데이터 (멤버사명, 변화(%), 올해(시간))
+
+    개인 전체 raw 가 있으면 기준/대상 연도 인당 평균 및 변화율,
+    없으면 개인 데이터의 최신 평균으로 Y 만 채우고 변화는 0
+    """
+    if individual_full_df is not None and all(c in individual_full_df.columns for c in ['멤버사명', '연도', '학습시간']):
+        df_f = individual_full_df[individual_full_df['연도'].isin([base_year, target_year])]
+        avg_by = df_f.groupby(['멤버사명', '연도'])['학습시간'].mean().reset_index()
+        pivot = avg_by.pivot(index='멤버사명', columns='연도', values='학습시간').reset_index()
+        if base_year in pivot.columns and target_year in pivot.columns:
+            pivot['변화(%)'] = ((pivot[target_year] - pivot[base_year]) / (pivot[base_year].replace(0, pd.NA)) * 100).fillna(0)
+            return pivot.rename(columns={target_year: '올해(시간)'})[['멤버사명', '변화(%)', '올해(시간)']]
+
+    if individual_df is not None and '멤버사명' in individual_df.columns and '학습시간' in individual_df.columns:
+        latest_avg = individual_df.groupby('멤버사명')['학습시간'].mean().reset_index().rename(columns={'학습시간': '올해(시간)'})
+        latest_avg['변화(%)'] = 0
+        return latest_avg[['멤버사명', '변화(%)', '올해(시간)']]
+    return None
+
+# 분석 표 이름 (get_analysis_results 키)
+ANALYSIS_TABLES = (
+    'org_stats', 'position_stats', 'individual_stats', 'change_groups', 'change_group_summary',
+    'change_group_stats', 'person_changes', 'company_averages', 'matrix'
+)
+# 멤버사 선택과 무관한 표 (항상 전체 기준)
+GROUP_TABLES = ('company_averages', 'matrix')
+
+# 표 계산 중간 결과는 cache_resource (복사/역직렬화 없이 공유 - 읽기 전용으로만 사용)
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _get_individual_df(dataset_version, company=None):
+    """전처리한 개인 데이터 (최신 연도 기준은 멤버사 필터 후 적용 - 탭 화면과 동일)"""
+    raw_individual_df = get_individual_data()
+    if raw_individual_df is None:
+        return None
+    return preprocess_individual_data(_filter_company(raw_individual_df, company).copy())
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _get_change_groups(dataset_version, company=None):
+    """멤버사 필터를 적용한 개인 전체 raw 와 변화군 분류 ((df, 변화군), 데이터가 없으면 (None, None))"""
+    company_full_df = _filter_company(get_individual_full_raw_data(), company)
+    if company_full_df is None:
+        return None, None
+    return company_full_df, classify_change_groups(company_full_df) or None
+
+def _compute_table(name, dataset_version, company):
+    if name in GROUP_TABLES:
+        individual_df = _get_individual_df(dataset_version)
+        if name == 'company_averages':
+            return compute_company_averages(individual_df)
+        return compute_matrix_data(get_individual_full_raw_data(), individual_df)
+
+    if name in ('org_stats', 'position_stats', 'individual_stats'):
+        company_df = _get_individual_df(dataset_version, company)
+        if company_df is None:
+            return None
+        if name == 'org_stats':
+            return analyze_organization_characteristics(company_df)
+        if name == 'position_stats':
+            return analyze_position_characteristics(company_df)
+        individual_analysis = analyze_individual_characteristics(company_df)
+        return individual_analysis[0] if individual_analysis is not None else None
+
+    company_full_df, change_groups = _get_change_groups(dataset_version, company)
+    if not change_groups:
+        return None
+    if name == 'change_groups':
+        return change_groups
+    if name == 'change_group_summary':
+        return pd.DataFrame([
+            {'변화군': group, '인원수': len(members)}
+            for group, members in change_groups.items() if members
+        ])
+    if name == 'change_group_stats':
+        return get_change_group_statistics(company_full_df, change_groups)
+    return get_person_change_data(company_full_df, change_groups)
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def get_analysis_table(dataset_version, name, company=None):
+    """
+    분석 표 1개 (데이터셋 버전 + 표 + 멤버사별 캐시 - 호출한 표만 계산/역직렬화)
+
+    Args:
+        dataset_version: get_dataset_version() 값 (캐시 키, 업로드 데이터가 바뀌면 재계산)
+        name: ANALYSIS_TABLES 중 하나
+        company: 멤버사명 (None 이면 전체) - 조직/직책/변화군 표에만 적용
+
+    Returns:
+        표 (데이터가 없으면 None)
+    """
+    if name not in ANALYSIS_TABLES:
+        raise ValueError(f"알 수 없는 분석 표: {name}")
+    return _compute_table(name, dataset_version, None if name in GROUP_TABLES else company)
+
+def get_analysis_results(dataset_version, company=None, tables=ANALYSIS_TABLES):
+    """
+    분석 표 모음 (표별 캐시 - 탭 화면과 Excel 내보내기에서 공유)
+
+    Args:
+        dataset_version: get_dataset_version() 값 (캐시 키, 업로드 데이터가 바뀌면 재계산)
+        company: 멤버사명 (None 이면 전체) - 조직/직책/변화군 표에만 적용
+        tables: 가져올 표 이름 (기본값 전체 - 필요한 표만 지정하면 나머지는 계산/역직렬화하지 않음)
+
+    Returns:
+        {'org_stats', 'position_stats', 'individual_stats', 'change_groups', 'change_group_summary',
+         'change_group_stats', 'person_changes', 'company_averages', 'matrix'} 중 tables 항목
+        (데이터가 없는 항목은 None)
+    """
+    return {name: get_analysis_table(dataset_version, name, company) for name in tables}
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def get_company_options(dataset_version):
+    """멤버사 목록 (데이터셋 버전별 캐시 - 사이드바 멤버사 선택/리포트 다운로드에서 공유)"""
+    return get_company_list()
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def get_upload_summary(dataset_version, company=None):
+    """
+    사이드바 업로드 결과 요약 (데이터셋 버전 + 멤버사별 캐시)
+
+    Returns:
+        {'file_count', 'total_time', 'num_learners'} (데이터가 없는 항목은 None)
+    """
+    uploaded_data = st.session_state.get('uploaded_data') or {}
+    annual_df = _filter_company(get_annual_learning_data(), company)
+    individual_df = _filter_company(get_individual_data(), company)
+    return {
+        'file_count': len([k for k in uploaded_data.keys() if not k.endswith('_info')]),
+        'total_time': float(annual_df['학습시간'].sum()) if annual_df is not None and '학습시간' in annual_df.columns else None,
+        'num_learners': len(individual_df) if individual_df is not None else None
+    }
+
+def _records(df):
+    """DataFrame → JSON 레코드 목록 (NaN → null, numpy 값 → 기본 타입)"""
+    if df is None or df.empty:
+        return []
+    return json.loads(df.to_json(orient='records', force_ascii=False))
+
+def _plain(value):
+    if hasattr(value, 'item'):
+        value = value.item()
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+def summarize_analysis(dataset_version, company=None):
+    """
+    분석 결과 JSON 요약 (헤드리스 CLI 출력, 분석 API 응답 공용)
+
+    Args:
+        dataset_version: 데이터셋 버전 (get_analysis_results 캐시 키)
+        company: 멤버사명 (None 이면 전체)
+
+    Returns:
+        {'company', 'dataset_version', 'learners', 'average_hours', 'current_hours', 'change_rate',
+         'change_groups', 'individual_stats', 'org_stats', 'position_stats', 'change_group_stats'}
+        - current_hours/change_rate 는 Matrix 기준 (멤버사별만, 전체는 None)
+    """
+    results = get_analysis_results(
+        dataset_version, company,
+        tables=('individual_stats', 'matrix', 'change_group_summary', 'org_stats', 'position_stats', 'change_group_stats')
+    )
+    stats = {key: _plain(value) for key, value in (results['individual_stats'] or {}).items()}
+
+    matrix_row = {}
+    matrix = results['matrix']
+    if company and matrix is not None and not matrix.empty:
+        rows = _records(matrix[matrix['멤버사명'] == company])
+        matrix_row = rows[0] if rows else {}
+
+    summary_df = results['change_group_summary']
+    return {
+        'company': company or '전체',
+        'dataset_version': dataset_version,
+        'learners': stats.get('총인원수'),
+        'average_hours': stats.get('평균학습시간'),
+        'current_hours': matrix_row.get('올해(시간)'),
+        'change_rate': matrix_row.get('변화(%)'),
+        'change_groups': (
+            {row['변화군']: int(row['인원수']) for row in _records(summary_df)} if summary_df is not None else {}
+        ),
+        'individual_stats': stats,
+        'org_stats': _records(results['org_stats']),
+        'position_stats': _records(results['position_stats']),
+        'change_group_stats': _records(results['change_group_stats'])
+    }
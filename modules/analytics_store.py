@@ -0,0 +1,97 @@
+"""
+분석 결과 공유 저장소 모듈
+전체 + 멤버사별 분석 요약(summarize_analysis)을 디스크 캐시에 게시하고 분석 API(analytics_api.py)가 읽어 응답
+
+- 게시: 헤드리스 CLI(--publish), 대시보드 관리자 게시 버튼
+  (파일 로드 후 자동 게시는 analytics_api.publish_after_upload 를 켠 경우만 - 기본값 꺼짐)
+- 최신 게시본 1개만 유지 (데이터셋 버전, 게시 시각, 게시자 포함) - API 는 게시본이 바뀔 때만 다시 읽음
+- API 프로세스는 이 모듈의 조회 함수만 사용하므로 Streamlit/pandas 를 임포트하지 않음
+"""
+
+import os
+import time
+import yaml
+from modules.cache_store import load_cached, save_cached, get_cached_mtime
+
+ANALYTICS_NAMESPACE = 'analytics'
+SNAPSHOT_KEY = 'latest'
+
+# 그룹 전체 요약의 멤버사 키 (summarize_analysis 의 company 값과 동일)
+OVERALL_KEY = '전체'
+
+def load_analytics_config():
+    """분석 API / 게시 설정 로드 (config.yaml 의 analytics_api 섹션)"""
+    defaults = {
+        'host': '127.0.0.1',
+        'port': 8766,
+        'publish_after_upload': False,
+        'max_age_seconds': 60,
+        'reload_seconds': 5,
+        'response_cache_items': 256
+    }
+    config_path = 'config.yaml'
+    if os.path.exists(config_path):
+        with open(config_path, 'r', encoding='utf-8') as file:
+            config = yaml.safe_load(file) or {}
+            defaults.update(config.get('analytics_api', {}) or {})
+    return defaults
+
+def build_analytics_summaries(dataset_version, companies=None, progress=None):
+    """
+    전체 + 멤버사별 분석 요약 계산 (현재 세션 데이터 기준, get_analysis_results 캐시 사용)
+
+    Args:
+        companies: 멤버사 목록 (None 이면 get_company_list() 전체)
+        progress: 진행률 콜백 progress(비율, 메시지)
+
+    Returns:
+        {멤버사명 또는 '전체': summarize_analysis 결과}
+    """
+    from modules.analysis_results import summarize_analysis
+    from modules.data_loader import get_company_list
+
+    targets = [None] + list(get_company_list() if companies is None else companies)
+    summaries = {}
+    for index, company in enumerate(targets):
+        if progress is not None:
+            progress(index / len(targets), f"{company or OVERALL_KEY} 분석 요약 중")
+        summaries[company or OVERALL_KEY] = summarize_analysis(dataset_version, company)
+    return summaries
+
+def publish_analytics(dataset_version, summaries, source, published_by=None):
+    """
+    분석 요약 게시 (기존 게시본 교체 - 임시 파일 작성 후 교체되므로 API 는 항상 완전한 게시본을 읽음)
+
+    Args:
+        summaries: build_analytics_summaries 결과
+        source: 게시 경로 표시 ('upload', 'admin', 'cli' 등)
+        published_by: 게시한 사용자 (CLI 는 None)
+
+    Returns:
+        저장 성공 여부
+    """
+    return save_cached(ANALYTICS_NAMESPACE, SNAPSHOT_KEY, {
+        'dataset_version': dataset_version,
+        'published_at': time.time(),
+        'source': source,
+        'published_by': published_by,
+        'companies': summaries
+    })
+
+def load_published_analytics():
+    """최신 게시본 ({'dataset_version', 'published_at', 'source', 'published_by', 'companies'}, 없으면 None)"""
+    return load_cached(ANALYTICS_NAMESPACE, SNAPSHOT_KEY)
+
+def get_published_mtime():
+    """최신 게시본 파일 수정 시각 (없으면 None - API 의 게시본 변경 확인용)"""
+    return get_cached_mtime(ANALYTICS_NAMESPACE, SNAPSHOT_KEY)
+
+def publish_analytics_job(progress, source='admin', published_by=None):
+    """작업 큐용 분석 요약 게시 (관리자 게시 버튼, publish_after_upload 를 켠 경우 파일 로드 후)"""
+    from modules.data_loader import get_dataset_version
+
+    dataset_version = get_dataset_version()
+    summaries = build_analytics_summaries(dataset_version, progress=progress)
+    if not publish_analytics(dataset_version, summaries, source, published_by):
+        raise RuntimeError("분석 요약을 저장하지 못했습니다.")
+    return {'summary': f"분석 요약 {len(summaries)}개 게시 완료 (버전 {dataset_version})"}
@@ -0,0 +1,155 @@
+"""
+디스크 캐시 모듈
+분석 결과 등 재계산 비용이 큰 객체를 로컬 디스크에 저장/재사용
+"""
+
+import os
+import pickle
+import hashlib
+import tempfile
+import time
+import yaml
+
+DEFAULT_CACHE_DIR = '.cache'
+
+# 분석/차트 캐시 기본 보관 한도 (config.yaml 의 cache.max_items / cache.max_age_days)
+DEFAULT_MAX_ITEMS = 50
+DEFAULT_MAX_AGE_DAYS = 30
+
+def load_cache_config():
+    """캐시 설정 로드"""
+    config_path = 'config.yaml'
+    if os.path.exists(config_path):
+        with open(config_path, 'r', encoding='utf-8') as file:
+            config = yaml.safe_load(file) or {}
+            return config.get('cache', {}) or {}
+    return {}
+
+def get_cache_dir(namespace):
+    """네임스페이스별 캐시 디렉토리 (없으면 생성)"""
+    base_dir = os.getenv('LEARNING_REPORT_CACHE_DIR') or load_cache_config().get('dir', DEFAULT_CACHE_DIR)
+    cache_dir = os.path.join(base_dir, namespace)
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+def make_cache_key(*parts):
+    """캐시 키 생성 (구성 요소 문자열 해시)"""
+    raw = '|'.join(str(part) for part in parts)
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()[:32]
+
+def _cache_path(namespace, key):
+    return os.path.join(get_cache_dir(namespace), f"{key}.pkl")
+
+def load_cached(namespace, key):
+    """캐시 항목 로드 (없거나 손상된 경우 None)"""
+    path = _cache_path(namespace, key)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'rb') as file:
+            return pickle.load(file)
+    except Exception:
+        return None
+
+def save_cached(namespace, key, obj):
+    """캐시 항목 저장 (임시 파일 작성 후 교체 - 동시 실행 시에도 안전)"""
+    path = _cache_path(namespace, key)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            pickle.dump(obj, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        return True
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return False
+
+def delete_cached(namespace, key):
+    """캐시 항목 삭제 (없으면 무시)"""
+    path = _cache_path(namespace, key)
+    if os.path.exists(path):
+        os.remove(path)
+
+def touch_cached(namespace, key):
+    """캐시 항목 사용 시각 갱신 (prune_cache 의 오래된 항목 판단 기준)"""
+    try:
+        os.utime(_cache_path(namespace, key))
+    except OSError:
+        pass
+
+def get_cached_mtime(namespace, key):
+    """캐시 항목 수정 시각 (없으면 None)"""
+    try:
+        return os.path.getmtime(_cache_path(namespace, key))
+    except OSError:
+        return None
+
+def count_cached(namespace):
+    """네임스페이스 캐시 항목 수"""
+    return sum(1 for name in os.listdir(get_cache_dir(namespace)) if name.endswith('.pkl'))
+
+def prune_cache(namespace, max_items=None, max_age_seconds=None):
+    """
+    캐시 정리 (사용 시각 기준)
+
+    Args:
+        max_items: 최대 항목 수 (초과분은 가장 오래 사용하지 않은 항목부터 삭제)
+        max_age_seconds: 이 시간 이상 사용하지 않은 항목 삭제
+
+    Returns:
+        삭제한 항목 수
+    """
+    cache_dir = get_cache_dir(namespace)
+    entries = []
+    for name in os.listdir(cache_dir):
+        if not name.endswith('.pkl'):
+            continue
+        path = os.path.join(cache_dir, name)
+        try:
+            entries.append((os.path.getmtime(path), path))
+        except OSError:
+            continue
+    entries.sort(reverse=True)
+
+    expired = []
+    if max_age_seconds is not None:
+        cutoff = time.time() - max_age_seconds
+        expired = [path for mtime, path in entries if mtime < cutoff]
+        entries = [(mtime, path) for mtime, path in entries if mtime >= cutoff]
+    if max_items is not None and len(entries) > max_items:
+        expired += [path for _, path in entries[max_items:]]
+
+    removed = 0
+    for path in expired:
+        try:
+            os.remove(path)
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+def load_cache_limits(namespace):
+    """
+    네임스페이스 보관 한도 (cache.max_items / cache.max_age_days, cache.namespaces.<이름> 으로 개별 지정)
+
+    Returns:
+        {'max_items': 최대 항목 수, 'max_age_days': 미사용 보관 일수} - None 이면 제한 없음
+    """
+    config = load_cache_config()
+    limits = {
+        'max_items': config.get('max_items', DEFAULT_MAX_ITEMS),
+        'max_age_days': config.get('max_age_days', DEFAULT_MAX_AGE_DAYS)
+    }
+    limits.update((config.get('namespaces', {}) or {}).get(namespace, {}) or {})
+    return limits
+
+def prune_namespace(namespace):
+    """설정된 보관 한도로 네임스페이스 캐시 정리 (저장 후 호출) → 삭제한 항목 수"""
+    limits = load_cache_limits(namespace)
+    max_items, max_age_days = limits.get('max_items'), limits.get('max_age_days')
+    return prune_cache(
+        namespace,
+        max_items=int(max_items) if max_items is not None else None,
+        max_age_seconds=float(max_age_days) * 86400 if max_age_days is not None else None
+    )
@@ -27,6 +27,12 @@ def load_thresholds():
         'decrease_threshold': -0.1
     }
 
+def select_comparison_years(available_years):
+    """변화군 비교 연도 선택 (2024/2025 우선, 없으면 최근 2년)"""
+    if 2024 in available_years and 2025 in available_years:
+        return 2024, 2025
+    return available_years[-2], available_years[-1]
+
 def classify_change_groups(df):
     """
     학습시간 변화군 분류 (22-25년도 지원)
@@ -72,12 +78,7 @@ def classify_change_groups(df):
             return {}
         
         # 2024, 2025 연도 확인 (없으면 최근 2년 사용)
-        if 2024 in available_years and 2025 in available_years:
-            col_2024 = 2024
-            col_2025 = 2025
-        else:
-            col_2024 = available_years[-2]
-            col_2025 = available_years[-1]
+        col_2024, col_2025 = select_comparison_years(available_years)
         
         # 전체 평균 계산
         mean_2024 = pivot_df[col_2024].mean()
@@ -181,3 +182,38 @@ def get_change_group_statistics(df, change_groups):
         stats.append(group_stats)
     
     return pd.DataFrame(stats)
+
+def get_person_change_data(df, change_groups):
+    """개인별 비교 연도 학습시간 및 변화군 (개인ID, 24년학습시간, 25년학습시간, 변화군)"""
+    if df is None or df.empty or not change_groups:
+        return None
+    if '연도' not in df.columns or '학습시간' not in df.columns or '개인ID' not in df.columns:
+        return None
+    
+    pivot_df = df.pivot_table(
+        index='개인ID',
+        columns='연도',
+        values='학습시간',
+        aggfunc='sum'
+    ).fillna(0)
+    
+    available_years = sorted([y for y in pivot_df.columns if isinstance(y, (int, np.integer)) and y >= 2022])
+    if len(available_years) < 2:
+        return None
+    col_2024, col_2025 = select_comparison_years(available_years)
+    
+    group_of = pd.Series(
+        {person_id: group_name for group_name, member_ids in change_groups.items() for person_id in member_ids},
+        name='변화군'
+    )
+    
+    person_df = pd.DataFrame({
+        '24년학습시간': pivot_df[col_2024],
+        '25년학습시간': pivot_df[col_2025]
+    })
+    person_df['변화군'] = group_of.reindex(person_df.index)
+    person_df = person_df.dropna(subset=['변화군'])
+    person_df.index.name = '개인ID'
+    
+    return person_df.reset_index()
+
@@ -0,0 +1,211 @@
+"""
+차트 이미지 렌더링 모듈
+Plotly Figure → 이미지 변환 (워커 프로세스 풀 + 내용 해시 캐시)
+
+- 변환은 항상 워커 프로세스에서 실행 (응답 없는 렌더러는 프로세스째 종료할 수 있도록)
+- 시간 초과가 난 풀은 교체하고, 그 풀을 사용하던 요청이 모두 끝나면 종료
+
+워커 프로세스가 이 모듈만 임포트하도록 streamlit/reportlab 의존성을 두지 않음
+"""
+
+import plotly.io as pio
+import os
+import time
+import yaml
+import atexit
+import hashlib
+import threading
+import multiprocessing
+from collections import OrderedDict
+from modules.cache_store import load_cached, save_cached, touch_cached, prune_namespace
+
+# 차트 이미지 캐시 (Figure 내용 해시 → 이미지 bytes, 메모리 LRU + 디스크)
+CHART_IMAGE_NAMESPACE = 'chart_images'
+CHART_IMAGE_MEMORY_ITEMS = 128
+_chart_image_cache = OrderedDict()
+_chart_image_lock = threading.Lock()
+
+# 차트 렌더링 워커 풀 (워커마다 kaleido 렌더러 상주, 풀별 사용 중인 요청 수)
+_render_pool = None
+_render_pool_users = {}
+_render_pool_lock = threading.Lock()
+_renderer_started = False
+
+def load_render_config():
+    """렌더링 설정 로드 (config.yaml 의 report 섹션)"""
+    defaults = {'chart_render_workers': 4, 'chart_render_timeout_seconds': 60}
+    config_path = 'config.yaml'
+    if os.path.exists(config_path):
+        with open(config_path, 'r', encoding='utf-8') as file:
+            config = yaml.safe_load(file) or {}
+            defaults.update(config.get('report', {}) or {})
+    return defaults
+
+def is_chrome_available():
+    """kaleido 1.x 가 사용할 Chrome 설치 여부 (choreographer 가 없는 구버전 kaleido 는 Chrome 불필요 → True)"""
+    try:
+        from choreographer.browsers.chromium import Chromium
+    except ImportError:
+        return True
+    try:
+        path = os.environ.get('BROWSER_PATH') or Chromium.find_browser(skip_local=False)
+    except Exception:
+        return False
+    return bool(path) and os.path.isfile(path)
+
+def start_persistent_renderer():
+    """kaleido 렌더러를 프로세스당 한 번만 기동 (kaleido 1.x 동기 서버, 구버전은 첫 호출 후 유지, Chrome 이 없으면 기동하지 않음)"""
+    global _renderer_started
+    if _renderer_started:
+        return
+    _renderer_started = True
+    try:
+        import kaleido
+        if hasattr(kaleido, 'start_sync_server') and is_chrome_available():
+            kaleido.start_sync_server(silence_warnings=True)
+    except Exception:
+        pass
+
+def render_figure_json(fig_json, width, height, fmt='png'):
+    """직렬화된 Figure → 이미지 bytes (워커 프로세스에서 실행)"""
+    start_persistent_renderer()
+    return pio.to_image(pio.from_json(fig_json), format=fmt, width=width, height=height)
+
+def get_chart_image_key(fig_json, width, height, fmt='png'):
+    """Figure 내용 + 크기 + 포맷 기반 이미지 캐시 키"""
+    hasher = hashlib.sha256(fig_json.encode('utf-8'))
+    hasher.update(f"|{width}x{height}|{fmt}".encode('utf-8'))
+    return hasher.hexdigest()
+
+def _lookup_chart_image(key):
+    with _chart_image_lock:
+        img_bytes = _chart_image_cache.get(key)
+        if img_bytes is not None:
+            _chart_image_cache.move_to_end(key)
+            return img_bytes
+    img_bytes = load_cached(CHART_IMAGE_NAMESPACE, key)
+    if img_bytes is not None:
+        touch_cached(CHART_IMAGE_NAMESPACE, key)
+        _remember_chart_image(key, img_bytes)
+    return img_bytes
+
+def _remember_chart_image(key, img_bytes):
+    with _chart_image_lock:
+        _chart_image_cache[key] = img_bytes
+        _chart_image_cache.move_to_end(key)
+        while len(_chart_image_cache) > CHART_IMAGE_MEMORY_ITEMS:
+            _chart_image_cache.popitem(last=False)
+
+def _create_render_pool():
+    workers = int(load_render_config().get('chart_render_workers', 4))
+    if multiprocessing.parent_process() is not None:
+        # PDF 생성 워커 프로세스 안에서는 렌더러 1개만 사용
+        workers = 1
+    return multiprocessing.get_context('spawn').Pool(max(1, workers), initializer=start_persistent_renderer)
+
+def _acquire_render_pool():
+    """현재 렌더링 풀 사용 시작 (지연 생성 후 재사용, 생성 실패 시 None)"""
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is None:
+            try:
+                _render_pool = _create_render_pool()
+            except Exception:
+                return None
+        _render_pool_users[_render_pool] = _render_pool_users.get(_render_pool, 0) + 1
+        return _render_pool
+
+def _release_render_pool(pool, retire=False):
+    """
+    렌더링 풀 사용 종료
+
+    retire: 응답 없는 워커가 있는 풀 - 이후 요청은 새 풀을 사용하고,
+    다른 요청이 아직 사용 중이면 그 요청이 끝난 뒤 종료 (진행 중인 다른 세션의 변환은 중단하지 않음)
+    """
+    global _render_pool
+    with _render_pool_lock:
+        if retire and _render_pool is pool:
+            _render_pool = None
+        _render_pool_users[pool] -= 1
+        if _render_pool_users[pool] > 0 or _render_pool is pool:
+            return
+        del _render_pool_users[pool]
+    pool.terminate()
+
+def _terminate_render_pools():
+    with _render_pool_lock:
+        pools = list(_render_pool_users) + ([_render_pool] if _render_pool is not None else [])
+    for pool in pools:
+        pool.terminate()
+
+atexit.register(_terminate_render_pools)
+
+def render_chart_images(chart_specs, fmt='png'):
+    """
+    여러 차트를 병렬로 이미지 변환 (캐시 우선, 동일 내용 차트는 1회만 변환)
+
+    Args:
+        chart_specs: {이름: (fig 또는 fig.to_json() 문자열, width, height)}
+        fmt: 'png' 또는 'svg'
+
+    Returns:
+        {이름: 이미지 bytes 또는 Exception(변환 실패)}
+    """
+    results = {}
+    pending = {}
+    for name, (fig, width, height) in chart_specs.items():
+        if fig is None:
+            continue
+        fig_json = fig if isinstance(fig, str) else fig.to_json()
+        key = get_chart_image_key(fig_json, width, height, fmt)
+        img_bytes = _lookup_chart_image(key)
+        if img_bytes is not None:
+            results[name] = img_bytes
+        elif key in pending:
+            pending[key][3].append(name)
+        else:
+            pending[key] = (fig_json, width, height, [name])
+
+    if not pending:
+        return results
+
+    rendered = {}
+    timeout = float(load_render_config().get('chart_render_timeout_seconds', 60))
+    pool = _acquire_render_pool()
+    if pool is None:
+        error = RuntimeError("차트 렌더링 프로세스를 시작하지 못했습니다.")
+        rendered = {key: error for key in pending}
+    else:
+        timed_out = False
+        try:
+            async_results = {
+                key: pool.apply_async(render_figure_json, (fig_json, width, height, fmt))
+                for key, (fig_json, width, height, names) in pending.items()
+            }
+            deadline = time.monotonic() + timeout
+            for key, async_result in async_results.items():
+                try:
+                    rendered[key] = async_result.get(timeout=max(deadline - time.monotonic(), 0))
+                except multiprocessing.TimeoutError:
+                    timed_out = True
+                    rendered[key] = TimeoutError(f"차트 이미지 변환이 {timeout:.0f}초 안에 끝나지 않았습니다.")
+                except Exception as e:
+                    rendered[key] = e
+        except Exception as e:
+            # 풀 제출 실패 → 다음 요청에서 새 풀 생성
+            timed_out = True
+            rendered = {key: e for key in pending}
+        finally:
+            _release_render_pool(pool, retire=timed_out)
+
+    for key, (fig_json, width, height, names) in pending.items():
+        result = rendered[key]
+        if not isinstance(result, Exception):
+            _remember_chart_image(key, result)
+            save_cached(CHART_IMAGE_NAMESPACE, key, result)
+        for name in names:
+            results[name] = result
+
+    if any(not isinstance(result, Exception) for result in rendered.values()):
+        prune_namespace(CHART_IMAGE_NAMESPACE)
+    return results
@@ -8,7 +8,126 @@ import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
 import numpy as np
+import threading
+import yaml
+import os
+from collections import OrderedDict
 from modules.data_loader import *
+from modules.transition_analyzer import get_transition_rates
+
+# 차트 Figure 캐시 (프로세스 전역, Figure 객체 그대로 저장 + LRU 제거 - 조회 시 역직렬화/재검증 없음)
+_figure_cache = OrderedDict()
+_figure_cache_bytes = 0
+_figure_cache_lock = threading.Lock()
+
+def load_figure_cache_config():
+    """Figure 캐시 설정 로드"""
+    defaults = {'max_entries': 256, 'max_mb': 64}
+    config_path = 'config.yaml'
+    if os.path.exists(config_path):
+        with open(config_path, 'r', encoding='utf-8') as file:
+            config = yaml.safe_load(file) or {}
+            defaults.update(config.get('figure_cache', {}) or {})
+    return defaults
+
+_figure_cache_config = load_figure_cache_config()
+
+def _figure_param_key(value):
+    """
+    캐시 키용 파라미터 표현
+
+    DataFrame/Series/배열/긴 목록은 구조(형태, 열, 길이)만 반영 - 내용은 데이터셋 버전 + 멤버사로 결정되므로 해시하지 않음
+    (매 재실행마다 전체 데이터를 해시하면 캐시 적중이 다시 그리는 것보다 느려짐)
+    """
+    if isinstance(value, pd.DataFrame):
+        return ('DataFrame', value.shape, tuple(map(str, value.columns)))
+    if isinstance(value, pd.Series):
+        return ('Series', value.shape, str(value.name))
+    if isinstance(value, np.ndarray):
+        return ('ndarray', value.shape, str(value.dtype))
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _figure_param_key(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        # 긴 목록(변화군 인원 ID 등)도 표와 같이 길이만 반영
+        if len(value) > 32:
+            return ('seq', len(value))
+        return tuple(_figure_param_key(v) for v in value)
+    return repr(value)
+
+def _builder_key(builder):
+    """builder 이름 + 클로저 변수 (lambda/중첩 함수가 캡처한 값이 바뀌면 다른 키)"""
+    cells = []
+    for cell in getattr(builder, '__closure__', None) or ():
+        try:
+            cells.append(cell.cell_contents)
+        except ValueError:
+            cells.append(None)
+    return getattr(builder, '__qualname__', repr(builder)), _figure_param_key(cells)
+
+def get_cached_figure(builder, *args, dataset_version=None, company=None, cache_name=None, **params):
+    """
+    Figure 캐시 조회/생성
+
+    Args:
+        builder: 차트 생성 함수 (create_*_chart 또는 Figure 를 반환하는 callable)
+        dataset_version: 데이터셋 버전 (None 이면 캐시하지 않음)
+        company: 멤버사 필터 (None = 전체)
+        cache_name: 캐시 키 이름 (lambda 등 이름이 없는 builder 용)
+        *args, **params: builder 인자
+
+    캐시 키는 데이터셋 버전, 멤버사, builder 와 인자/클로저 변수의 값(표는 구조만)만 반영
+    - 표 인자는 데이터셋 버전 + 멤버사 + 나머지 인자로 정해지는 데이터만 전달 (그 밖의 필터는 인자로 전달)
+
+    Returns:
+        go.Figure - 캐시된 객체를 세션 간 공유하므로 읽기 전용으로 사용 (수정이 필요하면 go.Figure(fig) 로 복사)
+    """
+    global _figure_cache_bytes
+    if dataset_version is None:
+        return builder(*args, **params)
+    
+    key = (
+        cache_name,
+        _builder_key(builder),
+        dataset_version,
+        company,
+        _figure_param_key(args),
+        _figure_param_key(params)
+    )
+    
+    with _figure_cache_lock:
+        cached = _figure_cache.get(key)
+        if cached is not None:
+            _figure_cache.move_to_end(key)
+            return cached[0]
+    
+    fig = builder(*args, **params)
+    if fig is None:
+        return None
+    
+    # 메모리 한도 계산용 크기 (생성 시 1회만 직렬화)
+    size = len(fig.to_json())
+    max_bytes = _figure_cache_config['max_mb'] * 1024 * 1024
+    if size > max_bytes:
+        return fig
+    
+    with _figure_cache_lock:
+        if key not in _figure_cache:
+            _figure_cache[key] = (fig, size)
+            _figure_cache_bytes += size
+        while _figure_cache and (
+            len(_figure_cache) > _figure_cache_config['max_entries'] or _figure_cache_bytes > max_bytes
+        ):
+            _, (_, evicted_size) = _figure_cache.popitem(last=False)
+            _figure_cache_bytes -= evicted_size
+    
+    return fig
+
+def clear_figure_cache():
+    """Figure 캐시 초기화"""
+    global _figure_cache_bytes
+    with _figure_cache_lock:
+        _figure_cache.clear()
+        _figure_cache_bytes = 0
 
 def create_annual_trend_chart(df, selected_company=None):
     """최근 3개년 학습시간 추이 차트"""
@@ -233,3 +352,203 @@ def create_area_status_chart(df):
     
     return None
 
+def create_transition_heatmap(counts_df, from_year, to_year):
+    """연도 간 학습시간 구간 이동 히트맵 (행 기준 이동 비율)"""
+    if counts_df is None or counts_df.empty:
+        return None
+    
+    rates = get_transition_rates(counts_df)
+    
+    fig = go.Figure(data=go.Heatmap(
+        z=rates.values,
+        x=rates.columns.tolist(),
+        y=rates.index.tolist(),
+        customdata=counts_df.values,
+        text=rates.values,
+        texttemplate='%{text:.1f}%',
+        colorscale='Blues',
+        hovertemplate=f'{from_year}: %{{y}}<br>{to_year}: %{{x}}<br>비율: %{{z:.1f}}%<br>인원: %{{customdata:,}}명<extra></extra>',
+        colorbar=dict(title='비율 (%)')
+    ))
+    
+    fig.update_layout(
+        title=f'학습시간 구간 이동 ({from_year}년 → {to_year}년)',
+        xaxis_title=f'{to_year}년 구간',
+        yaxis_title=f'{from_year}년 구간',
+        yaxis=dict(autorange='reversed')
+    )
+    
+    return fig
+
+def create_transition_sankey(transitions, years, labels):
+    """연속 연도 간 학습시간 구간 이동 Sankey 차트"""
+    if not transitions or not years or len(years) < 2:
+        return None
+    
+    n_tiers = len(labels)
+    node_labels = [f"{year} {label}" for year in years for label in labels]
+    
+    sources, targets, values = [], [], []
+    for i in range(len(years) - 1):
+        counts_df = transitions.get((years[i], years[i + 1]))
+        if counts_df is None:
+            continue
+        counts = counts_df.values
+        for a in range(n_tiers):
+            for b in range(n_tiers):
+                if counts[a, b] > 0:
+                    sources.append(i * n_tiers + a)
+                    targets.append((i + 1) * n_tiers + b)
+                    values.append(int(counts[a, b]))
+    
+    if not values:
+        return None
+    
+    fig = go.Figure(data=go.Sankey(
+        arrangement='snap',
+        node=dict(label=node_labels, pad=12, thickness=14),
+        link=dict(source=sources, target=targets, value=values)
+    ))
+    
+    fig.update_layout(title=f'연도별 학습시간 구간 이동 흐름 ({years[0]}~{years[-1]}년)')
+    
+    return fig
+
+def create_cohort_retention_chart(retention_rate, active_threshold=20):
+    """최초 학습 연도 코호트별 학습 지속률 히트맵"""
+    if retention_rate is None or retention_rate.empty:
+        return None
+    
+    fig = go.Figure(data=go.Heatmap(
+        z=retention_rate.values,
+        x=[str(year) for year in retention_rate.columns],
+        y=[f"{cohort}년 코호트" for cohort in retention_rate.index],
+        text=retention_rate.values,
+        texttemplate='%{text:.1f}%',
+        colorscale='Greens',
+        zmin=0,
+        zmax=100,
+        hovertemplate='%{y}<br>%{x}년 지속률: %{z:.1f}%<extra></extra>',
+        colorbar=dict(title='지속률 (%)')
+    ))
+    
+    fig.update_layout(
+        title=f'코호트별 학습 지속률 (연 {active_threshold:g}시간 이상 학습 비율)',
+        xaxis_title='연도',
+        yaxis_title='최초 학습 연도',
+        yaxis=dict(autorange='reversed')
+    )
+    
+    return fig
+
+# 개인별 산점도 브라우저 표시 점 수 상한 (초과 시 서버측 샘플링 + 밀도 표시)
+LEARNER_SCATTER_POINT_BUDGET = 20000
+LEARNER_SCATTER_DENSITY_BINS = 80
+
+CHANGE_GROUP_COLORS = {
+    '지속 저학습군': '#9e9e9e',
+    '지속 고학습군': '#1f77b4',
+    '상승군': '#2ca02c',
+    '하락군': '#d62728',
+    '불규칙군': '#ff7f0e'
+}
+
+def decimate_by_group(df, group_col, point_budget, seed=0):
+    """그룹 비율을 유지하는 층화 샘플링 (소규모 그룹은 최소 인원 보장)"""
+    if len(df) <= point_budget:
+        return df
+    
+    group_sizes = df[group_col].value_counts()
+    min_per_group = max(1, point_budget // (len(group_sizes) * 10))
+    quotas = np.maximum(
+        (group_sizes / len(df) * point_budget).astype(int),
+        np.minimum(group_sizes, min_per_group)
+    )
+    
+    rng = np.random.default_rng(seed)
+    sampled = []
+    for group_name, group_df in df.groupby(group_col, sort=False):
+        quota = int(quotas.get(group_name, 0))
+        if quota >= len(group_df):
+            sampled.append(group_df)
+        elif quota > 0:
+            sampled.append(group_df.iloc[rng.choice(len(group_df), quota, replace=False)])
+    return pd.concat(sampled) if sampled else df.iloc[:0]
+
+def create_learner_scatter_chart(person_df, point_budget=LEARNER_SCATTER_POINT_BUDGET, mode='auto'):
+    """
+    개인별 24년 vs 25년 학습시간 산점도 (WebGL, 변화군별 색상)
+
+    Args:
+        person_df: get_person_change_data() 결과 (24년학습시간, 25년학습시간, 변화군)
+        point_budget: 브라우저로 전송할 최대 점 수
+        mode: 'auto' (상한 초과 시 밀도 + 샘플), 'points' (샘플 점만), 'density' (밀도만)
+    """
+    if person_df is None or person_df.empty:
+        return None
+    
+    x_col, y_col = '24년학습시간', '25년학습시간'
+    total = len(person_df)
+    over_budget = total > point_budget
+    show_density = mode == 'density' or (mode == 'auto' and over_budget)
+    show_points = mode != 'density'
+    
+    # 극단값으로 축이 늘어나지 않도록 99.5 분위수까지 표시
+    axis_max = float(np.nanquantile(person_df[[x_col, y_col]].to_numpy(), 0.995)) * 1.05 or 1.0
+    
+    fig = go.Figure()
+    shown = 0
+    
+    if show_density:
+        # 서버측 2D 히스토그램 → 격자 값만 전송 (원본 좌표 미전송)
+        edges = np.linspace(0, axis_max, LEARNER_SCATTER_DENSITY_BINS + 1)
+        counts, _, _ = np.histogram2d(person_df[x_col], person_df[y_col], bins=[edges, edges])
+        centers = (edges[:-1] + edges[1:]) / 2
+        fig.add_trace(go.Contour(
+            x=centers,
+            y=centers,
+            z=np.log1p(counts.T),
+            customdata=counts.T,
+            colorscale='Greys',
+            showscale=False,
+            contours=dict(coloring='heatmap', showlines=False),
+            opacity=0.6,
+            name='밀도',
+            hovertemplate='24년: %{x:.0f}시간<br>25년: %{y:.0f}시간<br>인원: %{customdata:,.0f}명<extra>밀도</extra>'
+        ))
+    
+    if show_points:
+        plot_df = decimate_by_group(person_df, '변화군', point_budget) if over_budget else person_df
+        shown = len(plot_df)
+        marker_size = 4 if shown > 5000 else 6
+        for group_name in CHANGE_GROUP_COLORS:
+            group_df = plot_df[plot_df['변화군'] == group_name]
+            if group_df.empty:
+                continue
+            fig.add_trace(go.Scattergl(
+                x=group_df[x_col].to_numpy(),
+                y=group_df[y_col].to_numpy(),
+                mode='markers',
+                name=group_name,
+                marker=dict(size=marker_size, color=CHANGE_GROUP_COLORS[group_name], opacity=0.5 if over_budget else 0.7),
+                hovertemplate='24년: %{x:.1f}시간<br>25년: %{y:.1f}시간<extra>' + group_name + '</extra>'
+            ))
+    
+    # 변화 없음 기준선 (y = x)
+    fig.add_shape(type='line', x0=0, y0=0, x1=axis_max, y1=axis_max, line=dict(color='gray', dash='dash'))
+    
+    title = '개인별 학습시간 변화 (24년 vs 25년)'
+    if show_points and over_budget:
+        title += f' - {total:,}명 중 {shown:,}명 샘플 표시'
+    elif not show_points:
+        title += f' - {total:,}명 밀도'
+    
+    fig.update_layout(
+        title=title,
+        xaxis=dict(title='24년 학습시간 (시간)', range=[0, axis_max]),
+        yaxis=dict(title='25년 학습시간 (시간)', range=[0, axis_max]),
+        legend_title='변화군'
+    )
+    
+    return fig
+
@@ -0,0 +1,123 @@
+"""
+코호트 분석 모듈
+최초 학습 연도(코호트)별 학습 지속률 및 평균 학습시간 분석
+"""
+
+import pandas as pd
+import numpy as np
+import yaml
+import os
+from modules.cache_store import load_cached, save_cached, make_cache_key, touch_cached, prune_namespace
+
+CACHE_NAMESPACE = 'cohort'
+
+def load_cohort_config():
+    """코호트 분석 설정 로드"""
+    defaults = {'active_hours_threshold': 20}
+    config_path = 'config.yaml'
+    if os.path.exists(config_path):
+        with open(config_path, 'r', encoding='utf-8') as file:
+            config = yaml.safe_load(file) or {}
+            defaults.update(config.get('cohort_analysis', {}) or {})
+    return defaults
+
+def compute_cohort_tables(df, active_threshold=20):
+    """
+    최초 학습 연도 코호트 × 연도 지속률/평균 학습시간 테이블 계산
+
+    Args:
+        df: 개인별 학습 전체 raw (개인ID, 연도, 학습시간, 멤버사명(선택))
+        active_threshold: 지속 학습으로 인정하는 연간 학습시간 (시간)
+
+    Returns:
+        {'years': [...],
+         'cohort_size': Series, 'retention_count': DataFrame,
+         'retention_rate': DataFrame, 'mean_hours': DataFrame,
+         'by_company': {동일 구조, 인덱스 = (멤버사명, 코호트)}}
+        코호트 이전 연도는 NaN
+    """
+    if df is None or df.empty:
+        return None
+    if not all(col in df.columns for col in ['개인ID', '연도', '학습시간']):
+        return None
+
+    # 개인별 연도별 학습시간 피벗 (미학습 연도는 0)
+    pivot_df = df.pivot_table(
+        index='개인ID',
+        columns='연도',
+        values='학습시간',
+        aggfunc='sum'
+    ).fillna(0)
+
+    years = sorted([y for y in pivot_df.columns if isinstance(y, (int, np.integer)) and y >= 2022])
+    if not years:
+        return None
+    pivot_df = pivot_df[years]
+
+    # 최초 학습 연도 = 학습시간 > 0 인 첫 연도 (학습 이력이 없는 인원은 제외)
+    hours = pivot_df.to_numpy()
+    learned = hours > 0
+    has_learned = learned.any(axis=1)
+    first_year = np.asarray(years)[learned.argmax(axis=1)]
+
+    hours_df = pivot_df[has_learned]
+    cohort = pd.Series(first_year[has_learned], index=hours_df.index, name='코호트')
+    active_df = (hours_df >= active_threshold).astype(int)
+
+    # 코호트 이전 연도 마스크
+    before_cohort = np.asarray(years)[None, :] < cohort.to_numpy()[:, None]
+
+    def _build_tables(keys):
+        size = hours_df.groupby(keys).size().rename('인원수')
+        count = active_df.mask(before_cohort).groupby(keys).sum(min_count=1)
+        mean_hours = hours_df.mask(before_cohort).groupby(keys).mean().round(1)
+        rate = (count.div(size, axis=0) * 100).round(1)
+        return {
+            'cohort_size': size,
+            'retention_count': count,
+            'retention_rate': rate,
+            'mean_hours': mean_hours
+        }
+
+    result = {'years': years, 'active_threshold': active_threshold}
+    result.update(_build_tables(cohort))
+
+    result['by_company'] = None
+    if '멤버사명' in df.columns:
+        company = df.groupby('개인ID')['멤버사명'].first().reindex(hours_df.index)
+        result['by_company'] = _build_tables([company.rename('멤버사명'), cohort])
+
+    return result
+
+def select_company_tables(cohort_tables, company):
+    """멤버사별 코호트 테이블 추출 (company 가 None 이면 전체)"""
+    if cohort_tables is None:
+        return None
+    if not company:
+        return cohort_tables
+    by_company = cohort_tables.get('by_company')
+    if by_company is None or company not in by_company['cohort_size'].index.get_level_values(0):
+        return None
+    selected = {key: value.xs(company, level=0) for key, value in by_company.items()}
+    selected['years'] = cohort_tables['years']
+    selected['active_threshold'] = cohort_tables['active_threshold']
+    return selected
+
+def get_cohort_tables(df, dataset_version, active_threshold=None):
+    """데이터셋 버전별 디스크 캐시된 코호트 테이블"""
+    if active_threshold is None:
+        active_threshold = load_cohort_config()['active_hours_threshold']
+    if dataset_version is None:
+        return compute_cohort_tables(df, active_threshold)
+
+    key = make_cache_key(dataset_version, active_threshold)
+    cached = load_cached(CACHE_NAMESPACE, key)
+    if cached is not None:
+        touch_cached(CACHE_NAMESPACE, key)
+        return cached
+
+    tables = compute_cohort_tables(df, active_threshold)
+    if tables is not None:
+        save_cached(CACHE_NAMESPACE, key, tables)
+        prune_namespace(CACHE_NAMESPACE)
+    return tables
@@ -6,6 +6,7 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
+import hashlib
 
 def get_annual_learning_data():
     """그룹/멤버사 연간 학습시간 데이터 로드"""
@@ -99,3 +100,39 @@ def get_company_list():
         return sorted(df['멤버사명'].unique().tolist())
     return []
 
+
+def compute_dataset_version(uploaded_data):
+    """업로드 데이터 내용 기반 버전 해시 계산 (캐시 키용)"""
+    if not uploaded_data:
+        return None
+    hasher = hashlib.sha1()
+    for key in sorted(k for k in uploaded_data.keys() if not k.endswith('_info')):
+        df = uploaded_data[key]
+        if not isinstance(df, pd.DataFrame):
+            continue
+        hasher.update(key.encode('utf-8'))
+        hasher.update('|'.join(map(str, df.columns)).encode('utf-8'))
+        hasher.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    return hasher.hexdigest()[:16]
+
+def set_session_data(uploaded_data):
+    """
+    세션 데이터 교체 (완성된 새 딕셔너리와 버전을 한 번에 지정)
+
+    작업 스레드가 기존 딕셔너리를 직접 수정하면 fragment 재실행이 일부만 바뀐 데이터로 만든 결과를
+    이전 버전 캐시 키로 저장할 수 있으므로, 새 딕셔너리를 완성한 뒤 참조만 교체
+
+    Returns:
+        새 데이터셋 버전
+    """
+    version = compute_dataset_version(uploaded_data)
+    st.session_state.update({'uploaded_data': uploaded_data, 'data_version': version})
+    return version
+
+def get_dataset_version():
+    """현재 세션 데이터셋 버전 (업로드 시 갱신, 없으면 계산 후 저장)"""
+    if 'uploaded_data' not in st.session_state or not st.session_state.uploaded_data:
+        return None
+    if not st.session_state.get('data_version'):
+        st.session_state['data_version'] = compute_dataset_version(st.session_state.uploaded_data)
+    return st.session_state['data_version']
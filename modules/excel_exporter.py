@@ -0,0 +1,104 @@
+"""
+Excel 리포트 내보내기 모듈
+분석 표(조직/직책 통계, 변화군 통계, 멤버사 평균, Matrix 데이터)를 하나의 통합 문서로 저장
+
+- xlsxwriter constant_memory 모드: 행 단위로 바로 기록하여 대규모 학습자 목록도 메모리 사용량 일정
+- 분석 표는 get_analysis_results() 캐시 결과를 그대로 사용 (재계산 없음)
+"""
+
+import math
+import numpy as np
+import pandas as pd
+from io import BytesIO
+from datetime import datetime
+import xlsxwriter
+from modules.data_loader import get_dataset_version
+from modules.analysis_results import get_analysis_results
+
+# Excel 시트 최대 행 수 (헤더 1행 제외)
+MAX_SHEET_ROWS = 1048575
+
+# (시트 이름, get_analysis_results 키)
+EXCEL_SHEETS = [
+    ('조직별 통계', 'org_stats'),
+    ('직책별 통계', 'position_stats'),
+    ('변화군별 인원', 'change_group_summary'),
+    ('변화군별 통계', 'change_group_stats'),
+    ('멤버사별 평균', 'company_averages'),
+    ('Matrix 데이터', 'matrix'),
+    ('개인별 변화', 'person_changes')
+]
+
+def _cell(value):
+    """셀 값 변환 (결측값 → 빈 셀, numpy 스칼라 → 파이썬 값, 날짜 → 문자열)"""
+    if value is None or value is pd.NA or value is pd.NaT:
+        return None
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and (math.isnan(value) or math.isinf(value)):
+        return None
+    if isinstance(value, (datetime, pd.Timestamp)):
+        return value.isoformat(sep=' ')
+    return value
+
+def _column_width(df, column):
+    """열 너비 (헤더/앞부분 값 길이 기준, constant_memory 에서는 행 기록 전에 지정)"""
+    sample = df[column].head(100).tolist()
+    length = max([len(str(column))] + [len(str(value)) for value in sample])
+    return min(max(length * 1.6 + 2, 8), 50)
+
+def _write_sheet(workbook, sheet_name, df, header_format, number_format):
+    """DataFrame → 시트 (행 순서대로 기록, 최대 행 수 초과 시 이어지는 시트로 분할)"""
+    columns = [str(column) for column in df.columns]
+    numeric = [pd.api.types.is_float_dtype(df[column]) for column in df.columns]
+    chunks = range(0, max(len(df), 1), MAX_SHEET_ROWS)
+    for part, start in enumerate(chunks, start=1):
+        name = sheet_name if part == 1 else f"{sheet_name} ({part})"
+        worksheet = workbook.add_worksheet(name[:31])
+        for col, column in enumerate(df.columns):
+            worksheet.set_column(col, col, _column_width(df, column), number_format if numeric[col] else None)
+        worksheet.freeze_panes(1, 0)
+        worksheet.write_row(0, 0, columns, header_format)
+        for row, values in enumerate(df.iloc[start:start + MAX_SHEET_ROWS].itertuples(index=False, name=None), start=1):
+            worksheet.write_row(row, 0, [_cell(value) for value in values])
+
+def write_excel_report(tables):
+    """
+    분석 표 → Excel bytes
+
+    Args:
+        tables: [(시트 이름, DataFrame)] - None 또는 빈 표는 건너뜀
+
+    Returns:
+        xlsx bytes (기록할 표가 없으면 None)
+    """
+    tables = [(name, df) for name, df in tables if df is not None and not df.empty]
+    if not tables:
+        return None
+
+    buffer = BytesIO()
+    workbook = xlsxwriter.Workbook(buffer, {'constant_memory': True})
+    header_format = workbook.add_format({'bold': True, 'bg_color': '#DCE6F1', 'border': 1})
+    number_format = workbook.add_format({'num_format': '#,##0.0'})
+    for name, df in tables:
+        _write_sheet(workbook, name, df, header_format, number_format)
+    workbook.close()
+    return buffer.getvalue()
+
+def create_excel_report(company=None, dataset_version=None):
+    """현재 세션 데이터의 분석 표 Excel 생성 (company 지정 시 조직/직책/변화군 표는 해당 멤버사 기준)"""
+    results = get_analysis_results(dataset_version or get_dataset_version(), company)
+    return write_excel_report([(name, results.get(key)) for name, key in EXCEL_SHEETS])
+
+def build_excel_report_job(progress, company=None):
+    """작업 큐용 Excel 리포트 생성"""
+    progress(0.1, "분석 결과 수집 중")
+    excel_bytes = create_excel_report(company)
+    if excel_bytes is None:
+        raise ValueError("내보낼 분석 결과가 없습니다.")
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return {
+        'data': excel_bytes,
+        'file_name': f"Learning_Analysis_{company or '전체'}_{timestamp}.xlsx",
+        'mime': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+    }
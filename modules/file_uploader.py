@@ -5,6 +5,8 @@
 
 import streamlit as st
 import pandas as pd
+import os
+from modules.data_loader import set_session_data
 
 # 파일 타입 정의 (요청하신 10개 파일명에 맞춘 권장 파일명 및 필수 컬럼 반영)
 FILE_TYPES = {
@@ -205,10 +207,21 @@ def render_file_upload_main():
     with col2:
         if uploaded_files:
             if st.button("📥 파일 데이터 로드", type="primary", use_container_width=True):
-                save_to_session(uploaded_files)
+                # 대용량 파일은 백그라운드 작업으로 로드 (화면 이동 시에도 유지)
+                from modules.job_queue import submit_session_job
+                st.session_state['upload_job_id'] = submit_session_job(
+                    'upload', load_files_job, uploaded_files, label="파일 데이터 로드"
+                )
+            if st.session_state.get('upload_job_id'):
                 # 업로드 후 자동으로 홈으로 이동하지 않음 (요청 반영)
-                # 현재 화면 유지, 성공 메시지만 표기
-                st.success("파일 로드 완료! 좌측 '📈 리포트 조회'에서 결과를 확인하세요.")
+                # 현재 화면 유지, 완료 시 안내 메시지만 표기
+                from modules.job_queue import render_job_status, STATUS_DONE
+                job = render_job_status(st.session_state['upload_job_id'], key_prefix='upload')
+                if job and job['status'] == STATUS_DONE:
+                    st.success("파일 로드 완료! 좌측 '📈 리포트 조회'에서 결과를 확인하세요.")
+                    if st.session_state.get('precompute_job_id'):
+                        st.caption("멤버사별 AI 인사이트를 백그라운드에서 미리 생성하고 있습니다.")
+                        render_job_status(st.session_state['precompute_job_id'], key_prefix='precompute', show_text=False)
         else:
             st.info("파일을 업로드한 후 '파일 데이터 로드' 버튼을 클릭하세요")
     
@@ -271,12 +284,24 @@ def validate_file_structure(df, required_columns):
         return False, f"필수 컬럼이 누락되었습니다: {', '.join(missing_columns)}"
     return True, "검증 완료"
 
-def save_to_session(uploaded_files):
-    """업로드된 파일들을 세션에 저장"""
-    if 'uploaded_data' not in st.session_state:
-        st.session_state.uploaded_data = {}
+def save_to_session(uploaded_files, progress=None, replace=False):
+    """
+    업로드된 파일들을 세션에 저장 (progress(비율, 메시지) 지정 시 파일별 진행률 보고)
+
+    새 딕셔너리에 모두 읽은 뒤 데이터와 데이터셋 버전을 함께 교체 (작업 스레드에서 실행해도 화면은 이전/새 데이터 중 하나만 봄)
+
+    Args:
+        replace: 기존 세션 데이터를 버리고 이번 파일로만 구성 (False 면 기존 데이터에 추가/교체)
+
+    Returns:
+        (로드된 파일 종류 키 목록, 검증 실패 메시지 목록) - 화면 표시는 호출한 쪽에서
+    """
+    uploaded_data = {} if replace else dict(st.session_state.get('uploaded_data') or {})
+    loaded, warnings = [], []
     
-    for file_key, file_data in uploaded_files.items():
+    for file_idx, (file_key, file_data) in enumerate(uploaded_files.items()):
+        if progress is not None:
+            progress(file_idx / max(len(uploaded_files), 1), f"{file_data['info']['name']} 로드 중")
         df = load_uploaded_file(file_data['file'], file_key)
         if df is not None:
             original_columns = list(df.columns)
@@ -303,8 +328,72 @@ def save_to_session(uploaded_files):
                 except Exception:
                     pass
 
-                st.session_state.uploaded_data[file_key] = df_norm
-                st.session_state.uploaded_data[f"{file_key}_info"] = file_data['info']
+                uploaded_data[file_key] = df_norm
+                uploaded_data[f"{file_key}_info"] = file_data['info']
+                loaded.append(file_key)
             else:
-                st.warning(f"{file_data['info']['name']}: {message}")
+                warnings.append(f"{file_data['info']['name']}: {message}")
+    
+    # 데이터와 데이터셋 버전(분석 캐시 무효화 기준)을 함께 교체
+    set_session_data(uploaded_data)
+    return loaded, warnings
+
+def load_files_job(progress, uploaded_files):
+    """
+    작업 큐용 파일 데이터 로드 (세션에 저장)
+
+    config.yaml 의 insights.precompute_after_upload 가 켜져 있으면
+    로드 후 전체 + 멤버사별 AI 인사이트 사전 생성 작업을 이어서 등록,
+    analytics_api.publish_after_upload 가 켜져 있으면(기본값 꺼짐) 분석 API 용 분석 요약 게시 작업도 등록
+    """
+    loaded, warnings = save_to_session(uploaded_files, progress)
+    summary = f"{len(loaded)}개 파일 로드 완료"
+    
+    from modules.gemini_insights import load_insight_config, precompute_insights_job
+    if loaded and load_insight_config().get('precompute_after_upload', False):
+        from modules.job_queue import submit_session_job
+        st.session_state['precompute_job_id'] = submit_session_job(
+            'insight', precompute_insights_job, label="AI 인사이트 사전 생성"
+        )
+        summary += " (AI 인사이트 사전 생성 시작)"
+    
+    from modules.analytics_store import load_analytics_config, publish_analytics_job
+    if loaded and load_analytics_config().get('publish_after_upload', False):
+        from modules.job_queue import submit_session_job
+        from modules.insight_metrics import get_current_username
+        st.session_state['analytics_publish_job_id'] = submit_session_job(
+            'analytics', publish_analytics_job, source='upload', published_by=get_current_username(),
+            label="분석 요약 게시"
+        )
+    return {'summary': summary, 'warnings': warnings}
+
+def find_data_files(data_dir):
+    """데이터 디렉토리에서 파일 종류별 원본 파일 경로 찾기 (권장 파일명 기준, .xlsx 우선 / .csv)"""
+    found = {}
+    if not data_dir or not os.path.isdir(data_dir):
+        return found
+    for file_key, file_info in FILE_TYPES.items():
+        base_name = os.path.splitext(file_info['expected_filename'])[0]
+        for ext in ['.xlsx', '.csv']:
+            file_path = os.path.join(data_dir, base_name + ext)
+            if os.path.exists(file_path):
+                found[file_key] = file_path
+                break
+    return found
+
+def load_data_directory(data_dir):
+    """
+    데이터 디렉토리의 원본 파일을 세션에 로드 (업로드와 동일한 컬럼 표준화/검증 적용)
+
+    기존 세션 데이터는 디렉토리 내용으로 교체
+
+    Returns:
+        로드된 파일 종류 키 목록
+    """
+    data_files = find_data_files(data_dir)
+    loaded, _ = save_to_session({
+        file_key: {'file': file_path, 'info': FILE_TYPES[file_key]}
+        for file_key, file_path in data_files.items()
+    }, replace=True)
+    return loaded
 
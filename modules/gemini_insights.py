@@ -3,12 +3,50 @@ Google Gemini AI 인사이트 생성 모듈
 """
 
 import streamlit as st
-from google import genai
-from google.genai import types
 import os
+import json
+import time
+import asyncio
+import yaml
+import pandas as pd
+from modules.cache_store import (
+    make_cache_key, load_cached, save_cached, delete_cached, touch_cached, count_cached, prune_cache
+)
+from modules.data_loader import get_dataset_version, get_company_list
+from modules.analysis_results import get_analysis_results, get_analysis_table
+from modules.eda_analyzer import get_enhanced_eda_summary
+from modules.prompt_compactor import compact_stats, fit_text_to_budget, estimate_tokens, format_prompt_metrics
+from modules.rule_insights import build_rule_insights, RULE_INSIGHT_TABLES
+from modules.insight_metrics import (
+    record_insight_call, SOURCE_API, SOURCE_CACHE, SOURCE_COALESCED, SOURCE_ERROR
+)
+from modules.gemini_pool import (
+    load_gemini_config, get_pooled_client, call_with_retry, call_with_retry_async, coalesce, coalesce_async,
+    join_inflight, finish_inflight, wait_inflight, loop_client
+)
+
+GEMINI_MODEL = "gemini-2.5-flash"
+INSIGHT_NAMESPACE = 'insights'
+
+# 생성 설정 (캐시 키에 포함)
+CHART_GENERATION_CONFIG = {'max_output_tokens': 2000, 'temperature': 0.7}
+EDA_GENERATION_CONFIG = {'max_output_tokens': 4000, 'temperature': 0.7}
+
+# EDA 분석 타입 → 리포트 인사이트 키 (PDF 섹션)
+EDA_INSIGHT_KEYS = {
+    '조직별': 'organization',
+    '직책별': 'position',
+    '개인별': 'individual',
+    '변화군별': 'change_group'
+}
+
+# 차트 인사이트 (리포트 인사이트 키 → 차트 설명)
+CHART_INSIGHT_DESCRIPTIONS = {
+    'learning_time': "그룹/각 사별 인당 평균 학습시간 Matrix (X: 전년 대비 변화율(%), Y: 올해 인당 평균 학습시간)"
+}
 
 def get_gemini_client():
-    """Gemini 클라이언트 초기화"""
+    """Gemini 클라이언트 (프로세스 공용 - API 키별 1개 재사용)"""
     # 우선순위: Streamlit secrets → 환경변수(폴백)
     api_key = None
     try:
@@ -17,49 +55,249 @@ def get_gemini_client():
         pass
     if not api_key:
         api_key = os.getenv('GEMINI_API_KEY')
+
+    # 로컬 대체 서버 (gemini_stub_server.py) 지정 시 API 키 없이도 사용
+    base_url = load_gemini_config().get('base_url')
+    if base_url:
+        from google.genai import types
+        return get_pooled_client(api_key or 'local-stub', http_options=types.HttpOptions(base_url=base_url))
     if not api_key:
         return None
-    return genai.Client(api_key=api_key)
+    return get_pooled_client(api_key)
+
+def _content_config(generation_config):
+    """생성 설정 딕셔너리 → GenerateContentConfig (google.genai 는 AI 호출 시에만 임포트)"""
+    from google.genai import types
+    return types.GenerateContentConfig(**generation_config)
+
+def load_insight_config():
+    """인사이트 캐시 설정 로드 (config.yaml 의 insights 섹션)"""
+    defaults = {
+        'cache_ttl_hours': 168,
+        'cache_max_items': 1000,
+        'max_concurrency': 4,
+        'prompt_token_budget': 1200,
+        'streaming': True,
+        'rule_draft': True,
+        'rule_fallback': True,
+        'precompute_after_upload': False,
+        'precompute_concurrency': 2
+    }
+    config_path = 'config.yaml'
+    if os.path.exists(config_path):
+        with open(config_path, 'r', encoding='utf-8') as file:
+            config = yaml.safe_load(file) or {}
+            defaults.update(config.get('insights', {}) or {})
+    return defaults
+
+def get_insight_cache_key(model, system_instruction, prompt, generation_config):
+    """인사이트 캐시 키 (모델 + 시스템 지시문 + 프롬프트 + 생성 설정)"""
+    return make_cache_key(
+        model, system_instruction, prompt, json.dumps(generation_config, sort_keys=True, ensure_ascii=False)
+    )
+
+def get_cached_insight(cache_key):
+    """캐시된 인사이트 텍스트 (없거나 만료되었으면 None)"""
+    entry = load_cached(INSIGHT_NAMESPACE, cache_key)
+    if entry is None:
+        return None
+    ttl_seconds = float(load_insight_config()['cache_ttl_hours']) * 3600
+    if time.time() - entry.get('created_at', 0) > ttl_seconds:
+        delete_cached(INSIGHT_NAMESPACE, cache_key)
+        return None
+    touch_cached(INSIGHT_NAMESPACE, cache_key)
+    return entry.get('text')
 
-def generate_chart_insight(client, chart_description, stats_data=None):
+def save_insight(cache_key, text, model=GEMINI_MODEL):
+    """인사이트 캐시 저장 후 만료/초과 항목 정리 (세션 간 공유)"""
+    save_cached(INSIGHT_NAMESPACE, cache_key, {'text': text, 'model': model, 'created_at': time.time()})
+    config = load_insight_config()
+    prune_cache(
+        INSIGHT_NAMESPACE,
+        max_items=int(config['cache_max_items']),
+        max_age_seconds=float(config['cache_ttl_hours']) * 3600
+    )
+
+def _response_text(response):
+    """응답 텍스트 추출"""
+    insight_text = getattr(response, 'text', None)
+    if not insight_text:
+        try:
+            insight_text = response.candidates[0].content.parts[0].text
+        except Exception:
+            insight_text = None
+    return insight_text
+
+def _usage_tokens(response, contents, insight_text=None):
+    """(프롬프트 토큰, 출력 토큰) - 응답에 사용량 정보가 없으면 추정값"""
+    usage = getattr(response, 'usage_metadata', None)
+    prompt_tokens = getattr(usage, 'prompt_token_count', None) or estimate_tokens(contents)
+    output_tokens = getattr(usage, 'candidates_token_count', None) or estimate_tokens(insight_text)
+    return prompt_tokens, output_tokens
+
+def generate_insight_text(client, system_instruction, prompt, generation_config, model=GEMINI_MODEL, section=None):
     """
-    차트/그래프 인사이트 생성
-    
-    Args:
-        client: Gemini 클라이언트
-        chart_description: 차트 설명 텍스트
-        stats_data: 통계 데이터 (딕셔너리 또는 문자열)
+    Gemini 텍스트 생성 (디스크 캐시 우선 - 같은 요청은 재호출하지 않음)
+
+    진행 중인 같은 요청이 있으면 그 결과를 함께 사용, 429/5xx 는 백오프 후 재시도
+    호출마다 사용량(캐시 적중, 토큰, 지연 시간, 오류)을 section 이름으로 기록
+
+    Returns:
+        인사이트 텍스트 (캐시에 없고 client 가 None 이면 None, 모델 응답이 비어 있으면 RuntimeError)
     """
+    started_at = time.perf_counter()
+    contents = f"{system_instruction}\n\n{prompt}"
+    cache_key = get_insight_cache_key(model, system_instruction, prompt, generation_config)
+    cached = get_cached_insight(cache_key)
+    if cached:
+        record_insight_call(section, 'sync', model, SOURCE_CACHE, estimate_tokens(contents), 0, started_at)
+        return cached
     if client is None:
         return None
     
+    executed = []
+    
+    def request():
+        executed.append(True)
+        # 병합 대기 직전에 끝난 같은 요청 결과 확인
+        cached = get_cached_insight(cache_key)
+        if cached:
+            record_insight_call(section, 'sync', model, SOURCE_CACHE, estimate_tokens(contents), 0, started_at)
+            return cached
+        try:
+            response = call_with_retry(lambda: client.models.generate_content(
+                model=model,
+                contents=contents,
+                config=_content_config(generation_config)
+            ))
+            insight_text = _response_text(response)
+            if not insight_text:
+                raise RuntimeError("인사이트 생성에 실패했습니다.")
+        except Exception as e:
+            record_insight_call(section, 'sync', model, SOURCE_ERROR, estimate_tokens(contents), 0, started_at, error=e)
+            raise
+        record_insight_call(section, 'sync', model, SOURCE_API, *_usage_tokens(response, contents, insight_text), started_at)
+        save_insight(cache_key, insight_text, model)
+        return insight_text
+    
     try:
-        system_instruction = (
-            "당신은 전문적인 데이터 분석가입니다. "
-            "학습 데이터를 분석하여 명확하고 실행 가능한 인사이트를 제공해야 합니다. "
-            "한국어로 작성하며, 수치에는 단위를 포함하고, 핵심 트렌드와 패턴을 명확히 설명하세요."
-        )
-        
-        prompt = f"""
+        insight_text = coalesce(cache_key, request)
+    except Exception as e:
+        if not executed:
+            record_insight_call(section, 'sync', model, SOURCE_ERROR, 0, 0, started_at, error=e)
+        raise
+    if not executed:
+        record_insight_call(section, 'sync', model, SOURCE_COALESCED, 0, 0, started_at)
+    return insight_text
+
+def generate_insight_stream(client, system_instruction, prompt, generation_config, model=GEMINI_MODEL, section=None):
+    """
+    Gemini 스트리밍 텍스트 생성 (부분 텍스트를 도착 순서대로 yield)
+
+    캐시된 결과는 한 번에 yield, 끝까지 받은 전체 텍스트는 캐시에 저장
+    같은 요청이 진행 중이면 그 요청이 끝난 뒤 전체 텍스트를 한 번에 yield
+    """
+    started_at = time.perf_counter()
+    contents = f"{system_instruction}\n\n{prompt}"
+    cache_key = get_insight_cache_key(model, system_instruction, prompt, generation_config)
+    cached = get_cached_insight(cache_key)
+    if cached:
+        record_insight_call(section, 'stream', model, SOURCE_CACHE, estimate_tokens(contents), 0, started_at)
+        yield cached
+        return
+    if client is None:
+        raise ValueError("Gemini API 키가 설정되지 않았습니다.")
+    
+    future, leader = join_inflight(cache_key)
+    if not leader:
+        try:
+            insight_text = wait_inflight(cache_key, future)
+        except Exception as e:
+            record_insight_call(section, 'stream', model, SOURCE_ERROR, 0, 0, started_at, error=e)
+            raise
+        record_insight_call(section, 'stream', model, SOURCE_COALESCED, 0, 0, started_at)
+        if insight_text:
+            yield insight_text
+        return
+    
+    def open_stream():
+        # 첫 응답까지 받아야 요청 성공 여부를 알 수 있으므로 재시도 범위에 포함
+        stream = iter(client.models.generate_content_stream(
+            model=model,
+            contents=contents,
+            config=_content_config(generation_config)
+        ))
+        return next(stream, None), stream
+    
+    chunks = []
+    last_chunk = None
+    try:
+        first, stream = call_with_retry(open_stream)
+        for chunk in ([first] if first is not None else []):
+            last_chunk = chunk
+            if getattr(chunk, 'text', None):
+                chunks.append(chunk.text)
+                yield chunk.text
+        for chunk in stream:
+            last_chunk = chunk
+            text = getattr(chunk, 'text', None)
+            if text:
+                chunks.append(text)
+                yield text
+    except BaseException as e:
+        # 오류 또는 화면 이탈로 중단된 경우 대기 중인 같은 요청도 실패 처리
+        error = e if isinstance(e, Exception) else RuntimeError("스트리밍이 중단되었습니다.")
+        record_insight_call(section, 'stream', model, SOURCE_ERROR, estimate_tokens(contents), 0, started_at, error=error)
+        finish_inflight(cache_key, future, error=error)
+        raise
+    
+    insight_text = ''.join(chunks)
+    # 사용량 정보는 마지막 청크에 누적값으로 포함
+    record_insight_call(section, 'stream', model, SOURCE_API, *_usage_tokens(last_chunk, contents, insight_text), started_at)
+    if insight_text:
+        save_insight(cache_key, insight_text, model)
+    finish_inflight(cache_key, future, result=insight_text)
+
+def _draft_prompt_section(draft):
+    """규칙 기반 초안 프롬프트 부분 (초안이 없으면 빈 문자열)"""
+    if not draft:
+        return ""
+    return f"""
+규칙 기반 자동 요약 (통계에서 직접 계산한 초안):
+{draft}
+
+위 초안의 수치는 검증된 값이므로 그대로 사용하고, 초안을 바탕으로 해석과 제안을 보완하세요.
+"""
+
+def build_chart_insight_prompt(chart_description, stats_data=None, draft=None):
+    """차트 인사이트 (시스템 지시문, 프롬프트) - draft 가 있으면 규칙 기반 초안을 다듬도록 요청"""
+    system_instruction = (
+        "당신은 전문적인 데이터 분석가입니다. "
+        "학습 데이터를 분석하여 명확하고 실행 가능한 인사이트를 제공해야 합니다. "
+        "한국어로 작성하며, 수치에는 단위를 포함하고, 핵심 트렌드와 패턴을 명확히 설명하세요."
+    )
+    
+    prompt = f"""
 다음은 학습 데이터 분석 결과입니다:
 
 {chart_description}
 
 """
+    
+    if stats_data:
+        if isinstance(stats_data, dict):
+            stats_text = "\n".join([f"- {k}: {v}" for k, v in stats_data.items()])
+        else:
+            stats_text = str(stats_data)
         
-        if stats_data:
-            if isinstance(stats_data, dict):
-                stats_text = "\n".join([f"- {k}: {v}" for k, v in stats_data.items()])
-            else:
-                stats_text = str(stats_data)
-            
-            prompt += f"""
+        prompt += f"""
 통계 데이터:
 {stats_text}
 
 """
-        
-        prompt += """
+    
+    prompt += _draft_prompt_section(draft)
+    prompt += """
 위 데이터를 바탕으로 다음을 포함한 분석 인사이트를 작성해주세요:
 1. 주요 트렌드 및 패턴 요약
 2. 눈에 띄는 특징이나 이상치
@@ -68,59 +306,49 @@ def generate_chart_insight(client, chart_description, stats_data=None):
 
 간결하고 명확하게 작성해주세요.
 """
-        
-        response = client.models.generate_content(
-            model="gemini-2.5-flash",
-            contents=f"{system_instruction}\n\n{prompt}",
-            config=types.GenerateContentConfig(
-                max_output_tokens=2000,
-                temperature=0.7
-            )
-        )
-        
-        # 텍스트 추출
-        insight_text = getattr(response, 'text', None)
-        if not insight_text:
-            try:
-                insight_text = response.candidates[0].content.parts[0].text
-            except Exception:
-                insight_text = "인사이트 생성에 실패했습니다."
-        
-        return insight_text
-    
-    except Exception as e:
-        st.error(f"Gemini API 호출 중 오류: {str(e)}")
-        return None
+    return system_instruction, prompt
 
-def generate_eda_insight(client, analysis_type, stats_data):
+def generate_chart_insight(client, chart_description, stats_data=None, section='chart'):
     """
-    EDA 분석 인사이트 생성 - 상세한 탐색적 데이터 분석
+    차트/그래프 인사이트 생성 (캐시된 결과가 있으면 재사용)
     
     Args:
         client: Gemini 클라이언트
-        analysis_type: 분석 타입 ('조직별', '직책별', '개인별', '변화군별')
-        stats_data: 통계 데이터 (DataFrame 또는 문자열)
+        chart_description: 차트 설명 텍스트
+        stats_data: 통계 데이터 (딕셔너리 또는 문자열)
+        section: 사용량 기록용 섹션 이름
     """
-    if client is None:
+    try:
+        system_instruction, prompt = build_chart_insight_prompt(chart_description, stats_data)
+        return generate_insight_text(client, system_instruction, prompt, CHART_GENERATION_CONFIG, section=section)
+    
+    except Exception as e:
+        st.error(f"Gemini API 호출 중 오류: {str(e)}")
         return None
+
+def stream_chart_insight(client, chart_description, stats_data=None, section='chart'):
+    """차트 인사이트 스트리밍 생성 (st.write_stream 용)"""
+    system_instruction, prompt = build_chart_insight_prompt(chart_description, stats_data)
+    yield from generate_insight_stream(client, system_instruction, prompt, CHART_GENERATION_CONFIG, section=section)
+
+def build_eda_insight_prompt(analysis_type, stats_data, draft=None):
+    """EDA 인사이트 (시스템 지시문, 프롬프트) - draft 가 있으면 규칙 기반 초안을 다듬도록 요청"""
+    system_instruction = (
+        "당신은 전문적인 데이터 분석가입니다. "
+        "탐색적 데이터 분석(EDA) 결과를 바탕으로 조직의 학습 특징을 깊이 있게 분석하고 실행 가능한 인사이트를 제공해야 합니다. "
+        "각 그룹의 특징, 학습 패턴, 그룹 간 차이점을 구체적으로 설명하고, 어떤 사람들이 어떤 학습을 많이 하는지 분석하세요."
+    )
     
-    try:
-        system_instruction = (
-            "당신은 전문적인 데이터 분석가입니다. "
-            "탐색적 데이터 분석(EDA) 결과를 바탕으로 조직의 학습 특징을 깊이 있게 분석하고 실행 가능한 인사이트를 제공해야 합니다. "
-            "각 그룹의 특징, 학습 패턴, 그룹 간 차이점을 구체적으로 설명하고, 어떤 사람들이 어떤 학습을 많이 하는지 분석하세요."
-        )
-        
-        analysis_prompts = {
-            '조직별': """조직별 학습 특징을 상세히 분석하세요:
+    analysis_prompts = {
+        '조직별': """조직별 학습 특징을 상세히 분석하세요:
 - 각 조직(사업부)의 학습 패턴과 특징
 - 어떤 조직이 어떤 종류의 학습을 선호하는지
 - 조직 간 학습 문화의 차이점
 - 조직별 학습자들의 특성 (직책 분포, 연령대, 직무 등)
 - 학습 효과가 높은 조직의 특징
 - 조직 간 학습 격차와 그 원인""",
-            
-            '직책별': """직책별 학습 특징을 상세히 분석하세요 (임원, 팀장, 구성원 순서로):
+        
+        '직책별': """직책별 학습 특징을 상세히 분석하세요 (임원, 팀장, 구성원 순서로):
 - 각 직책별 학습 시간과 패턴
 - 임원/팀장/구성원의 학습 목적과 특성 차이
 - 리더십 학습 문화와 그 효과
@@ -128,16 +356,16 @@ def generate_eda_insight(client, analysis_type, stats_data):
 - 직책별 Badge 취득률과 학습 완료률
 - 고성과 학습자의 직책별 특징
 - 리더의 학습이 조직에 미치는 영향""",
-            
-            '개인별': """개인별 학습 분포를 상세히 분석하세요:
+        
+        '개인별': """개인별 학습 분포를 상세히 분석하세요:
 - 저학습자와 고학습자의 명확한 특징 차이
 - 고학습자의 학습 패턴과 동기
 - 저학습자의 학습 장벽과 특성
 - 학습 시간 분포의 의미와 비즈니스 인사이트
 - 개인별 학습 성과의 영향 요인
 - 학습 활성화를 위한 개선 방안""",
-            
-            '변화군별': """학습시간 변화군을 상세히 분석하세요:
+        
+        '변화군별': """학습시간 변화군을 상세히 분석하세요:
 - 각 변화군(지속 저학습군, 지속 고학습군, 상승군, 하락군)의 특징
 - 변화군별 학습자들의 속성 (직책, 연령대, 직무 등)
 - 변화 패턴의 원인과 의미
@@ -145,19 +373,19 @@ def generate_eda_insight(client, analysis_type, stats_data):
 - 상승군의 성공 요인
 - 하락군의 학습 저하 원인 추론
 - 변화군별 맞춤형 학습 전략"""
-        }
-        
-        # 통계 데이터를 문자열로 변환
-        if isinstance(stats_data, pd.DataFrame):
-            stats_text = stats_data.to_string(index=False)
-        else:
-            stats_text = str(stats_data)
-        
-        prompt = f"""
+    }
+    
+    # 통계 데이터를 문자열로 변환
+    if isinstance(stats_data, pd.DataFrame):
+        stats_text = stats_data.to_string(index=False)
+    else:
+        stats_text = str(stats_data)
+    
+    prompt = f"""
 {analysis_type} 학습 데이터 탐색적 데이터 분석(EDA) 결과:
 
 {stats_text}
-
+{_draft_prompt_section(draft)}
 {analysis_prompts.get(analysis_type, '')}
 
 위 데이터를 바탕으로 다음을 포함한 매우 상세하고 구체적인 분석을 작성해주세요:
@@ -169,26 +397,341 @@ def generate_eda_insight(client, analysis_type, stats_data):
 
 각 섹션을 상세하고 구체적으로 작성하며, 수치와 데이터를 활용하여 설명하세요.
 """
-        
-        response = client.models.generate_content(
-            model="gemini-2.5-flash",
-            contents=f"{system_instruction}\n\n{prompt}",
-            config=types.GenerateContentConfig(
-                max_output_tokens=4000,
-                temperature=0.7
+    
+    return system_instruction, prompt
+
+def _generate_eda_insight_text(client, analysis_type, stats_data, draft=None):
+    """EDA 인사이트 텍스트 생성 (오류는 호출한 쪽에서 처리 - 화면 출력 없음)"""
+    system_instruction, prompt = build_eda_insight_prompt(analysis_type, stats_data, draft)
+    return generate_insight_text(
+        client, system_instruction, prompt, EDA_GENERATION_CONFIG,
+        section=EDA_INSIGHT_KEYS.get(analysis_type, analysis_type)
+    )
+
+def generate_eda_insight(client, analysis_type, stats_data, draft=None):
+    """
+    EDA 분석 인사이트 생성 - 상세한 탐색적 데이터 분석 (캐시된 결과가 있으면 재사용)
+    
+    생성 결과는 인사이트 캐시에 저장되어 같은 데이터/멤버사 PDF 리포트에 포함 (리포트와 같은 프롬프트)
+    
+    Args:
+        client: Gemini 클라이언트
+        analysis_type: 분석 타입 ('조직별', '직책별', '개인별', '변화군별')
+        stats_data: 통계 데이터 (DataFrame 또는 문자열)
+        draft: 규칙 기반 초안 (get_rule_insight 결과, 프롬프트에 포함)
+    """
+    try:
+        insight_text = _generate_eda_insight_text(client, analysis_type, stats_data, draft)
+    
+    except Exception as e:
+        st.error(f"Gemini API 호출 중 오류: {str(e)}")
+        return None
+    return insight_text
+
+def stream_eda_insight(client, analysis_type, stats_data, draft=None):
+    """
+    EDA 인사이트 스트리밍 생성 (st.write_stream 용)
+
+    끝까지 받은 결과는 인사이트 캐시에 저장되어 같은 데이터/멤버사 PDF 리포트에 포함
+    """
+    system_instruction, prompt = build_eda_insight_prompt(analysis_type, stats_data, draft)
+    section = EDA_INSIGHT_KEYS.get(analysis_type, analysis_type)
+    yield from generate_insight_stream(client, system_instruction, prompt, EDA_GENERATION_CONFIG, section=section)
+
+def get_eda_stats_text(analysis_type, dataset_version, company=None, return_metrics=False):
+    """
+    대시보드 AI 분석과 동일한 EDA 통계 텍스트 (분석 결과 캐시 사용)
+
+    통계 표는 config.yaml 의 insights.prompt_token_budget 토큰 이내로 압축
+    (상위/하위 그룹, 평균 대비 차이, 반올림, 값이 같은 열 제거)
+
+    Returns:
+        통계 텍스트 (데이터가 없으면 None), return_metrics 이면 (텍스트, 크기 지표)
+    """
+    # 분석 타입에 해당하는 표만 가져옴 (규칙 인사이트와 같은 표)
+    table_name = RULE_INSIGHT_TABLES.get(EDA_INSIGHT_KEYS.get(analysis_type))
+    results = get_analysis_results(dataset_version, company, tables=(table_name,) if table_name else ())
+    token_budget = int(load_insight_config()['prompt_token_budget'])
+    
+    text, metrics = None, None
+    if analysis_type in ('조직별', '직책별'):
+        stats_df = results['org_stats' if analysis_type == '조직별' else 'position_stats']
+        if stats_df is not None and not stats_df.empty:
+            text, metrics = compact_stats(
+                stats_df, token_budget, render=lambda table: get_enhanced_eda_summary(table, analysis_type)
             )
+    elif analysis_type == '개인별' and results['individual_stats'] is not None:
+        text = "\n".join([
+            f"{k}: {round(v, 1) if isinstance(v, float) else v}" for k, v in results['individual_stats'].items()
+        ])
+    elif analysis_type == '변화군별' and results['change_group_stats'] is not None:
+        text, metrics = compact_stats(results['change_group_stats'], token_budget, value_col=None)
+    
+    if text is not None and metrics is None:
+        original_tokens = estimate_tokens(text)
+        text = fit_text_to_budget(text, token_budget)
+        metrics = {'budget': token_budget, 'original_tokens': original_tokens, 'tokens': estimate_tokens(text)}
+    return (text, metrics) if return_metrics else text
+
+def get_rule_insights(dataset_version, company=None):
+    """
+    규칙 기반 리포트 섹션 인사이트 (분석 결과 캐시 사용, API 호출 없음)
+
+    Returns:
+        {인사이트 키: 마크다운 텍스트}
+    """
+    return build_rule_insights(
+        get_analysis_results(dataset_version, company, tables=tuple(RULE_INSIGHT_TABLES.values()))
+    )
+
+def get_rule_insight(analysis_type, dataset_version, company=None):
+    """분석 타입('조직별' 등)의 규칙 기반 인사이트 (없으면 None, 해당 표만 사용)"""
+    insight_key = EDA_INSIGHT_KEYS.get(analysis_type)
+    if insight_key is None:
+        return None
+    results = get_analysis_results(dataset_version, company, tables=(RULE_INSIGHT_TABLES[insight_key],))
+    return build_rule_insights(results).get(insight_key)
+
+def get_prompt_draft(analysis_type, dataset_version, company=None):
+    """프롬프트에 넣을 규칙 기반 초안 (config.yaml 의 insights.rule_draft 가 꺼져 있으면 None)"""
+    if not load_insight_config().get('rule_draft', True):
+        return None
+    return get_rule_insight(analysis_type, dataset_version, company)
+
+def build_report_insight_requests(dataset_version, company=None):
+    """
+    리포트 전체 섹션 인사이트 요청 목록 (대시보드 버튼과 같은 프롬프트 - 캐시 공유)
+
+    Returns:
+        {인사이트 키: (시스템 지시문, 프롬프트, 생성 설정)} - 데이터가 없는 섹션은 제외
+    """
+    drafts = get_rule_insights(dataset_version, company) if load_insight_config().get('rule_draft', True) else {}
+    requests = {}
+    for analysis_type, insight_key in EDA_INSIGHT_KEYS.items():
+        stats_text = get_eda_stats_text(analysis_type, dataset_version, company)
+        if stats_text:
+            requests[insight_key] = (
+                *build_eda_insight_prompt(analysis_type, stats_text, drafts.get(insight_key)), EDA_GENERATION_CONFIG
+            )
+    
+    matrix_df = get_analysis_table(dataset_version, 'matrix')
+    if matrix_df is not None and not matrix_df.empty:
+        requests['learning_time'] = (
+            *build_chart_insight_prompt(
+                CHART_INSIGHT_DESCRIPTIONS['learning_time'], matrix_df.round(1).to_string(index=False),
+                drafts.get('learning_time')
+            ),
+            CHART_GENERATION_CONFIG
         )
-        
-        insight_text = getattr(response, 'text', None)
-        if not insight_text:
-            try:
-                insight_text = response.candidates[0].content.parts[0].text
-            except Exception:
-                insight_text = "인사이트 생성에 실패했습니다."
-        
+    return requests
+
+def get_cached_report_insights(dataset_version, company=None):
+    """
+    인사이트 캐시에 있는 리포트 섹션 인사이트 (API 호출 없음)
+
+    Returns:
+        {인사이트 키: 텍스트} - 리포트 데이터의 빈 인사이트 채우기용
+    """
+    if dataset_version is None or count_cached(INSIGHT_NAMESPACE) == 0:
+        return {}
+    
+    insights = {}
+    for insight_key, (system_instruction, prompt, generation_config) in build_report_insight_requests(dataset_version, company).items():
+        insight_text = get_cached_insight(get_insight_cache_key(GEMINI_MODEL, system_instruction, prompt, generation_config))
+        if insight_text:
+            insights[insight_key] = insight_text
+    return insights
+
+async def _generate_insight_text_async(client, semaphore, system_instruction, prompt, generation_config, model=GEMINI_MODEL, section=None):
+    """비동기 Gemini 텍스트 생성 (캐시 우선, 세마포어로 동시 요청 수 제한, 같은 요청 병합/재시도)"""
+    started_at = time.perf_counter()
+    contents = f"{system_instruction}\n\n{prompt}"
+    cache_key = get_insight_cache_key(model, system_instruction, prompt, generation_config)
+    cached = get_cached_insight(cache_key)
+    if cached:
+        record_insight_call(section, 'async', model, SOURCE_CACHE, estimate_tokens(contents), 0, started_at)
+        return cached
+    
+    executed = []
+    
+    async def request():
+        executed.append(True)
+        cached = get_cached_insight(cache_key)
+        if cached:
+            record_insight_call(section, 'async', model, SOURCE_CACHE, estimate_tokens(contents), 0, started_at)
+            return cached
+        try:
+            async with semaphore:
+                response = await call_with_retry_async(lambda: client.aio.models.generate_content(
+                    model=model,
+                    contents=contents,
+                    config=_content_config(generation_config)
+                ))
+            insight_text = _response_text(response)
+            if not insight_text:
+                raise RuntimeError("인사이트 생성에 실패했습니다.")
+        except Exception as e:
+            record_insight_call(section, 'async', model, SOURCE_ERROR, estimate_tokens(contents), 0, started_at, error=e)
+            raise
+        record_insight_call(section, 'async', model, SOURCE_API, *_usage_tokens(response, contents, insight_text), started_at)
+        save_insight(cache_key, insight_text, model)
         return insight_text
     
+    try:
+        insight_text = await coalesce_async(cache_key, request)
     except Exception as e:
-        st.error(f"Gemini API 호출 중 오류: {str(e)}")
-        return None
+        if not executed:
+            record_insight_call(section, 'async', model, SOURCE_ERROR, 0, 0, started_at, error=e)
+        raise
+    if not executed:
+        record_insight_call(section, 'async', model, SOURCE_COALESCED, 0, 0, started_at)
+    return insight_text
+
+async def _generate_insights_async(client, requests, max_concurrency, progress=None):
+    async with loop_client(client) as batch_client:
+        return await _generate_insights_batch(batch_client, requests, max_concurrency, progress)
+
+async def _generate_insights_batch(client, requests, max_concurrency, progress=None):
+    semaphore = asyncio.Semaphore(max(1, int(max_concurrency)))
+    
+    async def run(insight_key, request):
+        # 사전 생성 요청 키는 (멤버사, 인사이트 키)
+        section = insight_key[-1] if isinstance(insight_key, tuple) else insight_key
+        try:
+            return insight_key, await _generate_insight_text_async(client, semaphore, *request, section=section)
+        except Exception as e:
+            return insight_key, e
+    
+    insights, errors = {}, {}
+    tasks = [run(insight_key, request) for insight_key, request in requests.items()]
+    for done, task in enumerate(asyncio.as_completed(tasks), start=1):
+        insight_key, result = await task
+        if isinstance(result, Exception):
+            errors[insight_key] = str(result)
+        else:
+            insights[insight_key] = result
+        if progress is not None:
+            progress(done / len(tasks), f"{done}/{len(tasks)} 섹션 완료")
+    return insights, errors
+
+def generate_all_insights(client, dataset_version, company=None, max_concurrency=None, progress=None):
+    """
+    리포트 전체 섹션(조직/직책/개인/변화군, 차트) 인사이트 동시 생성
+
+    Args:
+        client: Gemini 클라이언트 (client.aio 비동기 API 사용)
+        dataset_version: 데이터셋 버전 (분석 결과 캐시 키)
+        company: 멤버사명 (None 이면 전체)
+        max_concurrency: 동시 요청 수 (None 이면 config.yaml 의 insights.max_concurrency)
+        progress: 진행률 콜백 progress(비율, 메시지)
+
+    Returns:
+        (인사이트 {키: 텍스트}, 실패 {키: 오류 메시지})
+    """
+    requests = build_report_insight_requests(dataset_version, company)
+    if not requests:
+        return {}, {}
+    if max_concurrency is None:
+        max_concurrency = load_insight_config()['max_concurrency']
+    return asyncio.run(_generate_insights_async(client, requests, max_concurrency, progress))
 
+def build_precompute_requests(dataset_version, companies):
+    """
+    전체 + 멤버사별 리포트 섹션 인사이트 요청 (이미 캐시된 요청, 중복 프롬프트 제외)
+
+    Returns:
+        {(멤버사명 또는 None, 인사이트 키): (시스템 지시문, 프롬프트, 생성 설정)}
+    """
+    requests, seen = {}, set()
+    for company in [None] + list(companies):
+        for insight_key, request in build_report_insight_requests(dataset_version, company).items():
+            cache_key = get_insight_cache_key(GEMINI_MODEL, *request)
+            if cache_key in seen or get_cached_insight(cache_key):
+                continue
+            seen.add(cache_key)
+            requests[(company, insight_key)] = request
+    return requests
+
+def precompute_insights(client, dataset_version, companies=None, max_concurrency=None, progress=None):
+    """
+    전체 + 멤버사 x 섹션 인사이트를 미리 생성해 인사이트 캐시에 저장
+
+    대시보드 AI 분석 버튼/리포트와 같은 프롬프트이므로 이후 화면에서는 캐시 결과를 바로 사용
+
+    Args:
+        companies: 멤버사 목록 (None 이면 get_company_list())
+        max_concurrency: 동시 요청 수 (None 이면 config.yaml 의 insights.precompute_concurrency)
+
+    Returns:
+        (생성 수, 이미 캐시된 요청을 제외한 전체 요청 수, 실패 {(멤버사, 키): 오류 메시지})
+    """
+    if companies is None:
+        companies = get_company_list()
+    requests = build_precompute_requests(dataset_version, companies)
+    if not requests:
+        return 0, 0, {}
+    if max_concurrency is None:
+        max_concurrency = load_insight_config()['precompute_concurrency']
+    insights, errors = asyncio.run(_generate_insights_async(client, requests, max_concurrency, progress))
+    return len(insights), len(requests), errors
+
+def generate_eda_insight_job(progress, analysis_type, stats_data, prompt_metrics=None, draft=None, fallback_text=None):
+    """
+    작업 큐용 EDA 인사이트 생성 (결과 딕셔너리 반환, 캐시된 결과는 API 키 없이도 사용)
+
+    API 키가 없거나 생성에 실패하면 fallback_text(규칙 기반 요약)로 대체 (insights.rule_fallback)
+    """
+    client = get_gemini_client()
+    progress(0.2, "AI 분석 중")
+    # 작업 스레드에서는 화면에 직접 출력하지 않고 오류를 결과/작업 오류로 전달
+    error = None
+    try:
+        insight = _generate_eda_insight_text(client, analysis_type, stats_data, draft)
+    except Exception as e:
+        insight, error = None, e
+    if not insight and fallback_text and load_insight_config().get('rule_fallback', True):
+        reason = "Gemini API 키 없음" if client is None else f"AI 생성 실패: {error}" if error else "AI 생성 실패"
+        return {'text': fallback_text, 'analysis_type': analysis_type, 'summary': f"규칙 기반 요약 ({reason})"}
+    if error is not None:
+        raise error
+    if insight is None and client is None:
+        raise ValueError("Gemini API 키가 설정되지 않았습니다.")
+    if not insight:
+        raise RuntimeError("인사이트 생성에 실패했습니다.")
+    return {'text': insight, 'analysis_type': analysis_type, 'summary': format_prompt_metrics(prompt_metrics)}
+
+def generate_all_insights_job(progress, company=None):
+    """작업 큐용 전체 섹션 인사이트 생성 (PDF 리포트에 자동 포함, 실패한 섹션은 리포트에서 규칙 기반 요약으로 대체)"""
+    client = get_gemini_client()
+    if client is None:
+        if load_insight_config().get('rule_fallback', True):
+            return {'summary': "Gemini API 키가 없어 리포트에는 규칙 기반 요약이 포함됩니다."}
+        raise ValueError("Gemini API 키가 설정되지 않았습니다.")
+    progress(0.05, "AI 분석 요청 중")
+    prompt_tokens = sum(
+        estimate_tokens(f"{system_instruction}\n\n{prompt}")
+        for system_instruction, prompt, _ in build_report_insight_requests(get_dataset_version(), company).values()
+    )
+    insights, errors = generate_all_insights(client, get_dataset_version(), company, progress=progress)
+    if not insights:
+        raise RuntimeError(f"인사이트 생성에 실패했습니다. {'; '.join(errors.values())}".strip())
+    
+    # 생성 결과는 인사이트 캐시에 저장되어 PDF 리포트 생성 시 채워짐
+    summary = f"{len(insights)}개 섹션 인사이트 생성 완료 (프롬프트 합계 약 {prompt_tokens:,} 토큰)"
+    if errors:
+        summary += f" (실패 {len(errors)}개: {', '.join(errors)})"
+    return {'summary': summary}
+
+def precompute_insights_job(progress):
+    """작업 큐용 전체 + 멤버사별 인사이트 사전 생성 (업로드 후 백그라운드 실행)"""
+    client = get_gemini_client()
+    if client is None:
+        return {'summary': "Gemini API 키가 없어 인사이트 사전 생성을 건너뛰었습니다."}
+    progress(0.02, "사전 생성 대상 확인 중")
+    created, total, errors = precompute_insights(client, get_dataset_version(), progress=progress)
+    if total == 0:
+        return {'summary': "모든 인사이트가 이미 캐시되어 있습니다."}
+    summary = f"인사이트 {created}/{total}개 사전 생성 완료"
+    if errors:
+        summary += f" (실패 {len(errors)}개)"
+    return {'summary': summary}
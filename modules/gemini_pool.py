@@ -0,0 +1,252 @@
+"""
+Gemini 클라이언트 풀 모듈
+프로세스 공용 클라이언트 재사용(연결 유지), 요청 속도 제한, 재시도, 동일 요청 병합
+
+- 클라이언트: API 키별로 프로세스당 1개 생성 후 재사용
+- 속도 제한: 토큰 버킷 (분당 요청 수 + 순간 허용량)
+- 재시도: 429/5xx 응답은 지수 백오프(+지터) 후 재시도
+- 요청 병합: 같은 요청(인사이트 캐시 키)이 진행 중이면 새로 호출하지 않고 그 결과를 함께 사용
+"""
+
+import os
+import time
+import random
+import asyncio
+import threading
+import contextlib
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+import yaml
+
+# google.genai 는 첫 AI 호출 시 임포트 (앱 시작/로그인 화면 로드 시간 단축)
+
+_clients = {}
+_client_settings = {}
+_clients_lock = threading.Lock()
+
+_bucket = None
+_bucket_lock = threading.Lock()
+
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+def load_gemini_config():
+    """Gemini 호출 설정 로드 (config.yaml 의 gemini 섹션)"""
+    defaults = {
+        'requests_per_minute': 60,
+        'burst': 10,
+        'max_retries': 4,
+        'backoff_base_seconds': 1.0,
+        'backoff_max_seconds': 30.0,
+        'coalesce_wait_seconds': 300,
+        'base_url': None
+    }
+    config_path = 'config.yaml'
+    if os.path.exists(config_path):
+        with open(config_path, 'r', encoding='utf-8') as file:
+            config = yaml.safe_load(file) or {}
+            defaults.update(config.get('gemini', {}) or {})
+    # 환경변수가 있으면 우선 (벤치마크/테스트에서 로컬 대체 서버 지정)
+    defaults['base_url'] = os.getenv('GEMINI_BASE_URL') or defaults['base_url']
+    return defaults
+
+def get_pooled_client(api_key, **client_options):
+    """API 키(+옵션)별 프로세스 공용 genai.Client (HTTP 연결 재사용)"""
+    key = (api_key, tuple(sorted((name, repr(value)) for name, value in client_options.items())))
+    with _clients_lock:
+        if key not in _clients:
+            from google import genai
+            _clients[key] = genai.Client(api_key=api_key, **client_options)
+            _client_settings[id(_clients[key])] = (api_key, client_options)
+        return _clients[key]
+
+@contextlib.asynccontextmanager
+async def loop_client(client):
+    """
+    현재 이벤트 루프 전용 클라이언트 (async with)
+
+    httpx 비동기 연결은 만든 이벤트 루프에서만 쓸 수 있으므로, 풀 클라이언트와 같은 설정으로
+    asyncio.run 배치마다 새로 만들고 배치가 끝나면 닫음 (배치 안에서는 연결 재사용)
+    풀에서 만들지 않은 클라이언트(테스트용 등)는 그대로 사용
+    """
+    settings = _client_settings.get(id(client))
+    if settings is None:
+        yield client
+        return
+    from google import genai
+    api_key, client_options = settings
+    batch_client = genai.Client(api_key=api_key, **client_options)
+    try:
+        yield batch_client
+    finally:
+        await batch_client.aio.aclose()
+
+class TokenBucket:
+    """토큰 버킷 속도 제한 (스레드 안전, 초당 rate 개 충전, 최대 capacity 개 보관)"""
+
+    def __init__(self, rate, capacity):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self):
+        """토큰 1개 예약 후 대기해야 할 시간(초) 반환"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self):
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+def get_rate_limiter():
+    """프로세스 공용 토큰 버킷"""
+    global _bucket
+    with _bucket_lock:
+        if _bucket is None:
+            config = load_gemini_config()
+            _bucket = TokenBucket(
+                max(float(config['requests_per_minute']), 1.0) / 60.0,
+                max(int(config['burst']), 1)
+            )
+        return _bucket
+
+def set_rate_limiter(limiter):
+    """프로세스 공용 속도 제한 교체 (None 이면 다음 호출 시 config.yaml 설정으로 새로 생성 - 벤치마크용)"""
+    global _bucket
+    with _bucket_lock:
+        _bucket = limiter
+
+def is_retryable(error):
+    """재시도 대상 오류 (429 요청 한도 초과, 5xx 서버 오류)"""
+    from google.genai import errors
+    if isinstance(error, errors.APIError):
+        return error.code == 429 or (error.code or 0) >= 500
+    return False
+
+def _backoff_delay(attempt, config):
+    delay = min(float(config['backoff_max_seconds']), float(config['backoff_base_seconds']) * (2 ** attempt))
+    return delay * (0.5 + random.random() / 2)
+
+def call_with_retry(fn):
+    """속도 제한 + 429/5xx 지수 백오프 재시도로 fn() 호출"""
+    config = load_gemini_config()
+    limiter = get_rate_limiter()
+    for attempt in range(int(config['max_retries']) + 1):
+        limiter.acquire()
+        try:
+            return fn()
+        except Exception as e:
+            if not is_retryable(e) or attempt >= int(config['max_retries']):
+                raise
+            time.sleep(_backoff_delay(attempt, config))
+
+async def call_with_retry_async(fn):
+    """call_with_retry 의 비동기 버전 (fn 은 코루틴을 반환하는 함수)"""
+    config = load_gemini_config()
+    limiter = get_rate_limiter()
+    for attempt in range(int(config['max_retries']) + 1):
+        await limiter.acquire_async()
+        try:
+            return await fn()
+        except Exception as e:
+            if not is_retryable(e) or attempt >= int(config['max_retries']):
+                raise
+            await asyncio.sleep(_backoff_delay(attempt, config))
+
+def join_inflight(key):
+    """
+    같은 요청 진행 여부 확인
+
+    Returns:
+        (Future, 주도 여부) - 주도 요청이면 완료/중단 시 반드시 finish_inflight() 호출,
+        아니면 wait_inflight() 로 주도 요청 결과를 기다림
+    """
+    with _inflight_lock:
+        future = _inflight.get(key)
+        if future is not None:
+            return future, False
+        future = Future()
+        _inflight[key] = future
+        return future, True
+
+def finish_inflight(key, future, result=None, error=None):
+    """주도 요청 완료 처리 (대기 중인 같은 요청에 결과/오류 전달)"""
+    with _inflight_lock:
+        if _inflight.get(key) is future:
+            del _inflight[key]
+    # 대기 시간 초과로 이미 정리된 요청이어도 결과 전달은 한 번만
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+def _abandon_inflight(key, future):
+    """응답이 없는 주도 요청 정리 (다음 같은 요청이 새로 호출하도록)"""
+    with _inflight_lock:
+        if _inflight.get(key) is future:
+            del _inflight[key]
+
+def _interrupted_error(error):
+    """대기 중인 요청에 전달할 오류 (취소/중단(BaseException)은 RuntimeError 로 변환)"""
+    return error if isinstance(error, Exception) else RuntimeError("같은 요청이 중단되었습니다.")
+
+def wait_inflight(key, future):
+    """
+    주도 요청 결과 대기
+
+    gemini.coalesce_wait_seconds 안에 끝나지 않으면 진행 중 표시를 지우고 TimeoutError
+    """
+    try:
+        return future.result(timeout=float(load_gemini_config()['coalesce_wait_seconds']))
+    except FutureTimeoutError:
+        _abandon_inflight(key, future)
+        raise TimeoutError("같은 요청의 응답을 기다리다 시간이 초과되었습니다.") from None
+
+async def wait_inflight_async(key, future):
+    """wait_inflight 의 비동기 버전 (대기 취소/시간 초과가 공유 Future 를 취소하지 않도록 shield)"""
+    timeout = float(load_gemini_config()['coalesce_wait_seconds'])
+    try:
+        return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), timeout)
+    except asyncio.TimeoutError:
+        _abandon_inflight(key, future)
+        raise TimeoutError("같은 요청의 응답을 기다리다 시간이 초과되었습니다.") from None
+
+def coalesce(key, fn):
+    """같은 key 요청이 진행 중이면 그 결과를 기다리고, 아니면 fn() 실행 후 결과 공유"""
+    future, leader = join_inflight(key)
+    if not leader:
+        return wait_inflight(key, future)
+    try:
+        result = fn()
+    except BaseException as e:
+        finish_inflight(key, future, error=_interrupted_error(e))
+        raise
+    finish_inflight(key, future, result=result)
+    return result
+
+async def coalesce_async(key, fn):
+    """coalesce 의 비동기 버전 (다른 스레드/이벤트 루프의 같은 요청과도 병합)"""
+    future, leader = join_inflight(key)
+    if not leader:
+        return await wait_inflight_async(key, future)
+    try:
+        result = await fn()
+    except BaseException as e:
+        # 작업 취소(CancelledError)로 중단돼도 대기 중인 같은 요청은 실패 처리
+        finish_inflight(key, future, error=_interrupted_error(e))
+        raise
+    finish_inflight(key, future, result=result)
+    return result
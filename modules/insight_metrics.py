@@ -0,0 +1,232 @@
+"""
+AI 인사이트 사용량 측정 모듈
+Gemini 호출별 프롬프트 크기, 출력 토큰, 지연 시간, 캐시 적중, 오류를 로컬 SQLite 에 기록하고
+관리자 화면에서 섹션/사용자별 백분위수와 합계를 표시 (동시 요청 수, 캐시 크기 설정 근거)
+"""
+
+import streamlit as st
+import os
+import time
+import yaml
+import sqlite3
+import threading
+import pandas as pd
+from modules.cache_store import get_cache_dir
+
+METRICS_NAMESPACE = 'metrics'
+
+# 보관 기간 지난 기록 정리 주기 (기록 시 확인)
+PURGE_INTERVAL_SECONDS = 3600
+
+# 호출 결과 구분
+SOURCE_API = 'api'
+SOURCE_CACHE = 'cache'
+SOURCE_COALESCED = 'coalesced'
+SOURCE_ERROR = 'error'
+
+SOURCE_LABELS = {
+    SOURCE_API: "API 호출",
+    SOURCE_CACHE: "캐시 적중",
+    SOURCE_COALESCED: "요청 병합",
+    SOURCE_ERROR: "오류"
+}
+
+# 관리자 화면 지연 시간 백분위수
+LATENCY_PERCENTILES = [0.5, 0.9, 0.95, 0.99]
+
+_metrics_store = None
+_metrics_store_lock = threading.Lock()
+
+def load_metrics_config():
+    """사용량 측정 설정 로드 (config.yaml 의 telemetry 섹션)"""
+    defaults = {'enabled': True, 'retention_days': 90, 'admin_users': ['admin']}
+    config_path = 'config.yaml'
+    if os.path.exists(config_path):
+        with open(config_path, 'r', encoding='utf-8') as file:
+            config = yaml.safe_load(file) or {}
+            defaults.update(config.get('telemetry', {}) or {})
+    return defaults
+
+class MetricsStore:
+    """SQLite 인사이트 호출 기록 (여러 스레드/프로세스에서 동시 기록)"""
+
+    def __init__(self, db_path, retention_days=90):
+        self.db_path = db_path
+        self.retention_days = retention_days
+        self._lock = threading.Lock()
+        self._purged_at = None
+        self._init_db()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_db(self):
+        with self._lock, self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS insight_calls (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    created_at REAL,
+                    section TEXT,
+                    username TEXT,
+                    mode TEXT,
+                    model TEXT,
+                    source TEXT,
+                    prompt_tokens INTEGER,
+                    output_tokens INTEGER,
+                    latency_ms REAL,
+                    error TEXT
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_insight_calls_created ON insight_calls (created_at)")
+        self._purge_if_due()
+
+    def record(self, section, username, mode, model, source, prompt_tokens, output_tokens, latency_ms, error=None):
+        self._purge_if_due()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT INTO insight_calls (created_at, section, username, mode, model, source, prompt_tokens, "
+                "output_tokens, latency_ms, error) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [time.time(), section, username, mode, model, source,
+                 int(prompt_tokens or 0), int(output_tokens or 0), float(latency_ms), error]
+            )
+
+    def load(self, since=None):
+        """호출 기록 DataFrame (since: 시작 시각 epoch 초)"""
+        query, params = "SELECT * FROM insight_calls", []
+        if since is not None:
+            query += " WHERE created_at >= ?"
+            params.append(since)
+        with self._connect() as conn:
+            df = pd.read_sql_query(query, conn, params=params)
+        df['created_at'] = pd.to_datetime(df['created_at'], unit='s')
+        return df
+
+    def _purge_if_due(self):
+        """마지막 정리 후 PURGE_INTERVAL_SECONDS 가 지났으면 정리 (장시간 실행 프로세스에서도 보관 기간 적용)"""
+        with self._lock:
+            now = time.monotonic()
+            if self._purged_at is not None and now - self._purged_at < PURGE_INTERVAL_SECONDS:
+                return
+            self._purged_at = now
+        self.purge_expired()
+
+    def purge_expired(self):
+        """보관 기간이 지난 기록 삭제"""
+        cutoff = time.time() - float(self.retention_days) * 86400
+        with self._lock, self._connect() as conn:
+            return conn.execute("DELETE FROM insight_calls WHERE created_at < ?", [cutoff]).rowcount
+
+def get_metrics_store():
+    """프로세스 공용 기록 저장소 (최초 호출 시 생성)"""
+    global _metrics_store
+    with _metrics_store_lock:
+        if _metrics_store is None:
+            _metrics_store = MetricsStore(
+                os.path.join(get_cache_dir(METRICS_NAMESPACE), 'insights.db'),
+                retention_days=load_metrics_config()['retention_days']
+            )
+        return _metrics_store
+
+def get_current_username():
+    """현재 세션 사용자 (세션이 없는 스케줄러/CLI 실행은 'system')"""
+    try:
+        return st.session_state.get('username') or 'system'
+    except Exception:
+        return 'system'
+
+def record_insight_call(section, mode, model, source, prompt_tokens, output_tokens, started_at, error=None, username=None):
+    """
+    인사이트 호출 1건 기록 (기록 실패는 인사이트 생성에 영향을 주지 않음)
+
+    Args:
+        section: 인사이트 키 (organization, position, ..., chart)
+        mode: 호출 방식 ('sync', 'stream', 'async')
+        source: SOURCE_API / SOURCE_CACHE / SOURCE_COALESCED / SOURCE_ERROR
+        started_at: time.perf_counter() 시작값
+    """
+    if not load_metrics_config().get('enabled', True):
+        return
+    try:
+        get_metrics_store().record(
+            section or 'unknown', username or get_current_username(), mode, model, source,
+            prompt_tokens, output_tokens, (time.perf_counter() - started_at) * 1000,
+            str(error)[:500] if error is not None else None
+        )
+    except Exception:
+        pass
+
+def summarize_metrics(df, by):
+    """
+    그룹별 호출 요약
+
+    Returns:
+        DataFrame (호출 수, 캐시 적중률, 오류 수, 프롬프트/출력 토큰 합계, API 호출 지연 시간 백분위수)
+    """
+    if df.empty:
+        return pd.DataFrame()
+    rows = []
+    for group, group_df in df.groupby(by):
+        api_df = group_df[group_df['source'] == SOURCE_API]
+        row = {
+            by: group,
+            '호출 수': len(group_df),
+            'API 호출': len(api_df),
+            '캐시 적중률(%)': round((group_df['source'] == SOURCE_CACHE).mean() * 100, 1),
+            '요청 병합': int((group_df['source'] == SOURCE_COALESCED).sum()),
+            '오류': int((group_df['source'] == SOURCE_ERROR).sum()),
+            '프롬프트 토큰 합계': int(api_df['prompt_tokens'].sum()),
+            '출력 토큰 합계': int(api_df['output_tokens'].sum())
+        }
+        for ratio in LATENCY_PERCENTILES:
+            row[f'p{int(ratio * 100)}(ms)'] = round(api_df['latency_ms'].quantile(ratio), 0) if not api_df.empty else None
+        rows.append(row)
+    return pd.DataFrame(rows).sort_values('호출 수', ascending=False).reset_index(drop=True)
+
+def is_metrics_admin():
+    """관리자 화면 접근 가능 여부 (config.yaml 의 telemetry.admin_users)"""
+    return st.session_state.get('username') in (load_metrics_config().get('admin_users') or [])
+
+def render_metrics_page():
+    """관리자용 AI 인사이트 사용 현황 화면"""
+    st.title("📊 AI 인사이트 사용 현황")
+    if not is_metrics_admin():
+        st.error("관리자만 접근할 수 있습니다.")
+        return
+
+    days = st.selectbox("기간", [1, 7, 30, 90], index=1, format_func=lambda d: f"최근 {d}일", key="metrics_days")
+    df = get_metrics_store().load(since=time.time() - days * 86400)
+    if df.empty:
+        st.info("기록된 인사이트 호출이 없습니다.")
+        return
+
+    api_df = df[df['source'] == SOURCE_API]
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("전체 호출", f"{len(df):,}건")
+    col2.metric("캐시 적중률", f"{(df['source'] == SOURCE_CACHE).mean() * 100:.1f}%")
+    col3.metric("API 출력 토큰", f"{int(api_df['output_tokens'].sum()):,}")
+    col4.metric("API 지연 p95", f"{api_df['latency_ms'].quantile(0.95):,.0f}ms" if not api_df.empty else "-")
+
+    st.subheader("섹션별")
+    st.dataframe(summarize_metrics(df, 'section'), use_container_width=True)
+    st.subheader("사용자별")
+    st.dataframe(summarize_metrics(df, 'username'), use_container_width=True)
+    st.subheader("호출 방식별")
+    st.dataframe(summarize_metrics(df, 'mode'), use_container_width=True)
+
+    errors = df[df['source'] == SOURCE_ERROR]
+    if not errors.empty:
+        st.subheader("최근 오류")
+        st.dataframe(
+            errors.sort_values('created_at', ascending=False).head(20)[['created_at', 'section', 'username', 'error']],
+            use_container_width=True
+        )
+
+    st.download_button(
+        "📥 호출 기록 CSV",
+        df.assign(source=df['source'].map(SOURCE_LABELS).fillna(df['source'])).to_csv(index=False).encode('utf-8-sig'),
+        file_name="insight_calls.csv",
+        mime="text/csv"
+    )
@@ -0,0 +1,346 @@
+"""
+백그라운드 작업 큐 모듈
+PDF 생성, AI 인사이트, 파일 로드 등 오래 걸리는 작업을 워커 스레드에서 실행
+
+- 작업 상태/진행률은 SQLite 작업 테이블에 기록 (탭을 이동해도 작업 유지, 상태 폴링)
+- 결과물은 디스크 캐시에 저장 후 세션 중 언제든 다시 받기
+- 프로세스(Pod)당 동시 실행 작업 수 제한 (나머지는 대기)
+"""
+
+import streamlit as st
+import os
+import time
+import uuid
+import yaml
+import sqlite3
+import threading
+from streamlit.runtime.scriptrunner import add_script_run_ctx
+from modules.cache_store import get_cache_dir, load_cached, save_cached, delete_cached, prune_cache
+
+JOB_NAMESPACE = 'jobs'
+
+# 보관 기간 지난 작업 정리 주기 (작업 등록 시 확인)
+PURGE_INTERVAL_SECONDS = 600
+
+# 작업 상태
+STATUS_QUEUED = 'queued'
+STATUS_RUNNING = 'running'
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+ACTIVE_STATUSES = [STATUS_QUEUED, STATUS_RUNNING]
+
+STATUS_LABELS = {
+    STATUS_QUEUED: "⏳ 대기 중",
+    STATUS_RUNNING: "🔄 실행 중",
+    STATUS_DONE: "✅ 완료",
+    STATUS_FAILED: "❌ 실패"
+}
+
+_job_queue = None
+_job_queue_lock = threading.Lock()
+
+PROCESS_ID_ENV = 'LEARNING_REPORT_JOB_PROCESS_ID'
+
+def get_process_id():
+    """현재 프로세스 식별자 (모듈 재로드에도 유지, 컨테이너 재시작으로 PID 가 같아도 구분)"""
+    process_id = os.environ.get(PROCESS_ID_ENV, '')
+    if not process_id.startswith(f"{os.getpid()}-"):
+        process_id = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        os.environ[PROCESS_ID_ENV] = process_id
+    return process_id
+
+def is_process_alive(process_id):
+    """작업을 등록한 프로세스가 아직 실행 중인지 (같은 PID 라도 식별자가 다르면 재시작된 프로세스)"""
+    if not process_id:
+        return False
+    if process_id == get_process_id():
+        return True
+    try:
+        pid = int(str(process_id).split('-', 1)[0])
+    except ValueError:
+        return False
+    if pid == os.getpid():
+        return False
+    if os.name == 'nt':
+        # Windows 의 os.kill 은 프로세스를 종료하므로 확인하지 않음
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        # 권한 부족 등은 프로세스가 존재하는 것으로 간주
+        return True
+    return True
+
+def load_job_config():
+    """작업 큐 설정 로드 (config.yaml 의 jobs 섹션)"""
+    defaults = {'max_concurrent': 2, 'retention_hours': 24, 'poll_seconds': 2}
+    config_path = 'config.yaml'
+    if os.path.exists(config_path):
+        with open(config_path, 'r', encoding='utf-8') as file:
+            config = yaml.safe_load(file) or {}
+            defaults.update(config.get('jobs', {}) or {})
+    return defaults
+
+class JobQueue:
+    """SQLite 작업 테이블 + 스레드 워커 작업 큐 (동시 실행 수는 세마포어로 제한)"""
+
+    def __init__(self, db_path, max_workers=2, retention_hours=24):
+        self.db_path = db_path
+        self.retention_hours = retention_hours
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_workers)
+        self._purged_at = None
+        self._init_db()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_db(self):
+        with self._lock, self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    kind TEXT,
+                    label TEXT,
+                    owner TEXT,
+                    status TEXT,
+                    progress REAL,
+                    message TEXT,
+                    error TEXT,
+                    has_result INTEGER DEFAULT 0,
+                    process_id TEXT,
+                    created_at REAL,
+                    started_at REAL,
+                    finished_at REAL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_owner ON jobs (owner, created_at)")
+            # 종료된 프로세스에서 끝나지 못한 작업은 실패 처리 (실행 중인 다른 프로세스의 작업은 유지)
+            active = conn.execute(
+                f"SELECT id, process_id FROM jobs WHERE status IN ({','.join('?' * len(ACTIVE_STATUSES))})",
+                ACTIVE_STATUSES
+            ).fetchall()
+            stale = [[row['id']] for row in active if not is_process_alive(row['process_id'])]
+            conn.executemany(
+                "UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE id = ?",
+                [[STATUS_FAILED, "서버 재시작으로 작업이 중단되었습니다.", time.time(), *job_id] for job_id in stale]
+            )
+        self._purge_if_due()
+
+    def _update(self, job_id, **fields):
+        columns = ', '.join(f"{name} = ?" for name in fields)
+        with self._lock, self._connect() as conn:
+            conn.execute(f"UPDATE jobs SET {columns} WHERE id = ?", [*fields.values(), job_id])
+
+    def submit(self, kind, fn, *args, label=None, owner=None, **kwargs):
+        """
+        작업 등록 후 워커 스레드에서 실행
+
+        Args:
+            kind: 작업 종류 ('pdf', 'insight', 'upload' 등)
+            fn: 실행 함수 fn(progress, *args, **kwargs) - progress(비율 0~1, 메시지) 로 진행률 보고
+            label: 화면 표시용 작업 이름
+            owner: 작업 소유자 (세션 ID)
+
+        Returns:
+            작업 ID
+        """
+        self._purge_if_due()
+        job_id = uuid.uuid4().hex
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, kind, label, owner, status, progress, message, process_id, created_at) "
+                "VALUES (?, ?, ?, ?, ?, 0, '', ?, ?)",
+                [job_id, kind, label or kind, owner, STATUS_QUEUED, get_process_id(), time.time()]
+            )
+        worker = threading.Thread(
+            target=self._run, args=(job_id, fn, args, kwargs), name=f"job-{kind}-{job_id[:8]}", daemon=True
+        )
+        # 세션 데이터(st.session_state)를 사용하는 작업을 위해 제출한 세션의 실행 컨텍스트 전달
+        add_script_run_ctx(worker)
+        worker.start()
+        return job_id
+
+    def _run(self, job_id, fn, args, kwargs):
+        with self._slots:
+            self._execute(job_id, fn, args, kwargs)
+
+    def _execute(self, job_id, fn, args, kwargs):
+        self._update(job_id, status=STATUS_RUNNING, started_at=time.time())
+
+        def progress(fraction, message=None):
+            fields = {'progress': max(0.0, min(float(fraction), 1.0))}
+            if message is not None:
+                fields['message'] = message
+            self._update(job_id, **fields)
+
+        try:
+            result = fn(progress, *args, **kwargs)
+            has_result = result is not None and save_cached(JOB_NAMESPACE, job_id, result)
+            self._update(
+                job_id, status=STATUS_DONE, progress=1.0, has_result=int(bool(has_result)), finished_at=time.time()
+            )
+        except Exception as e:
+            self._update(job_id, status=STATUS_FAILED, error=str(e), finished_at=time.time())
+
+    def get_job(self, job_id):
+        """작업 상태 조회 (없으면 None)"""
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", [job_id]).fetchone()
+        return dict(row) if row else None
+
+    def list_jobs(self, owner=None, limit=20):
+        """최근 작업 목록 (owner 지정 시 해당 세션 작업만)"""
+        query, params = "SELECT * FROM jobs", []
+        if owner is not None:
+            query += " WHERE owner = ?"
+            params.append(owner)
+        query += " ORDER BY created_at DESC LIMIT ?"
+        params.append(limit)
+        with self._connect() as conn:
+            return [dict(row) for row in conn.execute(query, params).fetchall()]
+
+    def count_active(self):
+        """대기/실행 중 작업 수"""
+        with self._connect() as conn:
+            return conn.execute(
+                f"SELECT COUNT(*) FROM jobs WHERE status IN ({','.join('?' * len(ACTIVE_STATUSES))})",
+                ACTIVE_STATUSES
+            ).fetchone()[0]
+
+    def get_result(self, job_id):
+        """완료 작업 결과 (결과가 없거나 만료되었으면 None)"""
+        return load_cached(JOB_NAMESPACE, job_id)
+
+    def _purge_if_due(self):
+        """마지막 정리 후 PURGE_INTERVAL_SECONDS 가 지났으면 정리 (장시간 실행 프로세스에서도 보관 기간 적용)"""
+        with self._lock:
+            now = time.monotonic()
+            if self._purged_at is not None and now - self._purged_at < PURGE_INTERVAL_SECONDS:
+                return
+            self._purged_at = now
+        self.purge_expired()
+
+    def purge_expired(self):
+        """보관 기간이 지난 완료/실패 작업과 결과 파일 삭제 (작업 행이 없는 오래된 결과 파일 포함)"""
+        retention_seconds = float(self.retention_hours) * 3600
+        cutoff = time.time() - retention_seconds
+        with self._lock, self._connect() as conn:
+            expired = [row[0] for row in conn.execute(
+                "SELECT id FROM jobs WHERE finished_at IS NOT NULL AND finished_at < ?", [cutoff]
+            ).fetchall()]
+            conn.executemany("DELETE FROM jobs WHERE id = ?", [[job_id] for job_id in expired])
+        for job_id in expired:
+            delete_cached(JOB_NAMESPACE, job_id)
+        # 결과 파일은 작업 완료 시 저장되므로 수정 시각이 보관 기간을 넘은 파일은 만료된 작업의 결과
+        prune_cache(JOB_NAMESPACE, max_age_seconds=retention_seconds)
+        return len(expired)
+
+def get_job_queue():
+    """프로세스 공용 작업 큐 (최초 호출 시 생성)"""
+    global _job_queue
+    with _job_queue_lock:
+        if _job_queue is None:
+            config = load_job_config()
+            _job_queue = JobQueue(
+                os.path.join(get_cache_dir(JOB_NAMESPACE), 'jobs.db'),
+                max_workers=max(1, int(config['max_concurrent'])),
+                retention_hours=config['retention_hours']
+            )
+        return _job_queue
+
+def get_session_owner():
+    """현재 세션의 작업 소유자 ID"""
+    if 'job_owner' not in st.session_state:
+        st.session_state['job_owner'] = uuid.uuid4().hex
+    return st.session_state['job_owner']
+
+def submit_session_job(kind, fn, *args, label=None, **kwargs):
+    """현재 세션 소유 작업 등록 (작업 ID 반환)"""
+    return get_job_queue().submit(kind, fn, *args, label=label, owner=get_session_owner(), **kwargs)
+
+def render_job_result(job, key_prefix='job', show_text=True):
+    """완료 작업 결과 표시 (파일 결과는 다운로드 버튼, 텍스트 결과는 본문)"""
+    result = get_job_queue().get_result(job['id'])
+    if result is None:
+        st.caption("결과가 만료되었습니다. 다시 실행하세요.")
+        return
+    if result.get('data') is not None:
+        st.download_button(
+            label=f"📥 {result.get('file_name', '결과 다운로드')}",
+            data=result['data'],
+            file_name=result.get('file_name', 'result'),
+            mime=result.get('mime', 'application/octet-stream'),
+            use_container_width=True,
+            key=f"{key_prefix}_download_{job['id']}"
+        )
+    if result.get('summary'):
+        st.caption(result['summary'])
+    # 작업 스레드는 화면에 직접 출력하지 않으므로 경고는 결과로 받아 표시
+    for message in result.get('warnings') or []:
+        st.warning(message)
+    if result.get('text') and show_text:
+        st.markdown("#### 💡 AI 분석 인사이트")
+        st.write(result['text'])
+
+def _render_job_status(job_id, key_prefix, show_text):
+    job = get_job_queue().get_job(job_id)
+    if job is None:
+        return None
+    if job['status'] in ACTIVE_STATUSES:
+        st.progress(
+            job['progress'] or 0.0,
+            text=f"{STATUS_LABELS[job['status']]} · {job['label']} {job['message'] or ''}".strip()
+        )
+    elif job['status'] == STATUS_FAILED:
+        st.error(f"{job['label']} 실패: {job['error']}")
+    else:
+        render_job_result(job, key_prefix, show_text)
+    return job
+
+def render_job_status(job_id, key_prefix='job', show_text=True, live=True):
+    """
+    단일 작업 상태/진행률 표시 (완료 시 결과 표시)
+
+    live 이고 작업이 진행 중이면 fragment 로 주기적으로 상태만 다시 그림 (전체 화면 재실행 없음)
+    """
+    job = get_job_queue().get_job(job_id)
+    if job is None:
+        return None
+    if live and job['status'] in ACTIVE_STATUSES and hasattr(st, 'fragment'):
+        st.fragment(
+            lambda: _render_job_status(job_id, key_prefix, show_text),
+            run_every=load_job_config()['poll_seconds']
+        )()
+        return job
+    return _render_job_status(job_id, key_prefix, show_text)
+
+def render_jobs_panel(limit=5):
+    """사이드바 작업 목록 (현재 세션 작업, 진행 중인 작업이 있으면 자동 갱신)"""
+    owner = get_session_owner()
+
+    def _panel():
+        jobs = get_job_queue().list_jobs(owner=owner, limit=limit)
+        if not jobs:
+            st.caption("실행한 작업이 없습니다.")
+            return
+        applied = st.session_state.setdefault('applied_jobs', set())
+        for job in jobs:
+            st.markdown(f"**{job['label']}** · {STATUS_LABELS.get(job['status'], job['status'])}")
+            _render_job_status(job['id'], 'panel', show_text=False)
+            # 세션 데이터를 바꾸는 작업(파일 로드)은 완료 시 화면 전체 갱신
+            if job['kind'] == 'upload' and job['status'] == STATUS_DONE and job['id'] not in applied:
+                applied.add(job['id'])
+                st.rerun()
+
+    jobs = get_job_queue().list_jobs(owner=owner, limit=limit)
+    has_active = any(job['status'] in ACTIVE_STATUSES for job in jobs)
+    if has_active and hasattr(st, 'fragment'):
+        st.fragment(_panel, run_every=load_job_config()['poll_seconds'])()
+    else:
+        _panel()
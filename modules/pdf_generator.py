@@ -16,79 +16,173 @@ from io import BytesIO
 import base64
 import pandas as pd
 from datetime import datetime
-import os
+import copy
+import zipfile
+import hashlib
+import html
+import threading
+from collections import OrderedDict
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from modules.chart_renderer import render_chart_images
+from modules.vector_charts import figure_to_native_drawing, svg_to_drawing, SVG_CONVERSION_AVAILABLE
+from modules.report_config import CHART_FORMATS, load_report_config
+
+# 최근 생성 PDF 캐시 (입력 해시 → PDF bytes)
+_report_cache = OrderedDict()
+_report_cache_lock = threading.Lock()
+
+# 섹션별 플로어블 캐시 (섹션명 + 섹션 입력 해시 → 플로어블 목록)
+_section_cache = OrderedDict()
+_section_cache_lock = threading.Lock()
+_report_styles = None
+
+# 리포트 차트 크기 (px)
+CHART_SIZES = {
+    'annual_trend': (800, 500),
+    'matrix': (800, 600),
+    'popular_cards': (800, 500),
+    'org_learning': (800, 500),
+    'position_learning': (800, 500),
+    'individual_distribution': (800, 500),
+    'change_group': (800, 500),
+    'area_status': (800, 500)
+}
+
+def render_report_charts(charts):
+    """리포트 차트 일괄 이미지 변환 (키가 (멤버사, 차트명) 튜플이어도 됨, 실패 차트는 경고 후 제외)"""
+    chart_images = render_chart_images({
+        key: (fig, *CHART_SIZES.get(key[-1] if isinstance(key, tuple) else key, (800, 500)))
+        for key, fig in charts.items()
+    })
+    for name, result in list(chart_images.items()):
+        if isinstance(result, Exception):
+            st.warning(f"차트 이미지 변환 실패 ({name}): {str(result)}")
+            chart_images[name] = None
+    return chart_images
 
 def plotly_to_image(fig, width=800, height=600):
-    """Plotly 차트를 이미지로 변환"""
-    try:
-        img_bytes = fig.to_image(format="png", width=width, height=height)
-        return BytesIO(img_bytes)
-    except Exception as e:
-        st.warning(f"차트 이미지 변환 실패: {str(e)}")
+    """Plotly 차트를 이미지로 변환 (내용 해시 캐시 사용)"""
+    result = render_chart_images({'chart': (fig, width, height)}).get('chart')
+    if result is None or isinstance(result, Exception):
+        if result is not None:
+            st.warning(f"차트 이미지 변환 실패: {str(result)}")
         return None
+    return BytesIO(result)
 
-def create_pdf_report(data_dict, output_path="Learning_Report.pdf"):
+def _chart_flowable(chart, width, height):
     """
-    PDF 리포트 생성
-    
+    섹션 차트 플로어블
+
     Args:
-        data_dict: 리포트에 포함할 데이터 딕셔너리
-            - charts: 차트 딕셔너리 {title: fig}
-            - insights: 인사이트 딕셔너리 {section: text}
-            - summary: 요약 통계
-            - company_name: 멤버사명
+        chart: PNG bytes 또는 (형식, 차트명, Figure JSON) - 벡터 형식
+        width, height: 페이지 상 크기
+
+    벡터 변환이 불가능한 차트(지원하지 않는 trace, svglib 미설치)는 PNG 로 대체
     """
-    doc = SimpleDocTemplate(output_path, pagesize=A4)
-    story = []
-    
-    # 스타일 정의
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        textColor=colors.HexColor('#1f4788'),
-        spaceAfter=30,
-        alignment=TA_CENTER
-    )
-    
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=16,
-        textColor=colors.HexColor('#1f4788'),
-        spaceAfter=12,
-        spaceBefore=12
-    )
-    
-    subheading_style = ParagraphStyle(
-        'CustomSubHeading',
-        parent=styles['Heading3'],
-        fontSize=14,
-        textColor=colors.HexColor('#366092'),
-        spaceAfter=10,
-        spaceBefore=10
-    )
-    
-    normal_style = styles['Normal']
+    if not chart:
+        return None
+    if isinstance(chart, (bytes, bytearray)):
+        return Image(BytesIO(chart), width=width, height=height)
+    
+    chart_format, name, fig_json = chart
+    size = CHART_SIZES.get(name, (800, 500))
+    drawing = None
+    if chart_format == 'native':
+        drawing = figure_to_native_drawing(fig_json, width, height)
+    if drawing is None and SVG_CONVERSION_AVAILABLE:
+        svg_bytes = render_chart_images({name: (fig_json, *size)}, fmt='svg').get(name)
+        if svg_bytes and not isinstance(svg_bytes, Exception):
+            drawing = svg_to_drawing(svg_bytes, width, height)
+    if drawing is not None:
+        return drawing
+    
+    img_bytes = render_report_charts({name: fig_json}).get(name)
+    return Image(BytesIO(img_bytes), width=width, height=height) if img_bytes else None
+
+def get_report_styles():
+    """리포트 문단 스타일 (프로세스당 한 번 생성 후 재사용)"""
+    global _report_styles
+    if _report_styles is None:
+        styles = getSampleStyleSheet()
+        _report_styles = {
+            'title': ParagraphStyle(
+                'CustomTitle',
+                parent=styles['Heading1'],
+                fontSize=24,
+                textColor=colors.HexColor('#1f4788'),
+                spaceAfter=30,
+                alignment=TA_CENTER
+            ),
+            'heading': ParagraphStyle(
+                'CustomHeading',
+                parent=styles['Heading2'],
+                fontSize=16,
+                textColor=colors.HexColor('#1f4788'),
+                spaceAfter=12,
+                spaceBefore=12
+            ),
+            'subheading': ParagraphStyle(
+                'CustomSubHeading',
+                parent=styles['Heading3'],
+                fontSize=14,
+                textColor=colors.HexColor('#366092'),
+                spaceAfter=10,
+                spaceBefore=10
+            ),
+            'normal': styles['Normal']
+        }
+    return _report_styles
+
+def _section_cache_key(name, inputs):
+    """섹션 입력 기반 캐시 키 (이미지 bytes 는 내용 해시)"""
+    hasher = hashlib.sha256(name.encode('utf-8'))
+    for value in inputs:
+        if isinstance(value, (bytes, bytearray)):
+            hasher.update(b'|img:')
+            hasher.update(value)
+        else:
+            hasher.update(f"|{value!r}".encode('utf-8'))
+    return hasher.hexdigest()
+
+def get_section_flowables(name, builder, *inputs):
+    """
+    섹션 플로어블 (입력이 같으면 이전 빌드 결과 재사용)
     
-    # 커버 페이지
-    story.append(Paragraph("mySUNI Learning Report", title_style))
+    문단 파싱/이미지 로딩 결과는 공유하고, 빌드 중 레이아웃 속성이 바뀌는
+    플로어블 객체는 호출마다 얕은 복사본을 반환 (동시 빌드 안전)
+    """
+    key = _section_cache_key(name, inputs)
+    with _section_cache_lock:
+        flowables = _section_cache.get(key)
+        if flowables is not None:
+            _section_cache.move_to_end(key)
+    
+    if flowables is None:
+        flowables = builder(get_report_styles(), *inputs)
+        max_items = int(load_report_config().get('pdf_section_cache_items', 64))
+        with _section_cache_lock:
+            _section_cache[key] = flowables
+            while len(_section_cache) > max_items:
+                _section_cache.popitem(last=False)
+    
+    return [copy.copy(flowable) for flowable in flowables]
+
+def _build_cover_section(styles, company_name, period, report_date):
+    """커버 페이지 + 목차"""
+    story = []
+    story.append(Paragraph("mySUNI Learning Report", styles['title']))
     story.append(Spacer(1, 0.5*inch))
     
-    company_name = data_dict.get('company_name', '전체')
-    story.append(Paragraph(f"멤버사: {company_name}", heading_style))
+    story.append(Paragraph(f"멤버사: {company_name}", styles['heading']))
     story.append(Spacer(1, 0.3*inch))
     
-    report_date = datetime.now().strftime("%Y년 %m월 %d일")
-    story.append(Paragraph(f"리포트 생성일: {report_date}", normal_style))
-    
-    period = data_dict.get('period', '2025년 상반기')
-    story.append(Paragraph(f"분석 기간: {period}", normal_style))
+    story.append(Paragraph(f"리포트 생성일: {report_date}", styles['normal']))
+    story.append(Paragraph(f"분석 기간: {period}", styles['normal']))
     story.append(PageBreak())
     
     # 목차
-    story.append(Paragraph("목차", heading_style))
+    story.append(Paragraph("목차", styles['heading']))
     toc_items = [
         "1. 전체 학습 현황 요약",
         "2. 학습시간 현황",
@@ -101,188 +195,283 @@ def create_pdf_report(data_dict, output_path="Learning_Report.pdf"):
         "9. 주요 영역별 학습 현황"
     ]
     for item in toc_items:
-        story.append(Paragraph(item, normal_style))
+        story.append(Paragraph(item, styles['normal']))
         story.append(Spacer(1, 0.1*inch))
     
     story.append(PageBreak())
+    return story
+
+def _build_summary_section(styles, summary, chart):
+    """1. 전체 학습 현황 요약 + 연간 추이 차트"""
+    story = [Paragraph("1. 전체 학습 현황 요약", styles['heading'])]
     
-    # 1. 전체 학습 현황 요약
-    story.append(Paragraph("1. 전체 학습 현황 요약", heading_style))
-    
-    if 'summary' in data_dict:
-        summary = data_dict['summary']
+    if summary is not None:
         summary_text = f"""
         총 학습시간: {summary.get('total_time', 'N/A')}시간
         멤버사 수: {summary.get('num_companies', 'N/A')}개
         평균 학습시간: {summary.get('avg_time', 'N/A'):.1f}시간
         학습자 수: {summary.get('num_learners', 'N/A'):,}명
         """
-        story.append(Paragraph(summary_text, normal_style))
+        story.append(Paragraph(summary_text, styles['normal']))
         story.append(Spacer(1, 0.2*inch))
     
-    # 연간 추이 차트
-    if 'charts' in data_dict and 'annual_trend' in data_dict['charts']:
-        fig = data_dict['charts']['annual_trend']
-        img_buffer = plotly_to_image(fig, width=800, height=500)
-        if img_buffer:
-            img_buffer.seek(0)
-            story.append(Image(img_buffer, width=16*cm, height=10*cm))
-            story.append(Spacer(1, 0.3*inch))
+    chart_flowable = _chart_flowable(chart, 16*cm, 10*cm)
+    if chart_flowable is not None:
+        story.append(chart_flowable)
+        story.append(Spacer(1, 0.3*inch))
     
     story.append(PageBreak())
+    return story
+
+def _insight_markup(insight_text):
+    """인사이트 마크다운 → Paragraph 마크업 (특수문자 이스케이프, 굵게 표시 제거, 줄바꿈 유지)"""
+    text = html.escape(str(insight_text), quote=False).replace('**', '')
+    return text.replace('\n', '<br/>')
+
+def _build_learning_time_section(styles, insight_text, chart):
+    """2. 학습시간 현황 (인사이트 + Matrix 차트)"""
+    story = [Paragraph("2. 학습시간 현황", styles['heading'])]
     
-    # 2. 학습시간 현황
-    story.append(Paragraph("2. 학습시간 현황", heading_style))
-    
-    if 'insights' in data_dict and 'learning_time' in data_dict['insights']:
-        insight_text = data_dict['insights']['learning_time']
-        story.append(Paragraph("인사이트", subheading_style))
-        story.append(Paragraph(insight_text, normal_style))
+    if insight_text is not None:
+        story.append(Paragraph("인사이트", styles['subheading']))
+        story.append(Paragraph(_insight_markup(insight_text), styles['normal']))
         story.append(Spacer(1, 0.2*inch))
     
-    if 'charts' in data_dict and 'matrix' in data_dict['charts']:
-        fig = data_dict['charts']['matrix']
-        img_buffer = plotly_to_image(fig, width=800, height=600)
-        if img_buffer:
-            img_buffer.seek(0)
-            story.append(Image(img_buffer, width=16*cm, height=12*cm))
-            story.append(Spacer(1, 0.3*inch))
-    
-    story.append(PageBreak())
-    
-    # 3. 인기 콘텐츠
-    story.append(Paragraph("3. 인기 콘텐츠", heading_style))
-    
-    if 'charts' in data_dict and 'popular_cards' in data_dict['charts']:
-        fig = data_dict['charts']['popular_cards']
-        img_buffer = plotly_to_image(fig, width=800, height=500)
-        if img_buffer:
-            img_buffer.seek(0)
-            story.append(Image(img_buffer, width=16*cm, height=10*cm))
-            story.append(Spacer(1, 0.3*inch))
+    chart_flowable = _chart_flowable(chart, 16*cm, 12*cm)
+    if chart_flowable is not None:
+        story.append(chart_flowable)
+        story.append(Spacer(1, 0.3*inch))
     
     story.append(PageBreak())
+    return story
+
+def _build_popular_section(styles, chart):
+    """3. 인기 콘텐츠"""
+    story = [Paragraph("3. 인기 콘텐츠", styles['heading'])]
     
-    # 4. 조직별 분석
-    story.append(Paragraph("4. 조직별 학습 특징 분석", heading_style))
-    
-    if 'charts' in data_dict and 'org_learning' in data_dict['charts']:
-        fig = data_dict['charts']['org_learning']
-        img_buffer = plotly_to_image(fig, width=800, height=500)
-        if img_buffer:
-            img_buffer.seek(0)
-            story.append(Image(img_buffer, width=16*cm, height=10*cm))
-            story.append(Spacer(1, 0.2*inch))
-    
-    if 'insights' in data_dict and 'organization' in data_dict['insights']:
-        insight_text = data_dict['insights']['organization']
-        story.append(Paragraph("인사이트", subheading_style))
-        story.append(Paragraph(insight_text, normal_style))
-        story.append(Spacer(1, 0.2*inch))
+    chart_flowable = _chart_flowable(chart, 16*cm, 10*cm)
+    if chart_flowable is not None:
+        story.append(chart_flowable)
+        story.append(Spacer(1, 0.3*inch))
     
     story.append(PageBreak())
+    return story
+
+def _build_chart_insight_section(styles, title, chart, insight_text):
+    """차트 + 인사이트 섹션 (조직/직책/개인/변화군)"""
+    story = [Paragraph(title, styles['heading'])]
     
-    # 5. 직책별 분석
-    story.append(Paragraph("5. 직책별 학습 특징 분석", heading_style))
-    
-    if 'charts' in data_dict and 'position_learning' in data_dict['charts']:
-        fig = data_dict['charts']['position_learning']
-        img_buffer = plotly_to_image(fig, width=800, height=500)
-        if img_buffer:
-            img_buffer.seek(0)
-            story.append(Image(img_buffer, width=16*cm, height=10*cm))
-            story.append(Spacer(1, 0.2*inch))
-    
-    if 'insights' in data_dict and 'position' in data_dict['insights']:
-        insight_text = data_dict['insights']['position']
-        story.append(Paragraph("인사이트", subheading_style))
-        story.append(Paragraph(insight_text, normal_style))
+    chart_flowable = _chart_flowable(chart, 16*cm, 10*cm)
+    if chart_flowable is not None:
+        story.append(chart_flowable)
         story.append(Spacer(1, 0.2*inch))
     
-    story.append(PageBreak())
-    
-    # 6. 개인별 분석
-    story.append(Paragraph("6. 개인별 학습 특징 분석", heading_style))
-    
-    if 'charts' in data_dict and 'individual_distribution' in data_dict['charts']:
-        fig = data_dict['charts']['individual_distribution']
-        img_buffer = plotly_to_image(fig, width=800, height=500)
-        if img_buffer:
-            img_buffer.seek(0)
-            story.append(Image(img_buffer, width=16*cm, height=10*cm))
-            story.append(Spacer(1, 0.2*inch))
-    
-    if 'insights' in data_dict and 'individual' in data_dict['insights']:
-        insight_text = data_dict['insights']['individual']
-        story.append(Paragraph("인사이트", subheading_style))
-        story.append(Paragraph(insight_text, normal_style))
+    if insight_text is not None:
+        story.append(Paragraph("인사이트", styles['subheading']))
+        story.append(Paragraph(_insight_markup(insight_text), styles['normal']))
         story.append(Spacer(1, 0.2*inch))
     
     story.append(PageBreak())
+    return story
+
+def _build_area_section(styles, chart):
+    """8. 주요 영역별 학습 현황"""
+    story = [Paragraph("8. 주요 영역별 학습 현황", styles['heading'])]
     
-    # 7. 변화군 분석
-    story.append(Paragraph("7. 학습시간 변화군 분석", heading_style))
-    
-    if 'charts' in data_dict and 'change_group' in data_dict['charts']:
-        fig = data_dict['charts']['change_group']
-        img_buffer = plotly_to_image(fig, width=800, height=500)
-        if img_buffer:
-            img_buffer.seek(0)
-            story.append(Image(img_buffer, width=16*cm, height=10*cm))
-            story.append(Spacer(1, 0.2*inch))
-    
-    if 'insights' in data_dict and 'change_group' in data_dict['insights']:
-        insight_text = data_dict['insights']['change_group']
-        story.append(Paragraph("인사이트", subheading_style))
-        story.append(Paragraph(insight_text, normal_style))
+    chart_flowable = _chart_flowable(chart, 16*cm, 10*cm)
+    if chart_flowable is not None:
+        story.append(chart_flowable)
         story.append(Spacer(1, 0.2*inch))
     
     story.append(PageBreak())
-    
-    # 8. 주요 영역별
-    story.append(Paragraph("8. 주요 영역별 학습 현황", heading_style))
-    
-    if 'charts' in data_dict and 'area_status' in data_dict['charts']:
-        fig = data_dict['charts']['area_status']
-        img_buffer = plotly_to_image(fig, width=800, height=500)
-        if img_buffer:
-            img_buffer.seek(0)
-            story.append(Image(img_buffer, width=16*cm, height=10*cm))
-            story.append(Spacer(1, 0.2*inch))
-    
-    # 마지막 페이지 - 요약
-    story.append(PageBreak())
-    story.append(Paragraph("결론", heading_style))
+    return story
+
+def _build_conclusion_section(styles, report_date):
+    """마지막 페이지 - 결론"""
+    story = [Paragraph("결론", styles['heading'])]
     
     conclusion_text = """
     본 리포트는 mySUNI 플랫폼의 학습 데이터를 종합적으로 분석한 결과입니다.
     각 섹션에서 제시된 인사이트를 바탕으로 L&D 전략을 수립하시기 바랍니다.
     """
-    story.append(Paragraph(conclusion_text, normal_style))
+    story.append(Paragraph(conclusion_text, styles['normal']))
     story.append(Spacer(1, 0.5*inch))
-    story.append(Paragraph(f"생성일: {report_date}", normal_style))
+    story.append(Paragraph(f"생성일: {report_date}", styles['normal']))
+    return story
+
+# 조직/직책/개인/변화군 섹션 (섹션명, 제목, 차트명, 인사이트 키)
+CHART_INSIGHT_SECTIONS = [
+    ('organization', "4. 조직별 학습 특징 분석", 'org_learning', 'organization'),
+    ('position', "5. 직책별 학습 특징 분석", 'position_learning', 'position'),
+    ('individual', "6. 개인별 학습 특징 분석", 'individual_distribution', 'individual'),
+    ('change_group', "7. 학습시간 변화군 분석", 'change_group', 'change_group')
+]
+
+def create_pdf_report(data_dict, output_path=None):
+    """
+    PDF 리포트 생성 (섹션별로 조립 - 입력이 바뀐 섹션만 다시 생성)
+    
+    Args:
+        data_dict: 리포트에 포함할 데이터 딕셔너리
+            - charts: 차트 딕셔너리 {title: fig}
+            - insights: 인사이트 딕셔너리 {section: text}
+            - summary: 요약 통계
+            - company_name: 멤버사명
+            - chart_images: 미리 변환된 차트 이미지 {name: bytes} (선택, 있으면 charts 대신 사용)
+            - chart_format: 차트 삽입 형식 'png' / 'native' / 'svg' (선택, 기본값은 config.yaml)
+        output_path: 파일 경로 또는 file-like 객체 (None 이면 메모리 버퍼에 생성 후 bytes 반환)
+    """
+    buffer = BytesIO() if output_path is None else None
+    doc = SimpleDocTemplate(buffer if buffer is not None else output_path, pagesize=A4)
+    
+    chart_format = data_dict.get('chart_format') or load_report_config().get('chart_format', 'png')
+    charts = data_dict.get('chart_images')
+    if charts is None and chart_format in ('native', 'svg'):
+        # 벡터 형식은 섹션 생성 시 Figure 데이터로 변환 (섹션 캐시 키 = Figure 내용)
+        charts = {
+            name: (chart_format, name, fig if isinstance(fig, str) else fig.to_json())
+            for name, fig in data_dict.get('charts', {}).items()
+        }
+    elif charts is None:
+        # 차트 이미지 일괄 변환 (워커 풀 병렬 + 내용 해시 캐시)
+        charts = render_report_charts(data_dict.get('charts', {}))
+    
+    insights = data_dict.get('insights') or {}
+    company_name = data_dict.get('company_name', '전체')
+    period = data_dict.get('period', '2025년 상반기')
+    report_date = datetime.now().strftime("%Y년 %m월 %d일")
+    
+    story = []
+    story += get_section_flowables('cover', _build_cover_section, company_name, period, report_date)
+    story += get_section_flowables(
+        'summary', _build_summary_section, data_dict.get('summary'), charts.get('annual_trend')
+    )
+    story += get_section_flowables(
+        'learning_time', _build_learning_time_section, insights.get('learning_time'), charts.get('matrix')
+    )
+    story += get_section_flowables('popular', _build_popular_section, charts.get('popular_cards'))
+    for name, title, chart_name, insight_key in CHART_INSIGHT_SECTIONS:
+        story += get_section_flowables(
+            name, _build_chart_insight_section, title, charts.get(chart_name), insights.get(insight_key)
+        )
+    story += get_section_flowables('area', _build_area_section, charts.get('area_status'))
+    story += get_section_flowables('conclusion', _build_conclusion_section, report_date)
     
     # PDF 빌드
     doc.build(story)
+    if buffer is not None:
+        return buffer.getvalue()
     return output_path
 
-def collect_report_data():
-    """현재 세션의 데이터를 수집하여 리포트 데이터 구조 생성"""
-    from modules.data_loader import *
-    from modules.charts import *
-    from modules.eda_analyzer import *
+def get_report_cache_key(data_dict):
+    """리포트 입력(멤버사, 기간, 요약, 인사이트, 차트 내용, 생성일) 기반 캐시 키"""
+    hasher = hashlib.sha256()
+    for field in ['company_name', 'period', 'summary', 'insights', 'chart_format']:
+        hasher.update(f"{field}={data_dict.get(field)!r}|".encode('utf-8'))
+    hasher.update(datetime.now().strftime("%Y%m%d").encode('utf-8'))
+    for name, fig in sorted(data_dict.get('charts', {}).items()):
+        hasher.update(name.encode('utf-8'))
+        hasher.update((fig if isinstance(fig, str) else fig.to_json()).encode('utf-8'))
+    for name, img_bytes in sorted((data_dict.get('chart_images') or {}).items()):
+        hasher.update(name.encode('utf-8'))
+        hasher.update(img_bytes or b'')
+    return hasher.hexdigest()
+
+def get_pdf_report_bytes(data_dict):
+    """PDF 리포트 bytes (최근 생성 리포트는 입력이 같으면 재사용, 디스크에 파일을 남기지 않음)"""
+    key = get_report_cache_key(data_dict)
+    with _report_cache_lock:
+        pdf_bytes = _report_cache.get(key)
+        if pdf_bytes is not None:
+            _report_cache.move_to_end(key)
+            return pdf_bytes
+    
+    pdf_bytes = create_pdf_report(data_dict)
+    
+    max_items = int(load_report_config().get('pdf_cache_items', 8))
+    with _report_cache_lock:
+        _report_cache[key] = pdf_bytes
+        while len(_report_cache) > max_items:
+            _report_cache.popitem(last=False)
+    return pdf_bytes
+
+def _filter_company(df, company_name):
+    """멤버사 필터 (멤버사명 컬럼이 없는 데이터는 그대로)"""
+    if df is None or not company_name or '멤버사명' not in df.columns:
+        return df
+    return df[df['멤버사명'] == company_name]
+
+def build_shared_report_data():
+    """멤버사 공통(그룹 단위) 리포트 데이터 - 일괄 생성 시 한 번만 계산"""
+    from modules.data_loader import (
+        get_annual_learning_data, get_individual_data, get_popular_cards_data,
+        get_area_status_data, get_individual_full_raw_data, preprocess_individual_data
+    )
+    from modules.charts import create_matrix_chart, create_popular_cards_chart, create_area_status_chart
+    
+    annual_df = get_annual_learning_data()
+    individual_df = get_individual_data()
+    popular_df = get_popular_cards_data()
+    area_df = get_area_status_data()
+    
+    shared = {
+        'annual_df': annual_df,
+        'individual_df': preprocess_individual_data(individual_df.copy()) if individual_df is not None else None,
+        'individual_full_df': get_individual_full_raw_data(),
+        'popular_df': popular_df,
+        'area_df': area_df,
+        'charts': {}
+    }
+    
+    # 멤버사 간 비교 차트 및 멤버사 구분이 없는 데이터 차트
+    if annual_df is not None:
+        fig = create_matrix_chart(annual_df)
+        if fig:
+            shared['charts']['matrix'] = fig
+    
+    if popular_df is not None and '멤버사명' not in popular_df.columns:
+        fig = create_popular_cards_chart(popular_df)
+        if fig:
+            shared['charts']['popular_cards'] = fig
+    
+    if area_df is not None and '멤버사명' not in area_df.columns:
+        fig = create_area_status_chart(area_df)
+        if fig:
+            shared['charts']['area_status'] = fig
+    
+    return shared
+
+def collect_report_data(company_name=None, shared=None):
+    """
+    현재 세션의 데이터를 수집하여 리포트 데이터 구조 생성
+
+    Args:
+        company_name: 멤버사명 (None 또는 '전체' 이면 그룹 전체)
+        shared: build_shared_report_data() 결과 (일괄 생성 시 재사용)
+    """
+    from modules.charts import (
+        create_annual_trend_chart, create_popular_cards_chart,
+        create_org_learning_chart, create_position_learning_chart,
+        create_individual_distribution_chart, create_change_group_chart, create_area_status_chart
+    )
+    from modules.change_group_analyzer import classify_change_groups
+    
+    if company_name == '전체':
+        company_name = None
+    if shared is None:
+        shared = build_shared_report_data()
     
     data_dict = {
-        'charts': {},
+        'charts': dict(shared['charts']),
         'insights': {},
         'summary': {},
-        'company_name': '전체',
+        'company_name': company_name or '전체',
         'period': '2025년 상반기'
     }
     
     # 요약 통계
-    annual_df = get_annual_learning_data()
-    individual_df = get_individual_data()
+    annual_df = _filter_company(shared['annual_df'], company_name)
+    individual_df = _filter_company(shared['individual_df'], company_name)
     
     if annual_df is not None:
         if '학습시간' in annual_df.columns:
@@ -299,18 +488,14 @@ def collect_report_data():
         fig = create_annual_trend_chart(annual_df)
         if fig:
             data_dict['charts']['annual_trend'] = fig
-        
-        fig = create_matrix_chart(annual_df)
-        if fig:
-            data_dict['charts']['matrix'] = fig
     
-    popular_df = get_popular_cards_data()
-    if popular_df is not None:
-        fig = create_popular_cards_chart(popular_df)
+    popular_df = shared['popular_df']
+    if popular_df is not None and 'popular_cards' not in data_dict['charts']:
+        fig = create_popular_cards_chart(_filter_company(popular_df, company_name))
         if fig:
             data_dict['charts']['popular_cards'] = fig
     
-    if individual_df is not None:
+    if individual_df is not None and not individual_df.empty:
         fig = create_org_learning_chart(individual_df)
         if fig:
             data_dict['charts']['org_learning'] = fig
@@ -323,25 +508,183 @@ def collect_report_data():
         if fig:
             data_dict['charts']['individual_distribution'] = fig
     
-    area_df = get_area_status_data()
-    if area_df is not None:
-        fig = create_area_status_chart(area_df)
+    area_df = shared['area_df']
+    if area_df is not None and 'area_status' not in data_dict['charts']:
+        fig = create_area_status_chart(_filter_company(area_df, company_name))
         if fig:
             data_dict['charts']['area_status'] = fig
     
     # 변화군 차트
-    individual_full_df = get_individual_full_raw_data()
-    if individual_full_df is not None:
-        from modules.change_group_analyzer import classify_change_groups
+    individual_full_df = _filter_company(shared['individual_full_df'], company_name)
+    if individual_full_df is not None and not individual_full_df.empty:
         change_groups = classify_change_groups(individual_full_df)
         if change_groups:
             fig = create_change_group_chart(individual_full_df, change_groups)
             if fig:
                 data_dict['charts']['change_group'] = fig
     
-    # 인사이트는 세션에서 가져오기
-    if 'insights' in st.session_state:
-        data_dict['insights'] = st.session_state.insights
+    # 인사이트는 현재 데이터/멤버사 기준 인사이트 캐시에서 가져오기 (대시보드 AI 분석과 같은 프롬프트)
+    _fill_cached_insights(data_dict['insights'], company_name)
     
     return data_dict
 
+def _fill_cached_insights(insights, company_name=None):
+    """
+    비어 있는 섹션 인사이트를 인사이트 캐시에서 채움 (같은 데이터/멤버사로 이전에 생성한 결과)
+
+    캐시에도 없는 섹션은 규칙 기반 요약으로 채움 (config.yaml 의 insights.rule_fallback)
+    """
+    from modules.data_loader import get_dataset_version
+    from modules.gemini_insights import get_cached_report_insights, get_rule_insights, load_insight_config
+    
+    dataset_version = get_dataset_version()
+    for key, text in get_cached_report_insights(dataset_version, company_name).items():
+        insights.setdefault(key, text)
+    if dataset_version is not None and load_insight_config().get('rule_fallback', True):
+        for key, text in get_rule_insights(dataset_version, company_name).items():
+            insights.setdefault(key, text)
+
+# 일괄 생성 워커 프로세스 공유 데이터 (initializer 로 워커당 1회 전달)
+_batch_shared = None
+
+def _init_batch_worker(shared):
+    global _batch_shared
+    _batch_shared = shared
+
+def _collect_company_report(company_name):
+    """멤버사 리포트 데이터 수집 (워커 프로세스, 차트는 JSON 으로 반환)"""
+    report_data = collect_report_data(company_name, shared=_batch_shared)
+    report_data['charts'] = {name: fig.to_json() for name, fig in report_data['charts'].items()}
+    return report_data
+
+def _build_pdf_bytes(data_dict):
+    """리포트 데이터 → PDF bytes (워커 프로세스에서 실행)"""
+    return create_pdf_report(data_dict)
+
+def _run_company_batch(pool, companies, period, include_insights, chart_format='png'):
+    """멤버사별 수집 → 차트 일괄 변환 → PDF 조립 ({멤버사: PDF bytes})"""
+    # 1) 멤버사별 데이터/차트 수집 (병렬)
+    reports = dict(zip(companies, pool.map(_collect_company_report, companies)))
+    for company, report_data in reports.items():
+        report_data['period'] = period
+        report_data['chart_format'] = chart_format
+        if not include_insights:
+            report_data['insights'] = {}
+        else:
+            # 워커 프로세스에는 세션 데이터가 없으므로 캐시 인사이트는 여기서 채움
+            _fill_cached_insights(report_data['insights'], company)
+    
+    # 벡터 형식은 PDF 조립 시 Figure JSON 에서 직접 변환
+    if chart_format != 'png':
+        return dict(zip(reports.keys(), pool.map(_build_pdf_bytes, reports.values())))
+    
+    # 2) 전체 멤버사 차트를 한 번에 변환 (공통 차트는 동일 내용으로 1회만 변환)
+    chart_images = render_report_charts({
+        (company, name): fig_json
+        for company, report_data in reports.items()
+        for name, fig_json in report_data.pop('charts').items()
+    })
+    for report_data in reports.values():
+        report_data['chart_images'] = {}
+    for (company, name), img_bytes in chart_images.items():
+        reports[company]['chart_images'][name] = img_bytes
+    
+    # 3) PDF 조립 (병렬)
+    return dict(zip(reports.keys(), pool.map(_build_pdf_bytes, reports.values())))
+
+class _InlinePool:
+    """워커 수 1 설정 시 현재 프로세스에서 순차 실행 (pool.map 호환)"""
+    def map(self, fn, items):
+        return [fn(item) for item in items]
+
+def create_company_reports(companies=None, period='2025년 상반기', include_insights=True, chart_format=None, workers=None):
+    """
+    멤버사별 PDF 리포트 일괄 생성
+
+    Args:
+        companies: 멤버사 목록 (None 이면 get_company_list() 전체)
+        period: 분석 기간 라벨
+        include_insights: AI 인사이트 포함 여부
+        chart_format: 차트 삽입 형식 (None 이면 config.yaml 의 report.chart_format)
+        workers: 워커 프로세스 수 (None 이면 config.yaml 의 report.pdf_build_workers, 1 이면 현재 프로세스에서 순차 생성)
+
+    Returns:
+        {멤버사명: PDF bytes}
+    """
+    from modules.data_loader import get_company_list
+    
+    if companies is None:
+        companies = get_company_list()
+    if not companies:
+        return {}
+    
+    # 그룹 공통 계산은 한 번만 수행 후 워커에 전달
+    shared = build_shared_report_data()
+    report_config = load_report_config()
+    workers = min(int(workers or report_config.get('pdf_build_workers', 4)), len(companies))
+    chart_format = chart_format or report_config.get('chart_format', 'png')
+    
+    if workers > 1:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_batch_worker,
+            initargs=(shared,)
+        ) as pool:
+            pdf_bytes = _run_company_batch(pool, companies, period, include_insights, chart_format)
+    else:
+        _init_batch_worker(shared)
+        pdf_bytes = _run_company_batch(_InlinePool(), companies, period, include_insights, chart_format)
+    
+    return pdf_bytes
+
+def create_company_reports_zip(companies=None, period='2025년 상반기', include_insights=True, chart_format=None):
+    """
+    멤버사별 PDF 리포트 일괄 생성 후 ZIP 으로 묶기 (인자는 create_company_reports 와 동일)
+
+    Returns:
+        (zip bytes, 생성된 리포트 수)
+    """
+    pdf_bytes = create_company_reports(companies, period, include_insights, chart_format)
+    if not pdf_bytes:
+        return None, 0
+    
+    zip_buffer = BytesIO()
+    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        for company, content in pdf_bytes.items():
+            zip_file.writestr(f"Learning_Report_{company}_{period}.pdf", content)
+    
+    return zip_buffer.getvalue(), len(pdf_bytes)
+
+def build_pdf_report_job(progress, company_name=None, period='2025년 상반기', include_insights=True, chart_format=None):
+    """작업 큐용 PDF 리포트 생성 (다운로드 결과 딕셔너리 반환)"""
+    progress(0.1, "리포트 데이터 수집 중")
+    report_data = collect_report_data(company_name)
+    report_data['period'] = period
+    if chart_format:
+        report_data['chart_format'] = chart_format
+    if not include_insights:
+        report_data['insights'] = {}
+    
+    progress(0.4, "PDF 생성 중")
+    pdf_bytes = get_pdf_report_bytes(report_data)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return {
+        'data': pdf_bytes,
+        'file_name': f"Learning_Report_{report_data['company_name']}_{timestamp}.pdf",
+        'mime': 'application/pdf'
+    }
+
+def build_company_reports_zip_job(progress, companies=None, period='2025년 상반기', include_insights=True, chart_format=None):
+    """작업 큐용 멤버사별 리포트 ZIP 생성"""
+    progress(0.1, "멤버사별 리포트 생성 중")
+    zip_bytes, report_count = create_company_reports_zip(companies, period, include_insights, chart_format)
+    if not zip_bytes:
+        raise ValueError("생성할 멤버사 리포트가 없습니다.")
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return {
+        'data': zip_bytes,
+        'file_name': f"Learning_Reports_{period}_{timestamp}.zip",
+        'mime': 'application/zip',
+        'summary': f"{report_count}개 멤버사 리포트 생성 완료"
+    }
@@ -0,0 +1,146 @@
+"""
+프롬프트 압축 모듈
+EDA 통계 표를 토큰 예산 안으로 줄여 AI 인사이트 프롬프트 크기/지연 시간을 일정하게 유지
+
+- 값이 모두 같은 열 제거, 숫자 반올림
+- 기준 지표 평균 대비 차이 추가 후 상위/하위 k개 행만 유지 (나머지는 요약 한 줄)
+- 그래도 예산을 넘으면 우선순위가 낮은 열부터 제거, 최종적으로 줄 단위 절단
+"""
+
+import pandas as pd
+
+# 우선 유지할 열 (앞쪽일수록 우선)
+PRIORITY_COLUMNS = [
+    '평균학습시간', '평균대비차이', '인원수', '평균대비비율', '중위수', '표준편차',
+    '평균학습카드수', '평균완료카드수', '평균Badge수', 'Badge보유율', '분산계수', '최소값', '최대값'
+]
+
+# 상위/하위 행 수 최솟값 (예산이 부족해도 이 이하로는 줄이지 않음)
+MIN_EDGE_ROWS = 3
+
+def estimate_tokens(text):
+    """토큰 수 추정 (영문/숫자 약 4자당 1토큰, 한글 등 비ASCII 약 1.5자당 1토큰)"""
+    if not text:
+        return 0
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return int(ascii_chars / 4 + (len(text) - ascii_chars) / 1.5) + 1
+
+def _drop_constant_columns(df, keep):
+    columns = [
+        column for column in df.columns
+        if column in keep or df[column].nunique(dropna=False) > 1
+    ]
+    return df[columns]
+
+def compact_stats_table(df, edge_rows=None, label_col=None, value_col='평균학습시간', max_columns=None):
+    """
+    통계 표 압축
+
+    Args:
+        df: 그룹별 통계 DataFrame
+        edge_rows: 상위/하위 유지 행 수 (None 이면 전체 유지)
+        label_col: 그룹명 열 (None 이면 첫 번째 열)
+        value_col: 순위/평균 대비 차이 기준 열
+        max_columns: 유지할 최대 열 수 (그룹명 열 제외, PRIORITY_COLUMNS 순)
+
+    Returns:
+        (압축 DataFrame, 생략 요약 문자열 또는 None)
+    """
+    label_col = label_col or df.columns[0]
+    compact = _drop_constant_columns(df, keep={label_col, value_col})
+
+    if value_col in compact.columns and pd.api.types.is_numeric_dtype(compact[value_col]):
+        mean_value = compact[value_col].mean()
+        compact = compact.assign(평균대비차이=compact[value_col] - mean_value)
+        compact = compact.sort_values(value_col, ascending=False)
+
+    if max_columns is not None:
+        others = [column for column in compact.columns if column != label_col]
+        ranked = sorted(
+            others,
+            key=lambda column: PRIORITY_COLUMNS.index(column) if column in PRIORITY_COLUMNS else len(PRIORITY_COLUMNS)
+        )
+        compact = compact[[label_col] + ranked[:max_columns]]
+
+    compact = compact.round(1)
+
+    omitted = None
+    if edge_rows is not None and len(compact) > edge_rows * 2:
+        middle = compact.iloc[edge_rows:-edge_rows]
+        omitted = f"(중간 {len(middle)}개 그룹 생략"
+        if value_col in middle.columns:
+            omitted += f": {value_col} 평균 {middle[value_col].mean():.1f}, 범위 {middle[value_col].min():.1f}~{middle[value_col].max():.1f}"
+        omitted += ")"
+        compact = pd.concat([compact.iloc[:edge_rows], compact.iloc[-edge_rows:]])
+
+    return compact.reset_index(drop=True), omitted
+
+def fit_text_to_budget(text, token_budget):
+    """줄 단위로 잘라 토큰 예산에 맞춤 (잘린 경우 생략 줄 수 표시)"""
+    if estimate_tokens(text) <= token_budget:
+        return text
+    lines = text.split('\n')
+    kept = []
+    for line in lines:
+        if estimate_tokens('\n'.join(kept + [line])) > token_budget:
+            break
+        kept.append(line)
+    return '\n'.join(kept + [f"... (이하 {len(lines) - len(kept)}줄 생략)"])
+
+def compact_stats(df, token_budget, render=None, label_col=None, value_col='평균학습시간'):
+    """
+    통계 표 → 토큰 예산 이내 프롬프트 텍스트
+
+    Args:
+        df: 그룹별 통계 DataFrame
+        token_budget: 통계 텍스트 토큰 예산
+        render: 표 → 텍스트 함수 (None 이면 df.to_string(index=False))
+
+    Returns:
+        (텍스트, 크기 지표 딕셔너리)
+    """
+    render = render or (lambda table: table.to_string(index=False))
+    original_text = render(df)
+    metrics = {
+        'budget': token_budget,
+        'original_tokens': estimate_tokens(original_text),
+        'rows': len(df),
+        'columns': len(df.columns)
+    }
+
+    # 행 → 열 순서로 줄여가며 예산 안에 들어오는 첫 결과 사용
+    edge_rows = None
+    max_columns = None
+    while True:
+        compact, omitted = compact_stats_table(df, edge_rows, label_col, value_col, max_columns)
+        text = render(compact) + (f"\n{omitted}" if omitted else "")
+        if estimate_tokens(text) <= token_budget:
+            break
+        if edge_rows is None and len(df) > MIN_EDGE_ROWS * 2:
+            edge_rows = max(MIN_EDGE_ROWS, len(df) // 4)
+        elif edge_rows is not None and edge_rows > MIN_EDGE_ROWS:
+            edge_rows = max(MIN_EDGE_ROWS, edge_rows // 2)
+        elif max_columns is None or max_columns > 3:
+            max_columns = (len(compact.columns) - 1) // 2 if max_columns is None else max(3, max_columns // 2)
+        else:
+            text = fit_text_to_budget(text, token_budget)
+            break
+
+    metrics.update({
+        'tokens': estimate_tokens(text),
+        'rows_kept': len(compact),
+        'columns_kept': len(compact.columns)
+    })
+    return text, metrics
+
+def format_prompt_metrics(metrics):
+    """크기 지표 표시 문자열"""
+    if not metrics:
+        return ""
+    text = f"프롬프트 통계 약 {metrics['tokens']:,} 토큰"
+    if metrics.get('original_tokens', metrics['tokens']) != metrics['tokens']:
+        text += f" (원본 {metrics['original_tokens']:,} 토큰"
+        if 'rows' in metrics:
+            text += f", 행 {metrics['rows_kept']}/{metrics['rows']}, 열 {metrics['columns_kept']}/{metrics['columns']}"
+        text += ")"
+    return text
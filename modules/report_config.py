@@ -0,0 +1,25 @@
+"""
+리포트 설정 모듈
+config.yaml 의 report 섹션과 차트 삽입 형식 (reportlab 을 임포트하지 않음 - 사이드바 옵션 표시용)
+"""
+
+import os
+import importlib.util
+import yaml
+
+# 리포트 차트 삽입 형식 (png: 래스터 이미지, native: ReportLab 기본 차트, svg: SVG → 벡터 변환)
+# svg 는 svglib 이 설치된 경우만 (선택 의존성 - 없으면 사이드바/CLI 선택지에서 제외)
+CHART_FORMATS = ['png', 'native'] + (['svg'] if importlib.util.find_spec('svglib') is not None else [])
+
+def load_report_config():
+    """리포트 설정 로드"""
+    defaults = {'pdf_build_workers': 4, 'pdf_cache_items': 8, 'pdf_section_cache_items': 64, 'chart_format': 'png'}
+    config_path = 'config.yaml'
+    if os.path.exists(config_path):
+        with open(config_path, 'r', encoding='utf-8') as file:
+            config = yaml.safe_load(file) or {}
+            defaults.update(config.get('report', {}) or {})
+    # 사용할 수 없는 형식(svglib 미설치 시 svg 등)은 png
+    if defaults['chart_format'] not in CHART_FORMATS:
+        defaults['chart_format'] = 'png'
+    return defaults
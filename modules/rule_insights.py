@@ -0,0 +1,257 @@
+"""
+규칙 기반 인사이트 모듈
+분석 표(조직/직책/개인/변화군 통계, Matrix)에서 정해진 규칙으로 한국어 요약문 생성 (API 호출 없음, 수 ms)
+
+- 상위/하위 그룹, 전체 평균 대비 차이, 최고-최저 격차
+- 그룹 내 편차, 학습 분포 치우침, 연도별 증감 방향
+- Gemini 를 사용할 수 없을 때의 대체 인사이트이자 Gemini 가 다듬는 초안으로 사용
+"""
+
+import re
+import pandas as pd
+
+# 증감 방향 판단 기준 (변화율 ±%)
+TREND_THRESHOLD = 5.0
+
+# 상위/하위 그룹 최대 표시 수
+MAX_EDGE_GROUPS = 3
+
+# 인사이트 키별로 사용하는 분석 표 (get_analysis_results 키)
+RULE_INSIGHT_TABLES = {
+    'organization': 'org_stats',
+    'position': 'position_stats',
+    'individual': 'individual_stats',
+    'change_group': 'change_group_stats',
+    'learning_time': 'matrix'
+}
+
+def _josa(word, with_final, without_final):
+    """받침 유무에 맞는 조사 (한글이 아닌 글자로 끝나면 병기)"""
+    last = str(word)[-1:] if word is not None else ''
+    if '가' <= last <= '힣':
+        return with_final if (ord(last) - ord('가')) % 28 else without_final
+    return f"{with_final}({without_final})"
+
+def _hours(value):
+    return f"{value:,.1f}시간"
+
+def _percent(value):
+    return f"{value:+.1f}%"
+
+def trend_direction(change_rate, threshold=TREND_THRESHOLD):
+    """변화율(%) → 증감 방향 문구"""
+    if change_rate > threshold:
+        return "증가"
+    if change_rate < -threshold:
+        return "감소"
+    return "유사한 수준 유지"
+
+def _weighted_mean(df, value_col, weight_col='인원수'):
+    """인원수 가중 평균 (인원수 열이 없으면 단순 평균)"""
+    if weight_col in df.columns and df[weight_col].sum() > 0:
+        return (df[value_col] * df[weight_col]).sum() / df[weight_col].sum()
+    return df[value_col].mean()
+
+def _group_list(df, label_col, value_col):
+    return ", ".join(f"{row[label_col]}({_hours(row[value_col])})" for _, row in df.iterrows())
+
+def describe_group_stats(stats_df, unit, label_col=None, value_col='평균학습시간'):
+    """
+    그룹별 통계 표 요약 (조직별/직책별 분석 결과)
+
+    Args:
+        stats_df: analyze_organization_characteristics / analyze_position_characteristics 결과
+        unit: 그룹 단위 명칭 (예: '조직', '직책')
+        label_col: 그룹명 열 (None 이면 첫 번째 열)
+
+    Returns:
+        요약 문장 목록 (데이터가 없으면 빈 목록)
+    """
+    if stats_df is None or stats_df.empty or value_col not in stats_df.columns:
+        return []
+    label_col = label_col or stats_df.columns[0]
+    df = stats_df.dropna(subset=[value_col]).sort_values(value_col, ascending=False)
+    if df.empty:
+        return []
+
+    overall = _weighted_mean(df, value_col)
+    top, bottom = df.iloc[0], df.iloc[-1]
+    lines = []
+    if len(df) == 1:
+        return [f"{top[label_col]}의 평균 학습시간은 {_hours(top[value_col])}입니다."]
+
+    def gap(value):
+        return _percent((value / overall - 1) * 100) if overall > 0 else "-"
+
+    lines.append(
+        f"{len(df)}개 {unit} 중 평균 학습시간이 가장 높은 {unit}은 **{top[label_col]}**({_hours(top[value_col])}, 전체 평균 대비 {gap(top[value_col])})이고, "
+        f"가장 낮은 {unit}은 **{bottom[label_col]}**({_hours(bottom[value_col])}, {gap(bottom[value_col])})입니다."
+    )
+
+    spread = top[value_col] - bottom[value_col]
+    ratio = f" (약 {top[value_col] / bottom[value_col]:.1f}배)" if bottom[value_col] > 0 else ""
+    lines.append(f"최고-최저 {unit} 간 격차는 {_hours(spread)}{ratio}입니다.")
+
+    edge = min(MAX_EDGE_GROUPS, len(df) // 2)
+    if len(df) > 4 and edge > 0:
+        lines.append(
+            f"상위 {unit}: {_group_list(df.head(edge), label_col, value_col)} / "
+            f"하위 {unit}: {_group_list(df.tail(edge).iloc[::-1], label_col, value_col)}"
+        )
+
+    above = int((df[value_col] > overall).sum())
+    lines.append(f"전체 평균({_hours(overall)})보다 학습시간이 많은 {unit}은 {above}개({above / len(df) * 100:.0f}%)입니다.")
+
+    if '분산계수' in df.columns:
+        variation = df.dropna(subset=['분산계수'])
+        if '인원수' in variation.columns:
+            variation = variation[variation['인원수'] > 1]
+        if not variation.empty:
+            widest = variation.loc[variation['분산계수'].idxmax()]
+            lines.append(
+                f"{unit} 내 개인 간 편차가 가장 큰 곳은 {widest[label_col]}(분산계수 {widest['분산계수']:.1f}%)로, "
+                f"일부 학습자에게 학습시간이 집중되어 있습니다."
+            )
+
+    for column, name in (('Badge보유율', 'Badge 보유율'), ('평균완료률', '학습카드 완료율')):
+        if column in df.columns and df[column].notna().any() and df[column].nunique() > 1:
+            best = df.loc[df[column].idxmax()]
+            lines.append(f"{name}은 {best[label_col]}{_josa(best[label_col], '이', '가')} {best[column]:.1f}%로 가장 높습니다.")
+
+    return lines
+
+def describe_individual_stats(stats):
+    """개인별 통계(analyze_individual_characteristics 의 통계 딕셔너리) 요약"""
+    if not stats or not stats.get('총인원수'):
+        return []
+    mean, median = stats['평균학습시간'], stats['중위수학습시간']
+    lines = [
+        f"전체 {stats['총인원수']:,}명의 평균 학습시간은 {_hours(mean)}, 중위수는 {_hours(median)}입니다."
+    ]
+
+    if median > 0:
+        skew = (mean / median - 1) * 100
+        if skew > 10:
+            lines.append(f"평균이 중위수보다 {skew:.0f}% 높아, 소수의 고학습자가 평균을 끌어올리는 분포입니다.")
+        elif skew < -10:
+            lines.append(f"평균이 중위수보다 {-skew:.0f}% 낮아, 학습시간이 매우 적은 일부 인원이 평균을 낮추고 있습니다.")
+        else:
+            lines.append("평균과 중위수가 비슷해 학습시간이 비교적 고르게 분포되어 있습니다.")
+
+    lines.append(
+        f"중간 50% 인원의 학습시간은 {_hours(stats['1사분위수'])}~{_hours(stats['3사분위수'])} 범위입니다."
+    )
+
+    if stats.get('고학습자평균') is not None and stats.get('저학습자평균') is not None:
+        gap = stats['고학습자평균'] - stats['저학습자평균']
+        lines.append(
+            f"고학습자(상위 25%, {stats['고학습자수']:,}명)의 평균은 {_hours(stats['고학습자평균'])}으로 "
+            f"저학습자(하위 25%, {stats['저학습자수']:,}명) 평균 {_hours(stats['저학습자평균'])}보다 {_hours(gap)} 많습니다."
+        )
+    return lines
+
+def _year_columns(stats_df):
+    """변화군 통계의 연도별 평균 열 (연도 오름차순)"""
+    columns = []
+    for column in stats_df.columns:
+        match = re.match(r'^(\d{4})년평균학습시간$', str(column))
+        if match:
+            columns.append((int(match.group(1)), column))
+    return [column for _, column in sorted(columns)]
+
+def describe_change_groups(stats_df):
+    """변화군별 통계(get_change_group_statistics 결과) 요약 - 인원 구성, 그룹별 증감 방향"""
+    if stats_df is None or stats_df.empty or '변화군' not in stats_df.columns:
+        return []
+    lines = []
+    total = stats_df['인원수'].sum() if '인원수' in stats_df.columns else 0
+    if total > 0:
+        largest = stats_df.loc[stats_df['인원수'].idxmax()]
+        lines.append(
+            f"{len(stats_df)}개 변화군 중 가장 큰 그룹은 **{largest['변화군']}**({largest['인원수']:,}명, "
+            f"{largest['인원수'] / total * 100:.1f}%)입니다."
+        )
+        counts = stats_df.set_index('변화군')['인원수']
+        rising, falling = counts.get('상승군', 0), counts.get('하락군', 0)
+        if rising or falling:
+            direction = "상승군이 하락군보다 많아 전반적으로 학습이 늘어나는 추세" if rising > falling else (
+                "하락군이 상승군보다 많아 전반적으로 학습이 줄어드는 추세" if falling > rising else "상승군과 하락군 규모가 같은 상태"
+            )
+            lines.append(f"상승군 {rising:,}명, 하락군 {falling:,}명으로 {direction}입니다.")
+
+    year_columns = _year_columns(stats_df)
+    if len(year_columns) >= 2:
+        first, last = year_columns[0], year_columns[-1]
+        first_year, last_year = first[:4], last[:4]
+        for _, row in stats_df.iterrows():
+            if pd.isna(row[first]) or pd.isna(row[last]):
+                continue
+            change = (row[last] / row[first] - 1) * 100 if row[first] > 0 else None
+            change_text = f", {_percent(change)}" if change is not None else ""
+            direction = trend_direction(change) if change is not None else ("증가" if row[last] > 0 else "유사한 수준 유지")
+            lines.append(
+                f"{row['변화군']}: {first_year}년 {_hours(row[first])} → {last_year}년 {_hours(row[last])}{change_text} ({direction})"
+            )
+
+    if '평균변화율(%)' in stats_df.columns and stats_df['평균변화율(%)'].notna().any():
+        best = stats_df.loc[stats_df['평균변화율(%)'].idxmax()]
+        worst = stats_df.loc[stats_df['평균변화율(%)'].idxmin()]
+        if best['변화군'] != worst['변화군']:
+            lines.append(
+                f"최근 변화율은 {best['변화군']}{_josa(best['변화군'], '이', '가')} {_percent(best['평균변화율(%)'])}로 가장 높고, "
+                f"{worst['변화군']}{_josa(worst['변화군'], '이', '가')} {_percent(worst['평균변화율(%)'])}로 가장 낮습니다."
+            )
+    return lines
+
+def describe_matrix(matrix_df):
+    """멤버사별 Matrix(멤버사명, 변화(%), 올해(시간)) 요약 - 학습시간 수준과 전년 대비 증감"""
+    if matrix_df is None or matrix_df.empty:
+        return []
+    df = matrix_df.dropna(subset=['올해(시간)'])
+    if df.empty:
+        return []
+    lines = []
+    top = df.loc[df['올해(시간)'].idxmax()]
+    lines.append(
+        f"인당 평균 학습시간은 {top['멤버사명']}{_josa(top['멤버사명'], '이', '가')} {_hours(top['올해(시간)'])}으로 가장 높고, "
+        f"{len(df)}개 멤버사 평균은 {_hours(df['올해(시간)'].mean())}입니다."
+    )
+    changes = df['변화(%)'].astype(float)
+    if (changes != 0).any():
+        increased = int((changes > TREND_THRESHOLD).sum())
+        decreased = int((changes < -TREND_THRESHOLD).sum())
+        lines.append(
+            f"전년 대비 학습시간이 증가한 멤버사 {increased}개, 감소한 멤버사 {decreased}개로 "
+            f"전체적으로 {trend_direction(changes.mean())} 추세(평균 {_percent(changes.mean())})입니다."
+        )
+        best = df.loc[changes.idxmax()]
+        worst = df.loc[changes.idxmin()]
+        if best['멤버사명'] != worst['멤버사명']:
+            lines.append(
+                f"증가폭은 {best['멤버사명']}({_percent(best['변화(%)'])})이 가장 크고, "
+                f"{worst['멤버사명']}({_percent(worst['변화(%)'])})이 가장 작습니다."
+            )
+    return lines
+
+def _to_markdown(lines):
+    return "\n".join(f"- {line}" for line in lines) if lines else None
+
+def build_rule_insights(results):
+    """
+    분석 결과 → 규칙 기반 인사이트
+
+    Args:
+        results: get_analysis_results() 결과 딕셔너리 (RULE_INSIGHT_TABLES 의 표만 사용, 없는 표의 섹션은 제외)
+
+    Returns:
+        {인사이트 키: 마크다운 텍스트} - 리포트 인사이트 키(organization, position, individual,
+        change_group, learning_time)와 같음, 데이터가 없는 섹션은 제외
+    """
+    sections = {
+        'organization': describe_group_stats(results.get('org_stats'), '조직'),
+        'position': describe_group_stats(results.get('position_stats'), '직책', label_col='직책'),
+        'individual': describe_individual_stats(results.get('individual_stats')),
+        'change_group': describe_change_groups(results.get('change_group_stats')),
+        'learning_time': describe_matrix(results.get('matrix'))
+    }
+    return {key: _to_markdown(lines) for key, lines in sections.items() if lines}
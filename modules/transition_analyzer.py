@@ -0,0 +1,120 @@
+"""
+구간 이동(Transition Matrix) 분석 모듈
+연도 간 학습시간 분위 구간 이동 분석 (Markov 관점)
+"""
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+from itertools import combinations
+from modules.cache_store import load_cached, save_cached, make_cache_key, touch_cached, prune_namespace
+
+CACHE_NAMESPACE = 'transitions'
+
+def get_tier_labels(n_tiers=5):
+    """분위 구간 라벨 (Q1=하위 ~ Qn=상위)"""
+    labels = [f"Q{i + 1}" for i in range(n_tiers)]
+    labels[0] += "(하위)"
+    labels[-1] += "(상위)"
+    return labels
+
+def assign_tiers(pivot_df, n_tiers=5):
+    """연도별 학습시간을 분위 구간 번호(0 ~ n_tiers-1)로 변환 - 연도 컬럼 일괄 rank"""
+    pct = pivot_df.rank(method='average', pct=True).to_numpy()
+    tiers = np.ceil(pct * n_tiers).astype(np.int64) - 1
+    return np.clip(tiers, 0, n_tiers - 1)
+
+def compute_tier_transitions(df, n_tiers=5):
+    """
+    연도 쌍별 분위 구간 이동 행렬 계산 (전체 + 멤버사별)
+
+    Args:
+        df: 개인별 학습 전체 raw (개인ID, 연도, 학습시간, 멤버사명(선택))
+        n_tiers: 분위 구간 수 (기본 5분위)
+
+    Returns:
+        {'years': [...], 'labels': [...],
+         'overall': {(from_year, to_year): DataFrame},
+         'by_company': {멤버사명: {(from_year, to_year): DataFrame}}}
+        행 = 기준 연도 구간, 열 = 비교 연도 구간, 값 = 인원수
+    """
+    if df is None or df.empty:
+        return None
+    if not all(col in df.columns for col in ['개인ID', '연도', '학습시간']):
+        return None
+
+    # 개인별 연도별 학습시간 피벗 (미학습 연도는 0)
+    pivot_df = df.pivot_table(
+        index='개인ID',
+        columns='연도',
+        values='학습시간',
+        aggfunc='sum'
+    ).fillna(0)
+
+    years = sorted([y for y in pivot_df.columns if isinstance(y, (int, np.integer)) and y >= 2022])
+    if len(years) < 2:
+        return None
+    pivot_df = pivot_df[years]
+
+    tiers = assign_tiers(pivot_df, n_tiers)
+    labels = get_tier_labels(n_tiers)
+    year_idx = {year: i for i, year in enumerate(years)}
+
+    # 개인별 멤버사 코드 (개인당 첫 번째 멤버사 기준)
+    company_codes, companies = None, []
+    if '멤버사명' in df.columns:
+        person_company = df.groupby('개인ID')['멤버사명'].first().reindex(pivot_df.index)
+        company_codes, company_index = pd.factorize(person_company, sort=True)
+        companies = company_index.tolist()
+
+    n_cells = n_tiers * n_tiers
+    result = {
+        'years': years,
+        'labels': labels,
+        'overall': {},
+        'by_company': {company: {} for company in companies}
+    }
+
+    for from_year, to_year in combinations(years, 2):
+        # 이동 코드 = 기준구간 * n + 비교구간 → bincount 로 일괄 집계
+        codes = tiers[:, year_idx[from_year]] * n_tiers + tiers[:, year_idx[to_year]]
+        counts = np.bincount(codes, minlength=n_cells).reshape(n_tiers, n_tiers)
+        result['overall'][(from_year, to_year)] = pd.DataFrame(counts, index=labels, columns=labels)
+
+        if company_codes is not None and companies:
+            valid = company_codes >= 0
+            company_cells = company_codes[valid] * n_cells + codes[valid]
+            company_counts = np.bincount(
+                company_cells, minlength=len(companies) * n_cells
+            ).reshape(len(companies), n_tiers, n_tiers)
+            for i, company in enumerate(companies):
+                result['by_company'][company][(from_year, to_year)] = pd.DataFrame(
+                    company_counts[i], index=labels, columns=labels
+                )
+
+    return result
+
+def get_transition_rates(counts_df):
+    """이동 인원 행렬 → 행 기준 이동 비율(%) 행렬"""
+    if counts_df is None or counts_df.empty:
+        return None
+    row_sums = counts_df.sum(axis=1).replace(0, np.nan)
+    return (counts_df.div(row_sums, axis=0) * 100).fillna(0).round(1)
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def get_tier_transitions(_df, dataset_version, n_tiers=5):
+    """데이터셋 버전별 캐시된 구간 이동 행렬 (메모리 + 디스크 캐시, _df 는 해시하지 않음)"""
+    if dataset_version is None:
+        return compute_tier_transitions(_df, n_tiers)
+
+    key = make_cache_key(dataset_version, n_tiers)
+    cached = load_cached(CACHE_NAMESPACE, key)
+    if cached is not None:
+        touch_cached(CACHE_NAMESPACE, key)
+        return cached
+
+    transitions = compute_tier_transitions(_df, n_tiers)
+    if transitions is not None:
+        save_cached(CACHE_NAMESPACE, key, transitions)
+        prune_namespace(CACHE_NAMESPACE)
+    return transitions
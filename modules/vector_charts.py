@@ -0,0 +1,303 @@
+"""
+벡터 차트 변환 모듈
+Plotly Figure → ReportLab Drawing (PDF 에 래스터 이미지 대신 벡터로 삽입)
+
+- native: Figure 데이터로 ReportLab 기본 차트를 직접 구성 (브라우저 렌더링 불필요)
+- svg: kaleido SVG 출력을 svglib 으로 Drawing 변환 (svglib 설치 시)
+- 차트 텍스트는 한글 글꼴(report.chart_font)로 표시, 글꼴 등록 실패 시 한글이 있는 차트는 None (PNG 로 대체)
+"""
+
+import os
+import numpy as np
+import base64
+from io import BytesIO
+import plotly.io as pio
+from reportlab.lib import colors
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.graphics.shapes import Drawing, String, Group
+from reportlab.graphics.charts.barcharts import VerticalBarChart, HorizontalBarChart
+from reportlab.graphics.charts.lineplots import LinePlot
+from reportlab.graphics.charts.legends import Legend
+from reportlab.graphics.widgets.markers import makeMarker
+from modules.report_config import load_report_config
+
+try:
+    from svglib.svglib import svg2rlg
+except ImportError:
+    svg2rlg = None
+
+SVG_CONVERSION_AVAILABLE = svg2rlg is not None
+
+# Plotly 기본 색상 순서
+SERIES_COLORS = ['#636efa', '#ef553b', '#00cc96', '#ab63fa', '#ffa15a', '#19d3f3', '#ff6692', '#b6e880']
+
+# 제목/범례/축 여백 (pt)
+TITLE_HEIGHT = 24
+LEGEND_HEIGHT = 18
+AXIS_MARGIN = 40
+
+# 한글 차트 글꼴 (ReportLab 내장 CID 글꼴 - 글꼴 파일 불필요)
+DEFAULT_CHART_FONT = 'HYSMyeongJo-Medium'
+_chart_font = False
+
+def get_chart_font():
+    """
+    차트 텍스트 글꼴 이름 (프로세스당 한 번 등록)
+
+    report.chart_font 가 .ttf/.ttc/.otf 경로면 TTF 글꼴, 아니면 CID 글꼴 이름으로 등록
+
+    Returns:
+        등록된 글꼴 이름 (등록 실패 시 None)
+    """
+    global _chart_font
+    if _chart_font is False:
+        font = str(load_report_config().get('chart_font') or DEFAULT_CHART_FONT)
+        try:
+            if font.lower().endswith(('.ttf', '.ttc', '.otf')):
+                name = os.path.splitext(os.path.basename(font))[0]
+                pdfmetrics.registerFont(TTFont(name, font))
+            else:
+                name = font
+                pdfmetrics.registerFont(UnicodeCIDFont(font))
+            _chart_font = name
+        except Exception:
+            _chart_font = None
+    return _chart_font
+
+def _needs_unicode_font(texts):
+    """기본 글꼴(Helvetica, Latin-1)로 표시할 수 없는 문자 포함 여부"""
+    return any(ord(ch) > 0xFF for text in texts for ch in str(text))
+
+def _figure_texts(fig):
+    """Figure 에 표시되는 텍스트 (제목, 축 제목, 범례, 범주)"""
+    texts = [_text(fig.layout.title), _text(fig.layout.xaxis.title), _text(fig.layout.yaxis.title)]
+    for trace in fig.data:
+        texts.append(trace.name or '')
+        for attr in ('x', 'y'):
+            values = _to_array(getattr(trace, attr, None))
+            if values is not None and values.dtype.kind in 'OUS':
+                texts.extend(values.ravel().tolist())
+    return texts
+
+def _to_array(values):
+    """trace 값 → numpy 배열 (Plotly JSON 의 base64 인코딩 배열 포함)"""
+    if values is None:
+        return None
+    if isinstance(values, dict) and 'bdata' in values:
+        array = np.frombuffer(base64.b64decode(values['bdata']), dtype=values['dtype'])
+        if 'shape' in values:
+            array = array.reshape([int(dim) for dim in str(values['shape']).split(',')])
+        return array
+    return np.asarray(values)
+
+def _text(title):
+    """Figure 제목/축 제목 텍스트 (없으면 빈 문자열)"""
+    if title is None:
+        return ''
+    return getattr(title, 'text', None) or ''
+
+def _add_title(drawing, fig, width, height, font):
+    title = _text(fig.layout.title)
+    if title:
+        drawing.add(String(width / 2, height - 16, title, fontName=font, fontSize=12, textAnchor='middle'))
+
+def _add_legend(drawing, names, width, font):
+    if len(names) < 2:
+        return
+    legend = Legend()
+    legend.x = AXIS_MARGIN
+    legend.y = LEGEND_HEIGHT - 4
+    legend.alignment = 'right'
+    legend.columnMaximum = 1
+    legend.fontName = font
+    legend.fontSize = 8
+    legend.deltax = max(width / (len(names) + 1), 60)
+    legend.colorNamePairs = [
+        (colors.HexColor(SERIES_COLORS[i % len(SERIES_COLORS)]), str(name)) for i, name in enumerate(names)
+    ]
+    drawing.add(legend)
+
+def _reference_lines(fig):
+    """add_hline/add_vline 기준선 → [('h' 또는 'v', 값)]"""
+    lines = []
+    for shape in fig.layout.shapes or []:
+        if shape.type != 'line':
+            continue
+        if shape.xref and str(shape.xref).endswith('domain') and shape.y0 == shape.y1:
+            lines.append(('h', float(shape.y0)))
+        elif shape.yref and str(shape.yref).endswith('domain') and shape.x0 == shape.x1:
+            lines.append(('v', float(shape.x0)))
+    return lines
+
+def _bar_drawing(fig, categories, series, names, width, height, font, horizontal=False):
+    drawing = Drawing(width, height)
+    chart = HorizontalBarChart() if horizontal else VerticalBarChart()
+    chart.x = AXIS_MARGIN * (3 if horizontal else 1.5)
+    chart.y = AXIS_MARGIN + LEGEND_HEIGHT
+    chart.width = width - chart.x - AXIS_MARGIN / 2
+    chart.height = height - chart.y - TITLE_HEIGHT - 10
+    chart.data = [tuple(float(v) for v in values) for values in series]
+    chart.categoryAxis.categoryNames = [str(c) for c in categories]
+    chart.categoryAxis.labels.fontName = font
+    chart.categoryAxis.labels.fontSize = 7
+    chart.valueAxis.labels.fontName = font
+    chart.valueAxis.labels.fontSize = 7
+    chart.valueAxis.valueMin = min(0, min(min(s) for s in chart.data))
+    if not horizontal and len(categories) > 8:
+        chart.categoryAxis.labels.angle = 45
+        chart.categoryAxis.labels.boxAnchor = 'ne'
+    for i in range(len(series)):
+        chart.bars[i].fillColor = colors.HexColor(SERIES_COLORS[i % len(SERIES_COLORS)])
+        chart.bars[i].strokeColor = None
+    drawing.add(chart)
+    _add_title(drawing, fig, width, height, font)
+    _add_legend(drawing, names, width, font)
+    return drawing
+
+def _bar_figure_drawing(fig, width, height, font):
+    """막대 차트 (세로/가로, 그룹 막대)"""
+    horizontal = fig.data[0].orientation == 'h'
+    cat_attr, val_attr = ('y', 'x') if horizontal else ('x', 'y')
+    categories = list(_to_array(getattr(fig.data[0], cat_attr)))
+    series, names = [], []
+    for trace in fig.data:
+        values = dict(zip(_to_array(getattr(trace, cat_attr)), _to_array(getattr(trace, val_attr))))
+        series.append([values.get(c, 0) for c in categories])
+        names.append(trace.name or '')
+    if horizontal and (fig.layout.yaxis.categoryorder or '').startswith('total'):
+        # 가로 막대는 아래에서 위로 그려지므로 값 오름차순 = Top 항목이 위
+        order = np.argsort(np.sum(series, axis=0))
+        categories = [categories[i] for i in order]
+        series = [[s[i] for i in order] for s in series]
+    return _bar_drawing(fig, categories, series, names, width, height, font, horizontal=horizontal)
+
+def _histogram_drawing(fig, width, height, font):
+    """히스토그램 → 구간별 막대 (numpy 로 구간 집계)"""
+    trace = fig.data[0]
+    values = _to_array(trace.x).astype(float)
+    values = values[~np.isnan(values)]
+    if values.size == 0:
+        return None
+    counts, edges = np.histogram(values, bins=trace.nbinsx or 30)
+    categories = [f"{edge:.0f}" for edge in edges[:-1]]
+    return _bar_drawing(fig, categories, [counts.tolist()], [], width, height, font)
+
+def _line_figure_drawing(fig, width, height, font):
+    """선/산점도 차트 (숫자 축, 기준선 포함)"""
+    series, names, joined = [], [], []
+    for trace in fig.data:
+        x = _to_array(trace.x).astype(float)
+        y = _to_array(trace.y).astype(float)
+        valid = ~(np.isnan(x) | np.isnan(y))
+        series.append(list(zip(x[valid], y[valid])))
+        names.append(trace.name or '')
+        joined.append('lines' in (trace.mode or 'lines'))
+    points = [p for s in series for p in s]
+    if not points:
+        return None
+
+    # 기준선은 데이터 범위를 가로지르는 보조 계열로 표시
+    xs, ys = [p[0] for p in points], [p[1] for p in points]
+    reference = []
+    for kind, value in _reference_lines(fig):
+        if kind == 'h':
+            reference.append([(min(xs), value), (max(xs), value)])
+        else:
+            reference.append([(value, min(ys)), (value, max(ys))])
+
+    drawing = Drawing(width, height)
+    plot = LinePlot()
+    plot.x = AXIS_MARGIN * 1.5
+    plot.y = AXIS_MARGIN + LEGEND_HEIGHT
+    plot.width = width - plot.x - AXIS_MARGIN / 2
+    plot.height = height - plot.y - TITLE_HEIGHT - 10
+    plot.data = series + reference
+    plot.xValueAxis.labels.fontName = font
+    plot.xValueAxis.labels.fontSize = 7
+    plot.yValueAxis.labels.fontName = font
+    plot.yValueAxis.labels.fontSize = 7
+    for i in range(len(series)):
+        color = colors.HexColor(SERIES_COLORS[i % len(SERIES_COLORS)])
+        plot.lines[i].strokeColor = color
+        plot.lines[i].strokeWidth = 1.5 if joined[i] else 0
+        plot.lines[i].symbol = makeMarker('FilledCircle', size=4, fillColor=color, strokeColor=color)
+    for i in range(len(series), len(plot.data)):
+        plot.lines[i].strokeColor = colors.gray
+        plot.lines[i].strokeDashArray = [3, 3]
+        plot.lines[i].strokeWidth = 0.8
+    drawing.add(plot)
+
+    xlabel, ylabel = _text(fig.layout.xaxis.title), _text(fig.layout.yaxis.title)
+    if xlabel:
+        drawing.add(String(plot.x + plot.width / 2, LEGEND_HEIGHT + 6, xlabel, fontName=font, fontSize=8, textAnchor='middle'))
+    if ylabel:
+        label = Group(String(0, 0, ylabel, fontName=font, fontSize=8, textAnchor='middle'))
+        label.translate(12, plot.y + plot.height / 2)
+        label.rotate(90)
+        drawing.add(label)
+    _add_title(drawing, fig, width, height, font)
+    _add_legend(drawing, names, width, font)
+    return drawing
+
+def figure_to_native_drawing(fig, width, height):
+    """
+    Plotly Figure → ReportLab 기본 차트 Drawing
+
+    Args:
+        fig: go.Figure 또는 fig.to_json() 문자열
+        width, height: Drawing 크기 (pt)
+
+    Returns:
+        Drawing (막대/히스토그램/선·산점도 외 trace 가 있거나 한글 글꼴 없이 한글이 있으면 None)
+    """
+    if isinstance(fig, str):
+        fig = pio.from_json(fig)
+    if not fig.data:
+        return None
+    font = get_chart_font()
+    if font is None:
+        if _needs_unicode_font(_figure_texts(fig)):
+            return None
+        font = 'Helvetica'
+
+    trace_types = {trace.type for trace in fig.data}
+    if trace_types == {'bar'} and len({trace.orientation for trace in fig.data}) == 1:
+        return _bar_figure_drawing(fig, width, height, font)
+    if trace_types == {'histogram'} and len(fig.data) == 1:
+        return _histogram_drawing(fig, width, height, font)
+    if trace_types == {'scatter'}:
+        return _line_figure_drawing(fig, width, height, font)
+    return None
+
+def _apply_chart_font(node, font):
+    """
+    Drawing 의 텍스트 중 기본 글꼴로 표시할 수 없는 String 에 차트 글꼴 지정
+
+    Returns:
+        한글 글꼴 없이 한글 텍스트가 있으면 False
+    """
+    if isinstance(node, String):
+        if not _needs_unicode_font([node.text]):
+            return True
+        if font is None:
+            return False
+        node.fontName = font
+        return True
+    return all(_apply_chart_font(child, font) for child in getattr(node, 'contents', []))
+
+def svg_to_drawing(svg_bytes, width, height):
+    """SVG bytes → 지정 크기로 맞춘 ReportLab Drawing (svglib 미설치 또는 한글 글꼴 없이 한글이 있으면 None)"""
+    if svg2rlg is None or not svg_bytes:
+        return None
+    drawing = svg2rlg(BytesIO(svg_bytes))
+    if drawing is None or not drawing.width or not drawing.height:
+        return None
+    # svglib 은 SVG 글꼴을 Helvetica 등으로 대체하므로 한글 텍스트는 차트 글꼴로 교체
+    if not _apply_chart_font(drawing, get_chart_font()):
+        return None
+    scale = min(width / drawing.width, height / drawing.height)
+    drawing.width, drawing.height = drawing.width * scale, drawing.height * scale
+    drawing.scale(scale, scale)
+    return drawing
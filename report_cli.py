@@ -0,0 +1,256 @@
+"""
+리포트 일괄 생성 CLI (Streamlit 화면 없이 실행 - 야간 배치용)
+원본 파일 디렉토리 → 업로드와 같은 컬럼 표준화/검증(FILE_TYPES, normalize_columns) → 분석 → PDF/Excel/JSON 저장
+
+- pdf: 그룹 전체 + 멤버사별 리포트 (멤버사별은 워커 프로세스 병렬 생성)
+- xlsx: 조직/직책/변화군 통계, 멤버사 평균, Matrix 분석표 (대시보드 Excel 내보내기와 동일)
+- json: 멤버사별 인당 평균, 변화율, 변화군 인원, 조직/직책 통계 (analytics.json)
+- --publish: 전체 멤버사 분석 요약을 분석 API(analytics_api.py) 공유 저장소에 게시
+
+실행:
+    python report_cli.py data_drops                                      # 전체 + 멤버사별 PDF
+    python report_cli.py data_drops --companies SK텔레콤 SK하이닉스 --formats pdf,xlsx,json
+    python report_cli.py data_drops --workers 8 --output-dir reports/nightly --no-overall
+    python report_cli.py data_drops --formats json --publish
+
+종료 코드: 0 성공, 1 데이터 없음/일부 파일 생성 실패, 2 잘못된 인자
+"""
+
+import sys
+import os
+import json
+import time
+import argparse
+from datetime import datetime
+
+import streamlit.config
+import streamlit.logger
+
+# 화면 없이 실행할 때의 Streamlit 세션/캐시 경고 숨김 (모듈 임포트 시 출력되므로 먼저 설정)
+streamlit.config.set_option('logger.level', 'error')
+streamlit.logger.set_log_level('error')
+
+from modules.file_uploader import load_data_directory
+from modules.data_loader import get_dataset_version, get_company_list
+from modules.analysis_results import summarize_analysis
+from modules.report_config import CHART_FORMATS
+from modules.analytics_store import build_analytics_summaries, publish_analytics
+from report_scheduler import get_report_period, log
+
+OUTPUT_FORMATS = ['pdf', 'xlsx', 'json']
+
+def parse_formats(value):
+    """쉼표 구분 출력 형식 → 목록 (argparse type)"""
+    formats = [fmt.strip().lower() for fmt in value.split(',') if fmt.strip()]
+    unknown = [fmt for fmt in formats if fmt not in OUTPUT_FORMATS]
+    if not formats or unknown:
+        raise argparse.ArgumentTypeError(
+            f"지원하지 않는 형식: {', '.join(unknown) or value} (가능: {', '.join(OUTPUT_FORMATS)})"
+        )
+    return list(dict.fromkeys(formats))
+
+def resolve_companies(requested):
+    """
+    대상 멤버사 결정
+
+    Returns:
+        (대상 멤버사 목록, 데이터에 없는 멤버사 목록) - requested 가 None 이면 전체 멤버사
+    """
+    available = get_company_list()
+    if requested is None:
+        return available, []
+    return [name for name in requested if name in available], [name for name in requested if name not in available]
+
+def _write_file(output_dir, filename, content):
+    with open(os.path.join(output_dir, filename), 'wb') as file:
+        file.write(content)
+    return filename
+
+def write_pdf_reports(output_dir, companies, period, include_overall, include_insights, chart_format, workers):
+    """PDF 리포트 저장 → (파일 목록, 실패 {대상: 오류})"""
+    from modules.pdf_generator import create_company_reports
+    from report_scheduler import create_overall_report
+
+    files, errors = [], {}
+    if include_overall:
+        try:
+            files.append(_write_file(
+                output_dir, f"Learning_Report_전체_{period}.pdf",
+                create_overall_report(period, include_insights, chart_format)
+            ))
+        except Exception as e:
+            errors['pdf:전체'] = str(e)
+    if companies:
+        try:
+            pdf_bytes = create_company_reports(
+                companies, period=period, include_insights=include_insights,
+                chart_format=chart_format, workers=workers
+            )
+        except Exception as e:
+            errors['pdf:멤버사'] = str(e)
+            pdf_bytes = {}
+        for company, content in pdf_bytes.items():
+            files.append(_write_file(output_dir, f"Learning_Report_{company}_{period}.pdf", content))
+    return files, errors
+
+def write_excel_reports(output_dir, targets, data_version):
+    """Excel 분석표 저장 (대상별 1개) → (파일 목록, 실패 {대상: 오류})"""
+    from modules.excel_exporter import create_excel_report
+
+    files, errors = [], {}
+    for company in targets:
+        name = company or '전체'
+        try:
+            excel_bytes = create_excel_report(company, dataset_version=data_version)
+        except Exception as e:
+            errors[f'xlsx:{name}'] = str(e)
+            continue
+        if excel_bytes is None:
+            errors[f'xlsx:{name}'] = "내보낼 분석 결과가 없습니다."
+            continue
+        files.append(_write_file(output_dir, f"Learning_Analysis_{name}.xlsx", excel_bytes))
+    return files, errors
+
+def write_analytics_json(output_dir, targets, data_version, period):
+    """분석 요약 JSON 저장 (analytics.json, 대상 전체를 한 파일에) → (파일 목록, 실패 {대상: 오류})"""
+    summaries, errors = [], {}
+    for company in targets:
+        try:
+            summaries.append(summarize_analysis(data_version, company))
+        except Exception as e:
+            errors[f"json:{company or '전체'}"] = str(e)
+    payload = {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'dataset_version': data_version,
+        'period': period,
+        'companies': summaries
+    }
+    filename = 'analytics.json'
+    _write_file(output_dir, filename, json.dumps(payload, ensure_ascii=False, indent=2).encode('utf-8'))
+    return [filename], errors
+
+def run_batch(data_dir, output_dir, companies=None, formats=('pdf',), workers=None, period=None,
+              include_overall=True, include_insights=False, chart_format=None, publish=False):
+    """
+    디렉토리 원본 파일로 분석/리포트 일괄 생성
+
+    Args:
+        data_dir: 원본 파일 디렉토리 (업로드 권장 파일명 기준, .xlsx / .csv)
+        output_dir: 결과 저장 디렉토리
+        companies: 멤버사 목록 (None 이면 전체 멤버사, 빈 목록이면 멤버사별 생략)
+        formats: 출력 형식 ('pdf', 'xlsx', 'json')
+        workers: PDF 워커 프로세스 수 (None 이면 config.yaml 의 report.pdf_build_workers)
+        period: 리포트 기간 라벨 (None 이면 get_report_period())
+        include_overall: 그룹 전체 결과 포함 여부
+        include_insights: 캐시된 인사이트 포함 여부 (API 호출 없음)
+        chart_format: 차트 삽입 형식 (None 이면 config.yaml 의 report.chart_format)
+        publish: 전체 멤버사 분석 요약을 분석 API 공유 저장소에 게시 (companies 와 무관하게 전체)
+
+    Returns:
+        실행 결과 매니페스트 딕셔너리 (데이터 파일이 없으면 None)
+    """
+    started = time.time()
+    loaded = load_data_directory(data_dir)
+    if not loaded:
+        log(f"데이터 파일이 없습니다: {data_dir}")
+        return None
+
+    data_version = get_dataset_version()
+    period = period or get_report_period()
+    targets, missing = resolve_companies(companies)
+    if missing:
+        log(f"데이터에 없는 멤버사 제외: {', '.join(missing)}")
+    os.makedirs(output_dir, exist_ok=True)
+    log(f"데이터 로드 완료 ({len(loaded)}개 파일, 버전 {data_version}, 멤버사 {len(targets)}개) → {output_dir}")
+
+    manifest = {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'data_dir': os.path.abspath(data_dir),
+        'data_version': data_version,
+        'period': period,
+        'formats': list(formats),
+        'companies': targets,
+        'missing_companies': missing,
+        'files': [],
+        'errors': {}
+    }
+    analysis_targets = ([None] if include_overall else []) + targets
+
+    for fmt in formats:
+        fmt_started = time.time()
+        if fmt == 'pdf':
+            files, errors = write_pdf_reports(
+                output_dir, targets, period, include_overall, include_insights, chart_format, workers
+            )
+        elif fmt == 'xlsx':
+            files, errors = write_excel_reports(output_dir, analysis_targets, data_version)
+        else:
+            files, errors = write_analytics_json(output_dir, analysis_targets, data_version, period)
+        manifest['files'].extend(files)
+        manifest['errors'].update(errors)
+        log(f"{fmt}: {len(files)}개 생성, 실패 {len(errors)}개 ({time.time() - fmt_started:.1f}초)")
+
+    if publish:
+        try:
+            summaries = build_analytics_summaries(data_version)
+            if not publish_analytics(data_version, summaries, 'cli'):
+                raise RuntimeError("분석 요약을 저장하지 못했습니다.")
+            manifest['published'] = len(summaries)
+            log(f"분석 API 게시: 분석 요약 {len(summaries)}개")
+        except Exception as e:
+            manifest['errors']['publish'] = str(e)
+
+    manifest['elapsed_sec'] = round(time.time() - started, 1)
+    with open(os.path.join(output_dir, 'manifest.json'), 'w', encoding='utf-8') as file:
+        json.dump(manifest, file, ensure_ascii=False, indent=2)
+    log(f"완료: 파일 {len(manifest['files'])}개, 실패 {len(manifest['errors'])}개 ({manifest['elapsed_sec']}초)")
+    return manifest
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="mySUNI 학습 리포트 일괄 생성 (Streamlit 없이 실행)")
+    parser.add_argument('data_dir', help="원본 파일 디렉토리 (업로드 권장 파일명 기준)")
+    parser.add_argument('--output-dir', help="결과 저장 디렉토리 (기본값: reports/cli_YYYYmmdd_HHMMSS)")
+    parser.add_argument('--companies', nargs='+', metavar='멤버사', help="대상 멤버사 (기본값: 전체 멤버사)")
+    parser.add_argument('--no-companies', action='store_true', help="멤버사별 결과 생략 (그룹 전체만)")
+    parser.add_argument('--no-overall', action='store_true', help="그룹 전체 결과 생략 (멤버사별만)")
+    parser.add_argument('--formats', type=parse_formats, default=['pdf'],
+                        help=f"출력 형식, 쉼표 구분 ({', '.join(OUTPUT_FORMATS)}, 기본값: pdf)")
+    parser.add_argument('--workers', type=int, help="PDF 워커 프로세스 수 (기본값: config.yaml report.pdf_build_workers)")
+    parser.add_argument('--period', help="리포트 기간 라벨 (기본값: 직전 월이 속한 반기)")
+    parser.add_argument('--chart-format', choices=CHART_FORMATS, help="PDF 차트 삽입 형식")
+    parser.add_argument('--include-insights', action='store_true', help="캐시된 AI/규칙 기반 인사이트 포함")
+    parser.add_argument('--publish', action='store_true', help="분석 API(analytics_api.py) 공유 저장소에 분석 요약 게시")
+    args = parser.parse_args(argv)
+
+    if args.companies and args.no_companies:
+        parser.error("--companies 와 --no-companies 는 함께 사용할 수 없습니다.")
+    if args.no_overall and args.no_companies:
+        parser.error("--no-overall 과 --no-companies 를 함께 사용하면 생성할 결과가 없습니다.")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers 는 1 이상이어야 합니다.")
+
+    output_dir = args.output_dir or os.path.join('reports', datetime.now().strftime('cli_%Y%m%d_%H%M%S'))
+    manifest = run_batch(
+        args.data_dir,
+        output_dir,
+        companies=[] if args.no_companies else args.companies,
+        formats=args.formats,
+        workers=args.workers,
+        period=args.period,
+        include_overall=not args.no_overall,
+        include_insights=args.include_insights,
+        chart_format=args.chart_format,
+        publish=args.publish
+    )
+    if manifest is None or manifest['errors']:
+        return 1
+    if args.companies and not manifest['companies']:
+        log("대상 멤버사가 데이터에 없습니다.")
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    # Windows 인코딩 문제 해결
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(encoding='utf-8')
+    sys.exit(main())
@@ -0,0 +1,234 @@
+"""
+리포트 정기 생성 스케줄러
+데이터 디렉토리의 원본 파일로 표준 리포트 세트(전체 + 멤버사별 PDF)를 생성하고
+대시보드 분석 결과(구간 이동, 코호트, 차트 이미지)를 디스크 캐시에 미리 계산
+
+실행:
+    python report_scheduler.py           # 상주 실행 (매월 정기 생성 + 새 데이터 감지 시 생성)
+    python report_scheduler.py --once    # 즉시 1회 생성 후 종료
+"""
+
+import sys
+import os
+import json
+import time
+import argparse
+import yaml
+from datetime import datetime
+
+from modules.file_uploader import find_data_files, load_data_directory
+from modules.data_loader import get_dataset_version, get_individual_full_raw_data, get_company_list
+from modules.transition_analyzer import get_tier_transitions
+from modules.cohort_analyzer import get_cohort_tables
+from modules.pdf_generator import collect_report_data, create_pdf_report, create_company_reports
+
+STATE_FILENAME = '.scheduler_state.json'
+
+def load_scheduler_config():
+    """스케줄러 설정 로드 (config.yaml 의 scheduler 섹션)"""
+    defaults = {
+        'data_dir': 'data_drops',
+        'output_dir': 'reports',
+        'monthly_day': 1,
+        'run_time': '06:00',
+        'poll_minutes': 30,
+        'per_company': True,
+        'include_insights': False,
+        'chart_format': None
+    }
+    config_path = 'config.yaml'
+    if os.path.exists(config_path):
+        with open(config_path, 'r', encoding='utf-8') as file:
+            config = yaml.safe_load(file) or {}
+            defaults.update(config.get('scheduler', {}) or {})
+    return defaults
+
+def log(message):
+    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {message}", flush=True)
+
+def get_report_period(now=None):
+    """리포트 기간 라벨 (실행 시점 직전 월이 속한 반기, 예: 7월 실행 → 'YYYY년 상반기')"""
+    now = now or datetime.now()
+    year, month = (now.year, now.month - 1) if now.month > 1 else (now.year - 1, 12)
+    return f"{year}년 {'상반기' if month <= 6 else '하반기'}"
+
+def get_data_snapshot(data_dir):
+    """데이터 디렉토리 원본 파일 상태 (파일명 → [크기, 수정시각]) - 새 데이터 감지용"""
+    snapshot = {}
+    for file_path in find_data_files(data_dir).values():
+        stat = os.stat(file_path)
+        snapshot[os.path.basename(file_path)] = [stat.st_size, int(stat.st_mtime)]
+    return snapshot
+
+def load_state(output_dir):
+    state_path = os.path.join(output_dir, STATE_FILENAME)
+    if os.path.exists(state_path):
+        try:
+            with open(state_path, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except Exception:
+            pass
+    return {}
+
+def save_state(output_dir, state):
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, STATE_FILENAME), 'w', encoding='utf-8') as file:
+        json.dump(state, file, ensure_ascii=False, indent=2)
+
+def precompute_dashboard_artifacts():
+    """대시보드 분석 결과 디스크 캐시 사전 계산 (데이터셋 버전 키 - 같은 파일을 업로드하면 즉시 재사용)"""
+    data_version = get_dataset_version()
+    individual_full_df = get_individual_full_raw_data()
+    artifacts = []
+    if individual_full_df is not None:
+        if get_tier_transitions(individual_full_df, data_version) is not None:
+            artifacts.append('transitions')
+        if get_cohort_tables(individual_full_df, data_version) is not None:
+            artifacts.append('cohort')
+    return artifacts
+
+def create_overall_report(period, include_insights=False, chart_format=None):
+    """현재 세션 데이터의 그룹 전체 PDF 리포트 bytes"""
+    report_data = collect_report_data()
+    report_data['period'] = period
+    if chart_format:
+        report_data['chart_format'] = chart_format
+    if not include_insights:
+        report_data['insights'] = {}
+    return create_pdf_report(report_data)
+
+def generate_standard_reports(data_dir, output_dir, period=None, per_company=True,
+                              include_insights=False, chart_format=None):
+    """
+    표준 리포트 세트 생성
+
+    Args:
+        data_dir: 원본 파일 디렉토리 (업로드 권장 파일명 기준)
+        output_dir: 결과 저장 디렉토리 (하위에 실행 연월 폴더 생성)
+        period: 리포트 기간 라벨 (None 이면 get_report_period())
+        per_company: 멤버사별 리포트 생성 여부
+        include_insights: 세션/캐시 인사이트 포함 여부
+        chart_format: 차트 삽입 형식 (None 이면 config.yaml 의 report.chart_format)
+
+    Returns:
+        실행 결과 매니페스트 딕셔너리 (데이터 파일이 없으면 None)
+    """
+    started = time.time()
+    loaded = load_data_directory(data_dir)
+    if not loaded:
+        log(f"데이터 파일이 없습니다: {data_dir}")
+        return None
+
+    period = period or get_report_period()
+    run_dir = os.path.join(output_dir, datetime.now().strftime('%Y%m'))
+    os.makedirs(run_dir, exist_ok=True)
+    log(f"데이터 로드 완료 ({len(loaded)}개 파일, 버전 {get_dataset_version()}) → {run_dir}")
+
+    manifest = {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'data_dir': os.path.abspath(data_dir),
+        'data_version': get_dataset_version(),
+        'period': period,
+        'files': [],
+        'artifacts': precompute_dashboard_artifacts()
+    }
+
+    # 전체 리포트
+    filename = f"Learning_Report_전체_{period}.pdf"
+    with open(os.path.join(run_dir, filename), 'wb') as file:
+        file.write(create_overall_report(period, include_insights, chart_format))
+    manifest['files'].append(filename)
+
+    # 멤버사별 리포트
+    companies = get_company_list() if per_company else []
+    if companies:
+        pdf_bytes = create_company_reports(
+            companies, period=period, include_insights=include_insights, chart_format=chart_format
+        )
+        for company, content in pdf_bytes.items():
+            filename = f"Learning_Report_{company}_{period}.pdf"
+            with open(os.path.join(run_dir, filename), 'wb') as file:
+                file.write(content)
+            manifest['files'].append(filename)
+
+    manifest['elapsed_sec'] = round(time.time() - started, 1)
+    with open(os.path.join(run_dir, 'manifest.json'), 'w', encoding='utf-8') as file:
+        json.dump(manifest, file, ensure_ascii=False, indent=2)
+    log(f"리포트 {len(manifest['files'])}개 생성 완료 ({manifest['elapsed_sec']}초)")
+    return manifest
+
+def run_if_needed(config, force=False):
+    """새 데이터가 감지되었거나 force 인 경우 리포트 생성 (상태 파일에 마지막 실행 스냅샷 기록)"""
+    snapshot = get_data_snapshot(config['data_dir'])
+    state = load_state(config['output_dir'])
+    if not snapshot:
+        return None
+    if not force and snapshot == state.get('snapshot'):
+        return None
+
+    try:
+        manifest = generate_standard_reports(
+            config['data_dir'],
+            config['output_dir'],
+            per_company=config['per_company'],
+            include_insights=config['include_insights'],
+            chart_format=config['chart_format']
+        )
+    except Exception as e:
+        log(f"리포트 생성 실패: {str(e)}")
+        return None
+
+    if manifest is not None:
+        save_state(config['output_dir'], {
+            'snapshot': snapshot,
+            'last_run': manifest['generated_at'],
+            'data_version': manifest['data_version']
+        })
+    return manifest
+
+def run_scheduler(config):
+    """상주 실행: 매월 monthly_day 일 run_time 에 정기 생성, poll_minutes 마다 새 데이터 감지"""
+    import schedule
+
+    def monthly_job():
+        if datetime.now().day == int(config['monthly_day']):
+            log("월간 정기 생성 시작")
+            run_if_needed(config, force=True)
+
+    def poll_job():
+        if run_if_needed(config) is not None:
+            log("새 데이터 감지 → 리포트 갱신")
+
+    schedule.every().day.at(config['run_time']).do(monthly_job)
+    schedule.every(int(config['poll_minutes'])).minutes.do(poll_job)
+    log(f"스케줄러 시작 (데이터: {config['data_dir']}, 결과: {config['output_dir']})")
+
+    poll_job()
+    while True:
+        schedule.run_pending()
+        time.sleep(30)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="mySUNI 학습 리포트 정기 생성 스케줄러")
+    parser.add_argument('--once', action='store_true', help="즉시 1회 생성 후 종료")
+    parser.add_argument('--data-dir', help="원본 파일 디렉토리 (기본값: config.yaml scheduler.data_dir)")
+    parser.add_argument('--output-dir', help="결과 저장 디렉토리 (기본값: config.yaml scheduler.output_dir)")
+    args = parser.parse_args(argv)
+
+    config = load_scheduler_config()
+    if args.data_dir:
+        config['data_dir'] = args.data_dir
+    if args.output_dir:
+        config['output_dir'] = args.output_dir
+
+    if args.once:
+        manifest = run_if_needed(config, force=True)
+        return 0 if manifest is not None else 1
+    run_scheduler(config)
+    return 0
+
+if __name__ == '__main__':
+    # Windows 인코딩 문제 해결
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(encoding='utf-8')
+    sys.exit(main())
@@ -0,0 +1,159 @@
+"""
+앱 시작 임포트 비용 리포트
+app.py 가 로그인 화면을 그리기 전에 임포트하는 모듈별 비용을 새 프로세스의 python -X importtime 으로 측정
+
+- app.py 최상위 임포트 순서대로 측정 (공통 의존성은 먼저 임포트한 모듈의 비용에 포함)
+- 패키지별 자체 임포트 시간 상위 목록
+- 시작 시 로드되면 안 되는 패키지(reportlab, kaleido, google.genai 등 - PDF 생성/AI 호출 시 로드) 확인
+- 예산 초과 또는 지연 로드 대상 패키지가 시작 시 로드되면 종료 코드 1 (배포 전 점검용)
+
+실행:
+    python startup_profile.py
+    python startup_profile.py --top 20 --budget-ms 2500
+    python startup_profile.py --output startup_profile.json
+"""
+
+import sys
+import os
+import re
+import ast
+import json
+import argparse
+import subprocess
+import yaml
+
+IMPORTTIME_PATTERN = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+def load_startup_config():
+    """시작 시간 점검 설정 로드 (config.yaml 의 startup 섹션)"""
+    defaults = {
+        'import_budget_ms': 3000,
+        'lazy_modules': ['reportlab', 'kaleido', 'google.genai', 'matplotlib', 'seaborn', 'xlsxwriter', 'svglib']
+    }
+    config_path = 'config.yaml'
+    if os.path.exists(config_path):
+        with open(config_path, 'r', encoding='utf-8') as file:
+            config = yaml.safe_load(file) or {}
+            defaults.update(config.get('startup', {}) or {})
+    return defaults
+
+def get_startup_imports(app_path='app.py'):
+    """app.py 최상위(함수 밖) 임포트 모듈 목록 (실행 순서, 중복 제외)"""
+    with open(app_path, 'r', encoding='utf-8') as file:
+        tree = ast.parse(file.read(), filename=app_path)
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names = [node.module]
+        else:
+            continue
+        modules.extend(name for name in names if name not in modules)
+    return modules
+
+def measure_imports(modules, cwd=None):
+    """
+    새 프로세스에서 순서대로 임포트하며 -X importtime 출력 수집
+
+    Returns:
+        [(자체 시간 ms, 누적 시간 ms, 깊이, 모듈명)] - importtime 출력 순서
+    """
+    code = "\n".join(f"import {module}" for module in modules)
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=cwd, capture_output=True, text=True, encoding='utf-8', errors='replace'
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else "임포트 실패")
+    entries = []
+    for line in completed.stderr.splitlines():
+        match = IMPORTTIME_PATTERN.match(line)
+        if match:
+            entries.append((
+                int(match.group(1)) / 1000, int(match.group(2)) / 1000,
+                len(match.group(3)) // 2, match.group(4)
+            ))
+    return entries
+
+def summarize_startup(entries, modules, lazy_modules, top=15):
+    """
+    importtime 결과 요약
+
+    Returns:
+        {'total_ms', 'modules': [{'module', 'cumulative_ms'}], 'packages': [{'package', 'self_ms'}],
+         'lazy_loaded': [지연 로드 대상인데 시작 시 로드된 모듈]}
+    """
+    first_level = {}
+    for _, cumulative, depth, name in entries:
+        if depth == 0 and name not in first_level:
+            first_level[name] = cumulative
+
+    packages = {}
+    for self_ms, _, _, name in entries:
+        package = name.split('.')[0]
+        packages[package] = packages.get(package, 0.0) + self_ms
+
+    loaded = {name for _, _, _, name in entries}
+    lazy_loaded = sorted(
+        name for name in loaded
+        if any(name == lazy or name.startswith(f"{lazy}.") for lazy in lazy_modules)
+    )
+    lazy_roots = sorted({lazy for lazy in lazy_modules if any(name == lazy or name.startswith(f"{lazy}.") for name in lazy_loaded)})
+
+    return {
+        'total_ms': round(sum(first_level.values()), 1),
+        'modules': [
+            {'module': module, 'cumulative_ms': round(first_level.get(module, 0.0), 1)}
+            for module in modules
+        ],
+        'packages': [
+            {'package': package, 'self_ms': round(self_ms, 1)}
+            for package, self_ms in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+        ],
+        'lazy_loaded': lazy_roots
+    }
+
+def print_report(summary, budget_ms):
+    print("== app.py 시작 임포트 (실행 순서, 앞에서 로드된 의존성 제외) ==")
+    for row in summary['modules']:
+        cost = f"{row['cumulative_ms']:9.1f} ms" if row['cumulative_ms'] else "   (로드됨)"
+        print(f"{cost}  {row['module']}")
+    print(f"{summary['total_ms']:9.1f} ms  합계 (예산 {budget_ms:,.0f} ms)")
+    print()
+    print("== 패키지별 자체 임포트 시간 상위 ==")
+    for row in summary['packages']:
+        print(f"{row['self_ms']:9.1f} ms  {row['package']}")
+    print()
+    if summary['lazy_loaded']:
+        print(f"⚠️ 시작 시 로드된 지연 로드 대상: {', '.join(summary['lazy_loaded'])}")
+    else:
+        print("✓ 지연 로드 대상 패키지는 시작 시 로드되지 않음")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="앱 시작(로그인 화면) 임포트 비용 리포트")
+    parser.add_argument('--app', default='app.py', help="측정할 Streamlit 앱 파일")
+    parser.add_argument('--top', type=int, default=15, help="패키지 상위 표시 수")
+    parser.add_argument('--budget-ms', type=float, help="시작 임포트 합계 예산 (기본값: config.yaml startup.import_budget_ms)")
+    parser.add_argument('--output', help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    config = load_startup_config()
+    budget_ms = args.budget_ms if args.budget_ms is not None else float(config['import_budget_ms'])
+    modules = get_startup_imports(args.app)
+    entries = measure_imports(modules, cwd=os.path.dirname(os.path.abspath(args.app)))
+    summary = summarize_startup(entries, modules, config['lazy_modules'], top=args.top)
+    summary['budget_ms'] = budget_ms
+    print_report(summary, budget_ms)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(summary, file, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.output}")
+    return 1 if summary['total_ms'] > budget_ms or summary['lazy_loaded'] else 0
+
+if __name__ == '__main__':
+    # Windows 인코딩 문제 해결
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(encoding='utf-8')
+    sys.exit(main())